@@ -1,9 +1,10 @@
 """This module defines the Bot class and a factory function to create bots."""
 # from .ai_base import AIEngine # Import AIEngine from its new location
 # from dataclasses import dataclass, field
+import sys
 from typing import Dict, Any, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from .thirdpartyapikey_manager import ThirdPartyApiKeyQueryData
 
@@ -17,6 +18,17 @@ class BotData(BaseModel):
     aiengine_arg_dict: Dict[str, str] = Field(default_factory=dict)
     thirdpartyapikey_query_list: List['ThirdPartyApiKeyQueryData'] = Field(default_factory=list)
 
+    @field_validator("aiengine_id")
+    @classmethod
+    def _intern_aiengine_id(cls, aiengine_id: str) -> str:
+        """Interns the AI engine ID.
+
+        The engine registry interns its IDs too, so looking a bot's engine
+        up in `ThirdPartyGroup` matches keys by identity, including for bots
+        loaded from JSON.
+        """
+        return sys.intern(aiengine_id)
+
     # def to_dict(self) -> Dict[str, Any]:
     #     """Serializes the Bot instance to a dictionary for JSON storage.
 
@@ -65,6 +77,6 @@ class BotData(BaseModel):
         Returns:
             The value of the argument if it exists, otherwise returns the default value.
         """
-        if self.aiengine_arg_dict and arg_id in self.aiengine_arg_dict:
-            return self.aiengine_arg_dict[arg_id]
-        return default
+        if not self.aiengine_arg_dict:
+            return default
+        return self.aiengine_arg_dict.get(arg_id, default)
@@ -1,5 +1,6 @@
 """Dialog for adding a new AI bot to a chatroom."""
 import logging
+from collections.abc import Iterable
 
 from PyQt6.QtWidgets import (
     QApplication, QVBoxLayout, QLabel, QMessageBox,
@@ -12,6 +13,44 @@ from . import third_party
 from .third_party import AIEngineArgType # Added import
 from . import thirdpartyapikey_manager
 
+def _create_single_line_widget(arg_info: third_party.AIEngineArgInfo) -> QLineEdit:
+    """Creates the input widget for a `SINGLE_LINE` engine argument."""
+    widget = QLineEdit()
+    if arg_info.default_value:
+        widget.setText(arg_info.default_value)
+    return widget
+
+def _create_multi_line_widget(arg_info: third_party.AIEngineArgInfo) -> QTextEdit:
+    """Creates the input widget for a `MULTI_LINE` engine argument."""
+    widget = QTextEdit()
+    if arg_info.default_value:
+        widget.setPlainText(arg_info.default_value)
+    widget.setMinimumHeight(60) # Smaller height for generic multi-line
+    return widget
+
+def _create_selection_widget(arg_info: third_party.AIEngineArgInfo) -> QComboBox:
+    """Creates the input widget for a `SELECTION` engine argument."""
+    widget = QComboBox()
+    if arg_info.value_option_list:
+        widget.addItems([str(item) for item in arg_info.value_option_list])
+    if arg_info.default_value:
+        widget.setCurrentText(str(arg_info.default_value))
+    return widget
+
+def _create_suggestion_widget(arg_info: third_party.AIEngineArgInfo) -> QComboBox:
+    """Creates the input widget for a `SUGGESTION` engine argument."""
+    widget = _create_selection_widget(arg_info)
+    widget.setEditable(True)  # Allow user to type in suggestions
+    return widget
+
+_ARG_WIDGET_FACTORIES = {
+    AIEngineArgType.SINGLE_LINE: _create_single_line_widget,
+    AIEngineArgType.MULTI_LINE: _create_multi_line_widget,
+    AIEngineArgType.SELECTION: _create_selection_widget,
+    AIEngineArgType.SUGGESTION: _create_suggestion_widget,
+}
+"""Input widget factory for each `AIEngineArgType`, used by `BotInfoDialog._update_input_fields()`."""
+
 class BotInfoDialog(QDialog):
     """A dialog for adding a new bot to a chatroom.
 
@@ -20,24 +59,36 @@ class BotInfoDialog(QDialog):
     It also validates the bot name for emptiness and uniqueness.
     """
     def __init__(self,
-                 existing_bot_names: list[str],
+                 existing_bot_names: Iterable[str],
                  aiengine_info_list: list[third_party.AIEngineInfo],
                  thirdpartyapikey_query_list: list[thirdpartyapikey_manager.ThirdPartyApiKeyQueryData],
                  old_bot: BotData | None = None,
-                 parent=None):
+                 parent=None,
+                 aiengine_id_to_aiengine_info_dict: dict[str, third_party.AIEngineInfo] | None = None):
         """Initializes the BotInfoDialog.
 
         Args:
-            existing_bot_names: A list of names of bots that already exist
+            existing_bot_names: The names of bots that already exist
                                 in the current context, used for validation.
+                                Stored as a frozenset for O(1) lookups.
             parent: The parent widget, if any.
+            aiengine_id_to_aiengine_info_dict: The engines of
+                `aiengine_info_list` keyed by ID, such as
+                `ThirdPartyGroup.aiengine_id_to_aiengine_info_dict`. Built
+                from `aiengine_info_list` if not given.
         """
         super().__init__(parent)
 
         self._logger = logging.getLogger(__name__)
 
-        self.existing_bot_names = existing_bot_names
+        self.existing_bot_names = frozenset(existing_bot_names)
         self.aiengine_info_list = aiengine_info_list
+        if aiengine_id_to_aiengine_info_dict is None:
+            aiengine_id_to_aiengine_info_dict = {
+                aiengine_info.aiengine_id: aiengine_info for aiengine_info in aiengine_info_list
+            }
+        self._aiengine_id_to_aiengine_info_dict = aiengine_id_to_aiengine_info_dict
+        assert len(self._aiengine_id_to_aiengine_info_dict) == len(aiengine_info_list), "AI Engine ID should be unique"
         self.thirdpartyapikey_query_list = thirdpartyapikey_query_list
         self._dynamic_widgets = []
         self._dynamic_input_widgets = {}
@@ -79,6 +130,8 @@ class BotInfoDialog(QDialog):
         self.button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
+        # Enter in a single-line field submits, so optional fields can simply be left empty
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setDefault(True)
         self.button_box.accepted.connect(self.accept) # Connect to custom accept method
         self.button_box.rejected.connect(self.reject)
         main_layout.addWidget(self.button_box)
@@ -137,34 +190,12 @@ class BotInfoDialog(QDialog):
         for arg_info in current_ai_engine_info.arg_list:
 
             label = QLabel(self.tr(arg_info.name) + (" (Optional):" if not arg_info.required else ":"))
-            widget = None
-
-            if arg_info.arg_type == AIEngineArgType.SINGLE_LINE:
-                widget = QLineEdit()
-                if arg_info.default_value:
-                    widget.setText(arg_info.default_value)
-            elif arg_info.arg_type == AIEngineArgType.MULTI_LINE:
-                widget = QTextEdit()
-                if arg_info.default_value:
-                    widget.setPlainText(arg_info.default_value)
-                widget.setMinimumHeight(60) # Smaller height for generic multi-line
-            elif arg_info.arg_type == AIEngineArgType.SELECTION:
-                widget = QComboBox()
-                if arg_info.value_option_list:
-                    for item in arg_info.value_option_list: # Ensure items are strings for addItem
-                        widget.addItem(str(item))
-                if arg_info.default_value:
-                    widget.setCurrentText(str(arg_info.default_value))
-            elif arg_info.arg_type == AIEngineArgType.SUGGESTION:
-                widget = QComboBox()
-                if arg_info.value_option_list:
-                    for item in arg_info.value_option_list: # Ensure items are strings for addItem
-                        widget.addItem(str(item))
-                if arg_info.default_value:
-                    widget.setCurrentText(str(arg_info.default_value))
-                widget.setEditable(True)  # Allow user to type in suggestions
-            else:
-                assert False, f"Unsupported AIEngineArgType: {arg_info.arg_type}"
+            widget_factory = _ARG_WIDGET_FACTORIES.get(arg_info.arg_type)
+            assert widget_factory is not None, f"Unsupported AIEngineArgType: {arg_info.arg_type}"
+            widget = widget_factory(arg_info)
+
+            if not arg_info.required and isinstance(widget, (QLineEdit, QTextEdit)):
+                widget.setPlaceholderText(self.tr("Optional, may be left empty"))
 
             if widget:
                 self.form_layout.addRow(label, widget)
@@ -184,14 +215,7 @@ class BotInfoDialog(QDialog):
         if not aiengine_id:
             return None
 
-        aiengine_info = self.aiengine_info_list
-        aiengine_info = filter(lambda x: x.aiengine_id == aiengine_id, aiengine_info)
-        aiengine_info = list(aiengine_info)
-        assert len(aiengine_info) <= 1, "AI Engine ID should be unique"
-        if not aiengine_info:
-            return None
-        aiengine_info = aiengine_info[0]
-        return aiengine_info
+        return self._aiengine_id_to_aiengine_info_dict.get(aiengine_id)
 
     def accept(self):
         """
@@ -263,8 +287,7 @@ class BotInfoDialog(QDialog):
         if not aiengine_info:
             return []
 
-        thirdpartyapikey_slot_id_set = aiengine_info.thirdpartyapikey_slot_id_list
-        thirdpartyapikey_slot_id_set = set(thirdpartyapikey_slot_id_set)
+        thirdpartyapikey_slot_id_set = aiengine_info.thirdpartyapikey_slot_id_set
 
         thirdpartyapikey_query_list = self.thirdpartyapikey_query_list
         thirdpartyapikey_query_list = filter(lambda x: x.thirdpartyapikey_slot_id in thirdpartyapikey_slot_id_set, thirdpartyapikey_query_list)
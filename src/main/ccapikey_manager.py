@@ -128,7 +128,7 @@ class CcApiKeyManager:
                        cannot be loaded or if no key names are found.
         """
         if not os.path.exists(self.keys_file_path):
-            self.logger.debug(f"CcAPIKeys file not found: {self.keys_file_path}. Returning empty list.")
+            self.logger.debug("CcAPIKeys file not found: %s. Returning empty list.", self.keys_file_path)
             return []
         try:
             with open(self.keys_file_path, 'r', encoding='utf-8') as f:
@@ -152,7 +152,7 @@ class CcApiKeyManager:
         try:
             with open(self.keys_file_path, 'w', encoding='utf-8') as f:
                 json.dump({"key_names": self._key_names}, f, indent=4)
-            self.logger.debug(f"CcAPIKey names saved to {self.keys_file_path}.")
+            self.logger.debug("CcAPIKey names saved to %s.", self.keys_file_path)
         except IOError as e:
             self.logger.error(f"Error saving CcAPIKey names to {self.keys_file_path}: {e}", exc_info=True)
 
@@ -341,7 +341,7 @@ class CcApiKeyManager:
         for key_name in all_key_names_copy:
             try:
                 keyring.delete_password(self._get_keyring_service_name(key_name), key_name)
-                self.logger.debug(f"Deleted CcAPIKey '{key_name}' from keyring during clear operation.")
+                self.logger.debug("Deleted CcAPIKey '%s' from keyring during clear operation.", key_name)
             except keyring.errors.PasswordDeleteError:
                 self.logger.warning(f"CcAPIKey '{key_name}' not found in keyring during clear, but will be removed from local list.")
             except keyring.errors.NoKeyringError:
@@ -14,6 +14,8 @@ import json
 import re
 import time
 import glob
+import bisect
+import contextlib
 from typing import Optional # For type hints
 import copy
 # from dataclasses import dataclass, asdict
@@ -83,18 +85,71 @@ class Chatroom:
         # self.filepath: Optional[str] = None             # Will be set by ChatroomManager
 
         self._data = data
+        # Messages are kept ordered by timestamp so readers never need to sort them.
+        # Saved chatrooms are already in order, which makes this a linear check.
+        self._data.messages.sort(key=lambda m: m.timestamp)
         self.manager: Optional[ChatroomManager] = manager
         self.filepath: Optional[str] = filepath
         self._event_hub = event_hub
-        self.logger.debug(f"Chatroom '{self.name}' initialized with {len(self._data.bots)} bot(s) and {len(self._data.messages)} message(s).")
+        self._bot_names_cache: tuple[str, ...] | None = None
+        self._batch_depth: int = 0
+        self._batch_dirty: bool = False
+        self._update_count: int = 0
+        self.logger.debug("Chatroom '%s' initialized with %s bot(s) and %s message(s).", self.name, len(self._data.bots), len(self._data.messages))
 
     @property
     def name(self) -> str:
         """The name of the chatroom."""
         return self._data.name
 
+    @property
+    def update_count(self) -> int:
+        """The number of changes made to the chatroom's bots and messages.
+
+        It increases with every change, including each change inside
+        `batch_update()`, so a reader can tell whether anything changed since
+        it last looked.
+        """
+        return self._update_count
+
     # No direct set_name; managed by ChatroomManager.rename_chatroom
 
+    def _notify_updated(self):
+        """Notifies the manager (if any) that the chatroom has been updated.
+
+        Inside `batch_update()`, the notification is deferred until the
+        outermost batch ends.
+        """
+        self._update_count += 1
+        if self._batch_depth > 0:
+            self._batch_dirty = True
+            return
+        if self.manager:
+            self.manager.notify_chatroom_updated(self)
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        """Groups several changes into a single update notification.
+
+        Changes made inside the `with` block, such as deleting many messages
+        or bots, notify the manager (and so save the chatroom) only once,
+        when the outermost block exits, and only if something changed.
+        Batches may be nested.
+
+        Yields:
+            This chatroom.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                # The changes were already counted by _notify_updated()
+                if self.manager:
+                    self.manager.notify_chatroom_updated(self)
+
 
     def add_bot(self, bot: BotData) -> bool:
         """Adds a bot to the chatroom.
@@ -110,9 +165,9 @@ class Chatroom:
         """
         bot_name = bot.name
         self._data.bots[bot_name] = bot
+        self._bot_names_cache = None
         self.logger.info(f"Bot '{bot_name}' added to chatroom '{self.name}'.") # INFO
-        if self.manager:
-            self.manager.notify_chatroom_updated(self)
+        self._notify_updated()
         return True
 
     def remove_bot(self, bot_name: str) -> bool:
@@ -128,9 +183,9 @@ class Chatroom:
         """
         if bot_name in self._data.bots:
             del self._data.bots[bot_name]
+            self._bot_names_cache = None
             self.logger.info(f"Bot '{bot_name}' removed from chatroom '{self.name}'.") # INFO
-            if self.manager:
-                self.manager.notify_chatroom_updated(self)
+            self._notify_updated()
             return True
         else:
             self.logger.warning(f"Attempted to remove non-existent bot '{bot_name}' from chatroom '{self.name}'.") # WARNING
@@ -147,9 +202,9 @@ class Chatroom:
         """
         bot = self._data.bots.get(bot_name)
         if bot:
-            self.logger.debug(f"Bot '{bot_name}' retrieved from chatroom '{self.name}'.") # DEBUG
+            self.logger.debug("Bot '%s' retrieved from chatroom '%s'.", bot_name, self.name) # DEBUG
         else:
-            self.logger.debug(f"Bot '{bot_name}' not found in chatroom '{self.name}'.") # DEBUG
+            self.logger.debug("Bot '%s' not found in chatroom '%s'.", bot_name, self.name) # DEBUG
         return bot
 
     def list_bots(self) -> list[BotData]:
@@ -158,9 +213,21 @@ class Chatroom:
         Returns:
             A list of `Bot` instances.
         """
-        self.logger.debug(f"Listing {len(self._data.bots)} bot(s) for chatroom '{self.name}'.") # DEBUG
+        self.logger.debug("Listing %s bot(s) for chatroom '%s'.", len(self._data.bots), self.name) # DEBUG
         return list(self._data.bots.values())
 
+    def bot_names(self) -> tuple[str, ...]:
+        """Lists the names of all bots currently in the chatroom.
+
+        The tuple is built once and reused until a bot is added or removed.
+
+        Returns:
+            The bot names, in the same order as `list_bots()`.
+        """
+        if self._bot_names_cache is None:
+            self._bot_names_cache = tuple(self._data.bots)
+        return self._bot_names_cache
+
     async def add_message_async(self, sender: str, content: str) -> MessageData:
         """Adds a new message to the chatroom's history.
 
@@ -174,23 +241,26 @@ class Chatroom:
             The created `Message` object.
         """
         message = MessageData(sender=sender, content=content, timestamp=time.time())
-        self._data.messages.append(message)
+        # Almost always an append; insort also covers a clock that stepped backwards
+        bisect.insort(self._data.messages, message, key=lambda m: m.timestamp)
+        # Announced through the event hub rather than _notify_updated(), so count it here
+        self._update_count += 1
         self.logger.info(f"Message from '{sender}' (length: {len(content)}) added to chatroom '{self.name}'.") # INFO
         # if self.manager:
         #     self.manager.notify_chatroom_updated(self)
         if self._event_hub:
             await self._event_hub.publish_async("chatroom_add_message", self.name, message)
         else:
-            self.logger.debug(f"No event hub available to notify about new message in chatroom '{self.name}'.")
+            self.logger.debug("No event hub available to notify about new message in chatroom '%s'.", self.name)
         return message
 
     def get_messages(self) -> list[MessageData]:
         """Retrieves all messages from the chatroom's history.
 
         Returns:
-            A list of `Message` objects.
+            A list of `Message` objects, ordered by timestamp.
         """
-        self.logger.debug(f"Retrieving {len(self._data.messages)} message(s) for chatroom '{self.name}'.") # DEBUG
+        self.logger.debug("Retrieving %s message(s) for chatroom '%s'.", len(self._data.messages), self.name) # DEBUG
         return self._data.messages
 
     def get_formatted_history(self) -> list[str]:
@@ -199,7 +269,23 @@ class Chatroom:
         Returns:
             A list of strings, where each string is a display-formatted message.
         """
-        return [msg.to_display_string() for msg in self._data.messages]
+        return [msg.display_string for msg in self._data.messages]
+
+    def _find_timestamp_range(self, message_timestamp: float) -> tuple[int, int]:
+        """Returns the slice of `_data.messages` holding messages with the given timestamp.
+
+        Messages are kept ordered by timestamp, so this is a binary search.
+
+        Args:
+            message_timestamp: The timestamp to look up.
+
+        Returns:
+            A (start, end) pair; the range is empty if no message has this timestamp.
+        """
+        messages = self._data.messages
+        start = bisect.bisect_left(messages, message_timestamp, key=lambda m: m.timestamp)
+        end = bisect.bisect_right(messages, message_timestamp, lo=start, key=lambda m: m.timestamp)
+        return start, end
 
     def delete_message(self, message_timestamp: float) -> bool:
         """Deletes a message from the chatroom based on its timestamp.
@@ -212,17 +298,41 @@ class Chatroom:
         Returns:
             True if a message was deleted, False otherwise.
         """
-        original_length = len(self._data.messages)
-        self._data.messages = [msg for msg in self._data.messages if msg.timestamp != message_timestamp]
-        deleted = len(self._data.messages) < original_length
+        start, end = self._find_timestamp_range(message_timestamp)
+        deleted = start < end
         if deleted:
+            del self._data.messages[start:end]
             self.logger.info(f"Message with timestamp {message_timestamp} deleted from chatroom '{self.name}'.") # INFO
-            if self.manager:
-                self.manager.notify_chatroom_updated(self)
+            self._notify_updated()
         else:
             self.logger.warning(f"Failed to delete message with timestamp {message_timestamp} from chatroom '{self.name}': not found.") # WARNING
         return deleted
 
+    def delete_message_data(self, message: MessageData) -> bool:
+        """Deletes the given message from the chatroom.
+
+        Unlike `delete_message()`, only this message is removed, even if other
+        messages share its timestamp. The message is located by binary search
+        on its timestamp rather than by scanning the whole history.
+        Notifies the manager (if any) if the message was deleted.
+
+        Args:
+            message: The message to delete, e.g. as shown in the message view.
+                It may be a copy of the stored message.
+
+        Returns:
+            True if the message was deleted, False if it was not found.
+        """
+        start, end = self._find_timestamp_range(message.timestamp)
+        for index in range(start, end):
+            if self._data.messages[index] == message:
+                del self._data.messages[index]
+                self.logger.info(f"Message with timestamp {message.timestamp} deleted from chatroom '{self.name}'.") # INFO
+                self._notify_updated()
+                return True
+        self.logger.warning(f"Failed to delete message with timestamp {message.timestamp} from chatroom '{self.name}': not found.") # WARNING
+        return False
+
     def to_dict(self) -> dict:
         """Serializes the chatroom to a dictionary.
 
@@ -230,7 +340,7 @@ class Chatroom:
             A dictionary representation of the chatroom, including its name,
             bots, and messages.
         """
-        self.logger.debug(f"Serializing chatroom '{self.name}' to dictionary.") # DEBUG
+        self.logger.debug("Serializing chatroom '%s' to dictionary.", self.name) # DEBUG
         # return {
         #     "name": self.name, # Uses the property
         #     "bots": [bot.to_dict() for bot in self._data.bots.values()],
@@ -252,8 +362,13 @@ class Chatroom:
         os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
         try:
             with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(self._data.model_dump(mode="json"), f, ensure_ascii=False, indent=4)
-            self.logger.debug(f"Chatroom '{self.name}' saved successfully to '{self.filepath}'.") # DEBUG
+                # pydantic-core writes the JSON directly, without building the
+                # intermediate dict of every bot and message first. The text
+                # can differ from json.dump(..., ensure_ascii=False, indent=4),
+                # e.g. 1.5e-7 rather than 1.5e-07, but it is equivalent JSON
+                # that loads back to the same data.
+                f.write(self._data.model_dump_json(indent=4))
+            self.logger.debug("Chatroom '%s' saved successfully to '%s'.", self.name, self.filepath) # DEBUG
         except Exception as e:
             self.logger.error(f"Error saving chatroom '{self.name}' to '{self.filepath}': {e}", exc_info=True) # ERROR
 
@@ -331,7 +446,7 @@ class Chatroom:
         # logger.debug(f"Chatroom '{chatroom_name}' deserialized successfully.") # DEBUG
         # return chatroom
 
-        logger.debug(f"Deserializing chatroom from dictionary. File: {filepath}") # DEBUG
+        logger.debug("Deserializing chatroom from dictionary. File: %s", filepath) # DEBUG
         # chatroom_data = commons.to_obj(data, cls=ChatroomData) # Deserialize using jsons
         chatroom_data = ChatroomData.model_validate(data)
         chatroom = Chatroom(chatroom_data, manager, filepath, event_hub) # Initializes _name
@@ -350,7 +465,7 @@ class Chatroom:
             A new `Chatroom` instance with the specified name.
         """
         logger = logging.getLogger(__name__ + ".Chatroom")
-        logger.debug(f"Creating new chatroom with name '{name}'.")
+        logger.debug("Creating new chatroom with name '%s'.", name)
         chatroom_data = ChatroomData(name=name, bots={}, messages=[])
         chatroom = Chatroom(data=chatroom_data, manager=manager, filepath=filepath, event_hub=event_hub)
         return chatroom
@@ -410,7 +525,7 @@ class ChatroomManager:
         Args:
             chatroom: The `Chatroom` instance that has been updated.
         """
-        self.logger.debug(f"Chatroom '{chatroom.name}' updated, triggering save.") # DEBUG
+        self.logger.debug("Chatroom '%s' updated, triggering save.", chatroom.name) # DEBUG
         chatroom.save()
 
     def create_chatroom(self, name: str) -> Optional[Chatroom]:
@@ -466,6 +581,9 @@ class ChatroomManager:
     def get_chatroom(self, name: str) -> Optional[Chatroom]:
         """Retrieves a chatroom by its name.
 
+        This is a single dictionary lookup on the chatrooms loaded at startup
+        and never touches the disk, so callers need not cache the result.
+
         Args:
             name: The name of the chatroom to retrieve.
 
@@ -473,8 +591,8 @@ class ChatroomManager:
             The `Chatroom` instance if found, otherwise None.
         """
         chatroom = self.chatrooms.get(name)
-        if not chatroom:
-            self.logger.debug(f"Chatroom '{name}' not found.") # DEBUG
+        if chatroom is None:
+            self.logger.debug("Chatroom '%s' not found.", name) # DEBUG
         return chatroom
 
     def list_chatrooms(self) -> list[Chatroom]:
@@ -621,7 +739,7 @@ class ChatroomManager:
             chatroom_name: The name of the chatroom where the message was added.
             message: The `MessageData` object representing the added message.
         """
-        self.logger.debug(f"Received event '{event_type}' for chatroom '{chatroom_name}': {message.to_display_string()}")
+        self.logger.debug("Received event '%s' for chatroom '%s': %s", event_type, chatroom_name, message)
         chatroom = self.get_chatroom(chatroom_name)
         if not chatroom:
             self.logger.warning(f"Chatroom '{chatroom_name}' not found for event '{event_type}'. Cannot process message: {message.to_display_string()}")
@@ -16,7 +16,9 @@ class CreateFakeMessageDialog(QDialog):
     """A dialog for creating and inserting a 'fake' message into a chatroom.
 
     This is primarily a development/testing utility. It allows specifying
-    the sender (User or any existing bot) and the message content.
+    the sender (User or any existing bot) and the message content. The
+    dialog can be reused for several messages; call `reset()` before
+    showing it again.
     """
     def __init__(self, current_bots: list[str], parent=None):
         """Initializes the CreateFakeMessageDialog.
@@ -39,9 +41,7 @@ class CreateFakeMessageDialog(QDialog):
         self.sender_label = QLabel(self.tr("Sender:"))
         layout.addWidget(self.sender_label)
         self.sender_combo = QComboBox()
-        self.sender_combo.addItem("User") # Default sender
-        for bot_name in current_bots:
-            self.sender_combo.addItem(bot_name)
+        self.reset(current_bots)
         layout.addWidget(self.sender_combo)
 
         self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -49,6 +49,18 @@ class CreateFakeMessageDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addWidget(self.button_box)
 
+    def reset(self, current_bots: list[str]):
+        """Prepares the dialog for a new message.
+
+        Clears the message content and refills the sender choices.
+
+        Args:
+            current_bots: A list of names of bots currently in the active chatroom.
+        """
+        self.content_input.clear()
+        self.sender_combo.clear()
+        self.sender_combo.addItems(["User", *current_bots]) # "User" is the default sender
+
     def get_data(self) -> tuple[str, str] | None:
         """Retrieves the sender and content from the dialog if accepted.
 
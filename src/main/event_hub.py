@@ -9,26 +9,22 @@ class EventHub:
         self._next_refid:int = 1
 
     def subscribe(self, event_type: str, coroutine) -> int:
-        if event_type not in self._event_type_to_refid_to_coroutine_wref_dict_dict:
-            self._event_type_to_refid_to_coroutine_wref_dict_dict[event_type] = {}
-        refid_to_coroutine_wref_dict = self._event_type_to_refid_to_coroutine_wref_dict_dict[event_type]
+        refid_to_coroutine_wref_dict = self._event_type_to_refid_to_coroutine_wref_dict_dict.setdefault(event_type, {})
         refid = self._next_refid
         refid_to_coroutine_wref_dict[refid] = weakref.WeakMethod(coroutine)
         self._next_refid += 1
         return refid
 
     def unsubscribe(self, event_type: str, refid: int):
-        if event_type not in self._event_type_to_refid_to_coroutine_wref_dict_dict:
+        refid_to_coroutine_wref_dict = self._event_type_to_refid_to_coroutine_wref_dict_dict.get(event_type)
+        if refid_to_coroutine_wref_dict is None:
             return
-        refid_to_coroutine_wref_dict = self._event_type_to_refid_to_coroutine_wref_dict_dict[event_type]
-        if refid not in refid_to_coroutine_wref_dict:
-            return
-        del refid_to_coroutine_wref_dict[refid]
+        refid_to_coroutine_wref_dict.pop(refid, None)
 
     async def publish_async(self, event_type, *args, **kwargs):
-        if event_type not in self._event_type_to_refid_to_coroutine_wref_dict_dict:
+        refid_to_coroutine_wref_dict = self._event_type_to_refid_to_coroutine_wref_dict_dict.get(event_type)
+        if refid_to_coroutine_wref_dict is None:
             return
-        refid_to_coroutine_wref_dict = self._event_type_to_refid_to_coroutine_wref_dict_dict[event_type]
         dead_refid_list = []
         async with asyncio.TaskGroup() as tg:
             for refid, coroutine_wref in refid_to_coroutine_wref_dict.items():
@@ -11,37 +11,41 @@ The application uses PyQt6 for its GUI components. Internationalization (i18n)
 is supported using QTranslator. Logging is used for diagnostics.
 """
 import asyncio
+import atexit
 from concurrent.futures import ThreadPoolExecutor
 import sys
 import os  # For path construction
 import logging  # For logging
+import logging.handlers
+import queue
 import pyperclip
 import threading
 import copy
+from collections import deque
 from typing import Optional
-import requests # Added
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QPushButton, QLabel, QInputDialog, QMessageBox,
+    QListWidget, QListView, QPushButton, QLabel, QInputDialog, QMessageBox,
     QListWidgetItem, QTextEdit,
     QSplitter, QAbstractItemView,
-    QMenu, QStyle, QSizePolicy, QSpacerItem  # Added QSpacerItem for potential use
+    QMenu, QStyle, QSizePolicy, QSpacerItem,  # Added QSpacerItem for potential use
+    QDialog
 )
-from PyQt6.QtGui import QAction, QIcon  # Added QIcon
-from PyQt6.QtCore import Qt, QTranslator, QLocale, QLibraryInfo, QPoint, pyqtSignal, QTimer, QSettings, QThread  # Added QTimer and QSettings
-from pydantic import BaseModel
+from PyQt6.QtGui import QAction, QIcon, QColor, QPalette  # Added QIcon
+from PyQt6.QtCore import Qt, QEvent, QTranslator, QLocale, QLibraryInfo, QPoint, pyqtSignal, pyqtSlot, QSignalBlocker, QModelIndex, QStringListModel, QTimer, QSettings, QThread  # Added QTimer and QSettings
 
 # Attempt to import from sibling modules
-from .chatroom import ChatroomManager
+from .chatroom import Chatroom, ChatroomManager
 from .bot_template_manager import BotTemplateManager  # Added
 # from .ai_bots import Bot, create_bot
-# from .ai_engines import GeminiEngine, GrokEngine
 from .thirdpartyapikey_manager import ThirdPartyApiKeyManager
 # from . import ai_engines
 from . import api_server
 from .bot_info_dialog import BotInfoDialog
 from .create_fake_message_dialog import CreateFakeMessageDialog
+from .message import MessageData
+from .message_list_model import MessageListModel
 from .thirdpartyapikey_dialog import ThirdPartyApiKeyDialog
 from .password_manager import PasswordManager
 from .encryption_service import EncryptionService, ENCRYPTION_SALT_FILE
@@ -52,6 +56,25 @@ from .ccapikey_manager import CcApiKeyManager
 from .ccapikey_dialog import CcApiKeyDialog
 from .event_hub import EventHub
 
+_UNSET = object()
+"""Sentinel for cache lookups where None is a meaningful cached value."""
+
+_LOG_LEVEL_ENV_VAR = "COGNI_LOG_LEVEL"
+"""Environment variable naming the root log level, e.g. DEBUG; INFO when unset or unknown."""
+_LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+"""Size at which app.log is rolled over to app.log.1, see `_init_logging()`."""
+_LOG_FILE_BACKUP_COUNT = 3
+"""Number of rolled-over log files kept next to app.log."""
+
+_BOT_LIST_REFRESH_DELAY_MS = 100
+"""Quiet period after the last bot mutation before the bot list is rebuilt."""
+
+# Resolved once at import: main_window.py is in src/main/, i18n is in project_root/i18n/.
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_I18N_DIR = os.path.join(os.path.dirname(os.path.dirname(_MODULE_DIR)), "i18n")
+# Qt's base translations, often in a path like /usr/share/qt6/translations/
+_QT_TR_PATH = QLibraryInfo.path(QLibraryInfo.LibraryPath.TranslationsPath)
+
 class MessageInputTextEdit(QTextEdit):
     """A custom QTextEdit that emits a signal when Ctrl+Enter is pressed.
 
@@ -89,7 +112,9 @@ class MainWindow(QMainWindow):
     sensitive data like API keys.
     """
 
-    _chatroom_add_message_signal = pyqtSignal(str, str, str)  # chatroom_name, message
+    _chatroom_add_message_signal = pyqtSignal(str, str, object)  # event_type, chatroom_name, MessageData
+    _bot_response_failed_signal = pyqtSignal(str, str)  # title, text
+    _bot_response_done_signal = pyqtSignal()
 
     def __init__(self):
         """Initializes the MainWindow.
@@ -154,6 +179,48 @@ class MainWindow(QMainWindow):
         self.api_server_enabled_on_startup = True # Default, will be loaded from settings
         """Flag to control if API server starts automatically."""
 
+        self._warn_box = QMessageBox(
+            QMessageBox.Icon.Warning, "", "", QMessageBox.StandardButton.Ok, self)
+        """Reusable warning box shown by `_warn()`."""
+        self._error_box = QMessageBox(
+            QMessageBox.Icon.Critical, "", "", QMessageBox.StandardButton.Ok, self)
+        """Reusable error box shown by `_error()`."""
+        self._pending_warn_deque: deque[tuple[str, str]] = deque()
+        """(title, text) of warnings raised while `_warn_box` was still open."""
+        self._pending_error_deque: deque[tuple[str, str]] = deque()
+        """(title, text) of errors raised while `_error_box` was still open."""
+        self._warn_box.finished.connect(
+            lambda _result: self._show_next_pending_message(self._warn_box, self._pending_warn_deque))
+        self._error_box.finished.connect(
+            lambda _result: self._show_next_pending_message(self._error_box, self._pending_error_deque))
+        self._retranslate_cached_strings()
+
+        self._ui_state_cache: dict[str, object] = {}
+        """Last value applied to each stateful widget property, keyed by widget role."""
+        self._bot_refresh_timer = QTimer(self)
+        """Single-shot debounce timer for `_schedule_bot_list_refresh()`."""
+        self._bot_refresh_timer.setSingleShot(True)
+        self._bot_refresh_timer.setInterval(_BOT_LIST_REFRESH_DELAY_MS)
+        self._bot_refresh_timer.timeout.connect(self._do_bot_list_refresh)
+        self._bot_refresh_chatroom_names: set[str] = set()
+        """Chatrooms whose bots changed since the last deferred refresh, see `_schedule_bot_list_refresh()`."""
+        self._bot_list_dirty: bool = False
+        """Whether `bot_list_widget` was left stale while the window was hidden, see `showEvent()`."""
+        self._shown_bot_names: tuple[str, ...] = ()
+        """Bot names `bot_list_widget` currently shows, as returned by `Chatroom.bot_names()`."""
+        self._chatroom_names: list[str] = []
+        """Name in each row of `chatroom_list_model`, kept in step with it by `_update_chatroom_list()`."""
+        self._chatroom_name_to_row: dict[str, int] = {}
+        """Row of each chatroom in `chatroom_list_model`, rebuilt by `_update_chatroom_list()`."""
+        self._message_display_chatroom: Optional[Chatroom] = None
+        """Chatroom whose messages `message_list_model` was last filled with, see `_update_message_display_qt()`."""
+        self._message_display_update_count: int = -1
+        """`Chatroom.update_count` of `_message_display_chatroom` that `message_list_model` is known to be in step with."""
+        self._thirdpartyapikey_dialog: Optional[ThirdPartyApiKeyDialog] = None
+        """API key dialog, created on first use and reused afterwards."""
+        self._fake_message_dialog: Optional[CreateFakeMessageDialog] = None
+        """Fake message dialog, created on first use and reused afterwards."""
+
         self._load_settings() # Load settings first
         self._init_ui()
         # Initialize status bar
@@ -169,6 +236,10 @@ class MainWindow(QMainWindow):
             self._chatroom_add_message_signal,
             self._chatroom_add_message_handler
         )
+        # Bot responses are generated off the GUI thread; these signals bring
+        # their outcome back to it through queued connections.
+        self._bot_response_failed_signal.connect(self._error)
+        self._bot_response_done_signal.connect(self._on_bot_response_done)
 
     def _init_threading_event_loop(self):
         """Initializes the threading event loop for asynchronous operations.
@@ -245,12 +316,21 @@ class MainWindow(QMainWindow):
         # Chatroom Management
         chatroom_label = QLabel(self.tr("Chatrooms"))
         left_panel_layout.addWidget(chatroom_label)
-        self.chatroom_list_widget = QListWidget()
-        self.chatroom_list_widget.currentItemChanged.connect(
+        # A string list model keeps one string per chatroom instead of one item object
+        self.chatroom_list_model = QStringListModel(self)
+        self.chatroom_list_widget = QListView()
+        self.chatroom_list_widget.setModel(self.chatroom_list_model)
+        self.chatroom_list_widget.setEditTriggers(
+            QAbstractItemView.EditTrigger.NoEditTriggers)
+        # Chatroom names are single-line rows, so one row's size fits all
+        self.chatroom_list_widget.setUniformItemSizes(True)
+        self.chatroom_list_widget.selectionModel().currentChanged.connect(
             self._on_selected_chatroom_changed)
-        # Attempt to set stylesheet for selected item clarity
-        self.chatroom_list_widget.setStyleSheet(
-            "QListWidget::item:selected { background-color: #ADD8E6; color: black; }")
+        # Highlight the selected item clearly; a palette needs no stylesheet parsing
+        chatroom_list_palette = self.chatroom_list_widget.palette()
+        chatroom_list_palette.setColor(QPalette.ColorRole.Highlight, QColor("#ADD8E6"))
+        chatroom_list_palette.setColor(QPalette.ColorRole.HighlightedText, QColor("black"))
+        self.chatroom_list_widget.setPalette(chatroom_list_palette)
         self.chatroom_list_widget.setSelectionMode(
             QAbstractItemView.SelectionMode.ExtendedSelection)  # Added
         self.chatroom_list_widget.setContextMenuPolicy(
@@ -316,8 +396,15 @@ class MainWindow(QMainWindow):
         right_panel_widget = QWidget()  # This is now the middle panel
         right_panel_layout = QVBoxLayout(right_panel_widget)
 
-        self.message_display_area = QListWidget()
+        # A model/view pair so only visible messages are laid out and painted
+        self.message_list_model = MessageListModel(self)
+        self.message_display_area = QListView()
+        self.message_display_area.setModel(self.message_list_model)
         self.message_display_area.setWordWrap(True)  # Enable word wrap
+        # Messages wrap to different heights, so item sizes cannot be uniform;
+        # lay rows out in batches instead so long histories do not block the UI.
+        self.message_display_area.setLayoutMode(QListView.LayoutMode.Batched)
+        self.message_display_area.setBatchSize(100)
         self.message_display_area.setSelectionMode(
             QAbstractItemView.SelectionMode.ExtendedSelection)
         self.message_display_area.setContextMenuPolicy(
@@ -375,6 +462,9 @@ class MainWindow(QMainWindow):
         right_bot_panel_layout.addWidget(self.bot_panel_label)
 
         self.bot_list_widget = QListWidget()
+        # Parsed once here and inherited by every bot row's avatar label
+        self.bot_list_widget.setStyleSheet(
+            "QLabel#botAvatar { border: 1px solid gray; background-color: lightgray; }")
         self.bot_list_widget.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu)
         self.bot_list_widget.customContextMenuRequested.connect(
@@ -408,14 +498,18 @@ class MainWindow(QMainWindow):
                             (sets input to read-only, clears display).
         """
         # Instead of disabling, set read-only for message_input_area
-        self.message_input_area.setReadOnly(not enabled)
-        self.send_message_button.setEnabled(enabled)
-        self.create_fake_message_button.setEnabled(enabled)
+        self._apply_ui_state("msg_input_read_only", not enabled,
+                             self.message_input_area.setReadOnly)
+        self._apply_ui_state("send_message_button", enabled,
+                             self.send_message_button.setEnabled)
+        self._apply_ui_state("create_fake_message_button", enabled,
+                             self.create_fake_message_button.setEnabled)
 
         if not enabled:
-            self.message_display_area.clear()
+            self.message_list_model.clear()
             # self.bot_response_selector.clear()
 
+    @pyqtSlot(QPoint)
     def _show_message_context_menu(self, position: QPoint):
         """Displays a context menu for selected messages.
 
@@ -427,7 +521,7 @@ class MainWindow(QMainWindow):
                                local to the message_display_area widget.
         """
         menu = QMenu()
-        selected_messages = self.message_display_area.selectedItems() # Get selected items
+        selected_messages = self._selected_message_rows() # Get selected rows
 
         if selected_messages: # Check if any messages are selected
             copy_action = menu.addAction(self.tr("Copy message"))
@@ -438,6 +532,7 @@ class MainWindow(QMainWindow):
         # menu.exec(...) should be called regardless of selection, but menu might be empty
         menu.exec(self.message_display_area.mapToGlobal(position))
 
+    @pyqtSlot(QPoint)
     def _show_chatroom_context_menu(self, position: QPoint):
         """Displays a context menu for selected chatroom(s).
 
@@ -448,12 +543,12 @@ class MainWindow(QMainWindow):
             position (QPoint): The position where the context menu was requested,
                                local to the chatroom_list_widget.
         """
-        selected_items = self.chatroom_list_widget.selectedItems()
-        if not selected_items:
+        selected_names = self._selected_chatroom_names()
+        if not selected_names:
             return
 
         menu = QMenu(self)
-        num_selected = len(selected_items)
+        num_selected = len(selected_names)
 
         if num_selected == 1:
             # Ensure currentItem is one of the selected_items, or set it.
@@ -517,19 +612,119 @@ class MainWindow(QMainWindow):
                 Currently unused in the method body but kept for signature consistency.
         """
         # Instead of disabling, set selection mode to NoSelection when not enabled
-        if enabled:
-            self.bot_list_widget.setSelectionMode(
-                QAbstractItemView.SelectionMode.ExtendedSelection)
-            # Allow focus for keyboard navigation
-            self.bot_list_widget.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        else:
-            self.bot_list_widget.setSelectionMode(
-                QAbstractItemView.SelectionMode.NoSelection)
-            self.bot_list_widget.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.add_bot_button.setEnabled(enabled)
+        # Selection mode and focus policy always change together, so a single
+        # cache entry guards both.
+        if self._ui_state_cache.get("bot_list_enabled") != enabled:
+            if enabled:
+                self.bot_list_widget.setSelectionMode(
+                    QAbstractItemView.SelectionMode.ExtendedSelection)
+                # Allow focus for keyboard navigation
+                self.bot_list_widget.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+            else:
+                self.bot_list_widget.setSelectionMode(
+                    QAbstractItemView.SelectionMode.NoSelection)
+                self.bot_list_widget.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            self._ui_state_cache["bot_list_enabled"] = enabled
+        self._apply_ui_state("add_bot_button", enabled,
+                             self.add_bot_button.setEnabled)
         # self.remove_bot_button.setEnabled(enabled and bool(self.bot_list_widget.currentItem())) # REMOVED
 
-        self.bot_panel_label.setText(self.tr("Bots"))
+        self._apply_ui_state("bot_panel_label", self._tr_bots,
+                             self.bot_panel_label.setText)
+
+    def _apply_ui_state(self, key: str, value, setter):
+        """Applies a widget property only if it differs from the last applied value.
+
+        Each Qt setter call crosses the Python/C++ binding and may trigger a
+        style recomputation even when the value is unchanged. The last value
+        passed for `key` is remembered in `_ui_state_cache` so repeated
+        refreshes with the same state are no-ops.
+
+        Args:
+            key (str): Identifies the widget property in `_ui_state_cache`.
+            value: The value to apply.
+            setter (Callable): The bound Qt setter, e.g. `button.setEnabled`.
+        """
+        if self._ui_state_cache.get(key, _UNSET) != value:
+            setter(value)
+            self._ui_state_cache[key] = value
+
+    def _retranslate_cached_strings(self):
+        """(Re)translates the strings used on frequent UI paths.
+
+        Covers message box titles, the bot panel label and the status bar
+        template shown for every new message. Called once from `__init__` and
+        again from `changeEvent()` when the application language changes, so
+        call sites do not need a `tr()` lookup per use.
+        """
+        self._tr_warning = self.tr("Warning")
+        self._tr_error = self.tr("Error")
+        self._tr_bots = self.tr("Bots")
+        self._tr_message_sent_to = self.tr("Message sent to {0}.")
+
+    def changeEvent(self, event):
+        """Refreshes cached translated strings when the language changes."""
+        if event.type() == QEvent.Type.LanguageChange:
+            self._retranslate_cached_strings()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        """Rebuilds the bot list if it changed while the window was hidden."""
+        super().showEvent(event)
+        if self._bot_list_dirty:
+            self._update_bot_list(self._current_chatroom_name())
+
+    def _warn(self, title: str, text: str):
+        """Shows a warning message without blocking in a nested event loop.
+
+        Reuses a single `QMessageBox` instance instead of constructing a new
+        one per call, as the static `QMessageBox.warning()` helper does. A
+        warning raised while the box is still open is shown once it closes.
+
+        Args:
+            title (str): The window title of the message box.
+            text (str): The message to display.
+        """
+        self._show_message(self._warn_box, self._pending_warn_deque, title, text)
+
+    @pyqtSlot(str, str)
+    def _error(self, title: str, text: str):
+        """Shows an error message without blocking in a nested event loop.
+
+        Counterpart of `_warn()` using a reusable critical `QMessageBox`.
+
+        Args:
+            title (str): The window title of the message box.
+            text (str): The message to display.
+        """
+        self._show_message(self._error_box, self._pending_error_deque, title, text)
+
+    def _show_message(self, box: QMessageBox, pending_deque: deque[tuple[str, str]], title: str, text: str):
+        """Shows a message in a reusable box, or queues it while the box is open.
+
+        Args:
+            box (QMessageBox): The reusable message box.
+            pending_deque (deque[tuple[str, str]]): Messages waiting for `box` to close.
+            title (str): The window title of the message box.
+            text (str): The message to display.
+        """
+        if box.isVisible():
+            pending_deque.append((title, text))
+            return
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.open()
+
+    def _show_next_pending_message(self, box: QMessageBox, pending_deque: deque[tuple[str, str]]):
+        """Shows the next queued message after `box` was closed, if there is one.
+
+        Args:
+            box (QMessageBox): The reusable message box that was closed.
+            pending_deque (deque[tuple[str, str]]): Messages waiting for `box` to close.
+        """
+        if pending_deque:
+            title, text = pending_deque.popleft()
+            self._show_message(box, pending_deque, title, text)
 
     # def _update_chatroom_related_button_states(self):
     #     """Updates the enabled state of chatroom action buttons.
@@ -543,36 +738,115 @@ class MainWindow(QMainWindow):
     #     # self.delete_chatroom_button.setEnabled(has_selection) # REMOVED
 
     def _update_chatroom_list(self):
-        """Refreshes the chatroom list widget from the `ChatroomManager`.
-
-        This method clears the existing items in `chatroom_list_widget` and
-        repopulates it with the current list of chatrooms. It attempts to
-        restore the previously selected chatroom. If no chatroom is selected
-        after the update (e.g., if the list is empty or the selected one was
-        deleted), it updates other UI parts like the bot list and message area
-        to reflect an empty state.
+        """Refreshes the chatroom list from the `ChatroomManager`.
+
+        The names in `chatroom_list_model` are compared with the current list
+        of chatrooms and only the difference is applied, see
+        `_apply_chatroom_names()`, with painting and selection signals
+        suppressed meanwhile. If the selected chatroom is still listed it stays
+        selected and the rest of the UI, which already shows it, is left alone.
+        If no chatroom is selected after the update (e.g., if the list is
+        empty or the selected one was deleted), `_on_selected_chatroom_changed()`
+        is called once to put the bot list and message area in an empty state.
         """
-        current_selection_name = self.chatroom_list_widget.currentItem(
-        ).text() if self.chatroom_list_widget.currentItem() else None
+        current_selection_name = self._current_chatroom_name()
 
-        self.chatroom_list_widget.clear()
         # list_chatrooms now returns list[Chatroom]
-        for chatroom_obj in self.chatroom_manager.list_chatrooms():
-            item = QListWidgetItem(chatroom_obj.name)
-            self.chatroom_list_widget.addItem(item)
-            if chatroom_obj.name == current_selection_name:
-                self.chatroom_list_widget.setCurrentItem(
-                    item)  # Restore selection
-
-        if self.chatroom_list_widget.currentItem() is None:
-            self._update_bot_list(None)
-            self._update_bot_panel_state(False)
-            self._update_message_related_ui_state(False)
+        chatroom_names = [chatroom_obj.name for chatroom_obj in self.chatroom_manager.list_chatrooms()]
+        if chatroom_names != self.chatroom_list_model.stringList():
+            self._chatroom_names = chatroom_names
+            self._chatroom_name_to_row = {name: row for row, name in enumerate(chatroom_names)}
+            selection_model = self.chatroom_list_widget.selectionModel()
+            self.chatroom_list_widget.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(selection_model):
+                    self._apply_chatroom_names(chatroom_names)
+                    if self._current_chatroom_name() != current_selection_name:
+                        # The current row was removed, or the model was reset
+                        selection_model.clear()
+                        if current_selection_name is not None:
+                            self._select_chatroom_by_name(current_selection_name)  # Restore selection
+            finally:
+                self.chatroom_list_widget.setUpdatesEnabled(True)
+
+        # Signals were blocked, so run the selection handler once ourselves.
+        # A restored selection still shows the same chatroom and needs nothing.
+        if self._current_chatroom_name() is None:
+            self._on_selected_chatroom_changed(QModelIndex(), QModelIndex())
 
         # self._update_chatroom_related_button_states()
 
+    def _apply_chatroom_names(self, chatroom_names: list[str]):
+        """Makes `chatroom_list_model` list exactly `chatroom_names`.
+
+        Rows of chatrooms that are gone are removed and rows of new chatrooms
+        are inserted in place, so the view only handles the changed rows and
+        surviving rows keep their selection. If the surviving chatrooms changed
+        their relative order, the whole list is replaced instead.
+
+        Args:
+            chatroom_names (list[str]): The chatroom names to list, in order.
+        """
+        model = self.chatroom_list_model
+        old_names = model.stringList()
+        old_name_set = set(old_names)
+        new_name_set = set(chatroom_names)
+        if ([name for name in old_names if name in new_name_set]
+                != [name for name in chatroom_names if name in old_name_set]):
+            model.setStringList(chatroom_names)
+            return
+
+        # Remove from the bottom up so earlier rows keep their row numbers.
+        for row in range(len(old_names) - 1, -1, -1):
+            if old_names[row] not in new_name_set:
+                model.removeRows(row, 1)
+        for row, name in enumerate(chatroom_names):
+            if name not in old_name_set:
+                model.insertRows(row, 1)
+                model.setData(model.index(row), name)
+
+    def _current_chatroom_name(self) -> Optional[str]:
+        """Returns the name of the current chatroom in `chatroom_list_widget`.
+
+        The name is read from `_chatroom_names` by row, not through the
+        model's `data()`.
+
+        Returns:
+            Optional[str]: The chatroom name, or None if no chatroom is current.
+        """
+        current_index = self.chatroom_list_widget.currentIndex()
+        return self._chatroom_names[current_index.row()] if current_index.isValid() else None
+
+    def _selected_chatroom_names(self) -> list[str]:
+        """Returns the names of the selected chatrooms, in list order.
+
+        Returns:
+            list[str]: The selected chatroom names; empty if none is selected.
+        """
+        selected_rows = sorted(index.row() for index in self.chatroom_list_widget.selectionModel().selectedRows())
+        return [self._chatroom_names[row] for row in selected_rows]
+
+    def _select_chatroom_by_name(self, name: str) -> bool:
+        """Makes the named chatroom the current and only selected row of `chatroom_list_widget`.
+
+        Uses the row map built by `_update_chatroom_list()`, so the list must
+        have been refreshed since the chatroom was created or renamed.
+
+        Args:
+            name (str): The name of the chatroom to select.
+
+        Returns:
+            bool: True if the chatroom is listed and was selected, False otherwise.
+        """
+        row = self._chatroom_name_to_row.get(name)
+        if row is None:
+            return False
+        self.chatroom_list_widget.setCurrentIndex(self.chatroom_list_model.index(row))
+        return True
+
+    @pyqtSlot()
     def _copy_selected_messages_to_clipboard(self):
-        current_chatroom_name = self.chatroom_list_widget.currentItem().text() if self.chatroom_list_widget.currentItem() else None
+        current_chatroom_name = self._current_chatroom_name()
         if not current_chatroom_name:
             return
 
@@ -580,19 +854,13 @@ class MainWindow(QMainWindow):
         if not chatroom:
             return
 
-        selected_items = self.message_display_area.selectedItems()
-        if not selected_items:
+        selected_rows = self._selected_message_rows()
+        if not selected_rows:
             return
 
-        all_messages = chatroom.get_messages() # Get all messages once
-        messages_to_copy_content = []
-
-        for item in selected_items:
-            timestamp = item.data(Qt.ItemDataRole.UserRole)
-            # Find the message by timestamp more efficiently
-            found_message = next((msg for msg in all_messages if msg.timestamp == timestamp), None)
-            if found_message:
-                messages_to_copy_content.append(found_message.get_content_for_copy())
+        # The model holds the displayed messages, so no search by timestamp is needed
+        messages_to_copy_content = [
+            self.message_list_model.message_at(row).get_content_for_copy() for row in selected_rows]
 
         if messages_to_copy_content:
             text_to_copy = "\n".join(messages_to_copy_content)
@@ -605,7 +873,8 @@ class MainWindow(QMainWindow):
                 self.logger.error(f"Error copying to clipboard: {e}")
                 QMessageBox.warning(self, self.tr("Clipboard Error"), self.tr("Could not copy messages to clipboard: {0}").format(str(e)))
 
-    def _on_selected_chatroom_changed(self, current: QListWidgetItem, _previous: QListWidgetItem):
+    @pyqtSlot(QModelIndex, QModelIndex)
+    def _on_selected_chatroom_changed(self, current: QModelIndex, _previous: QModelIndex):
         """Handles the event when the selected chatroom changes.
 
         When a new chatroom is selected in the `chatroom_list_widget`, this
@@ -616,18 +885,18 @@ class MainWindow(QMainWindow):
         - Refreshing the message display area with the chatroom's messages.
         - Enabling/disabling message-related UI elements.
 
-        If no chatroom is selected (e.g., `current` is None), it sets the UI
+        If no chatroom is selected (i.e., `current` is invalid), it sets the UI
         to a state reflecting no active chatroom.
 
         Args:
-            current (QListWidgetItem): The newly selected list widget item representing
-                                     the current chatroom. Can be None if selection is cleared.
-            _previous (QListWidgetItem): The previously selected list widget item.
-                                       Currently unused.
+            current (QModelIndex): The index of the current chatroom in
+                                 `chatroom_list_model`. Invalid if the selection is cleared.
+            _previous (QModelIndex): The index of the previous chatroom.
+                                   Currently unused.
         """
         # self._update_chatroom_related_button_states() # Update button states based on selection
-        if current:
-            selected_chatroom_name = current.text()
+        if current.isValid():
+            selected_chatroom_name = self._chatroom_names[current.row()]
             self._update_bot_list(selected_chatroom_name)
             self._update_bot_panel_state(True, selected_chatroom_name)
             self._update_message_display_qt()
@@ -640,6 +909,7 @@ class MainWindow(QMainWindow):
             # self._update_bot_response_selector()
             self._update_message_related_ui_state(False)
 
+    @pyqtSlot()
     def _clone_selected_chatroom(self):
         """Clones the selected chatroom(s) via `ChatroomManager`.
 
@@ -651,21 +921,19 @@ class MainWindow(QMainWindow):
         It also provides feedback to the user regarding the success or failure
         of the clone operation(s) via `QMessageBox`.
         """
-        selected_items = self.chatroom_list_widget.selectedItems()
-        if not selected_items:
+        selected_names = self._selected_chatroom_names()
+        if not selected_names:
             QMessageBox.warning(self, self.tr("Warning"), self.tr(
                 "No chatroom(s) selected to clone."))
             return
 
         cloned_count = 0
-        attempted_count = len(selected_items)
+        attempted_count = len(selected_names)
         last_cloned_name = None
         # Store original names for the final message if only one was selected
-        original_single_selected_name = selected_items[0].text(
-        ) if attempted_count == 1 else None
+        original_single_selected_name = selected_names[0] if attempted_count == 1 else None
 
-        for item in selected_items:
-            original_chatroom_name = item.text()
+        for original_chatroom_name in selected_names:
             self.logger.info(
                 f"Attempting to clone chatroom: {original_chatroom_name}")
             cloned_chatroom = self.chatroom_manager.clone_chatroom(
@@ -687,10 +955,7 @@ class MainWindow(QMainWindow):
         if attempted_count == 1:  # Single selection
             if cloned_count == 1 and last_cloned_name and original_single_selected_name:
                 # Try to select the newly cloned chatroom if it was a single clone
-                for i in range(self.chatroom_list_widget.count()):
-                    if self.chatroom_list_widget.item(i).text() == last_cloned_name:
-                        self.chatroom_list_widget.setCurrentRow(i)
-                        break
+                self._select_chatroom_by_name(last_cloned_name)
                 QMessageBox.information(self, self.tr("Success"),
                                         self.tr("Chatroom '{0}' cloned as '{1}'.").format(original_single_selected_name, last_cloned_name))
             elif original_single_selected_name:  # Ensure it's not None
@@ -710,39 +975,71 @@ class MainWindow(QMainWindow):
     def _update_message_display_qt(self):
         """Refreshes the message display area with messages from the current chatroom.
 
-        Clears the `message_display_area` and repopulates it with messages
-        from the currently selected chatroom in `chatroom_list_widget`.
-        Messages are retrieved from the `Chatroom` object and sorted by
-        timestamp before display. Each list item stores the message's
-        timestamp for potential use in other operations like deletion.
-        If no chatroom is selected, the display area is simply cleared.
-        """
-        current_chatroom_name = self.chatroom_list_widget.currentItem(
-        ).text() if self.chatroom_list_widget.currentItem() else None
-        self.message_display_area.clear()
-        if current_chatroom_name:
-            chatroom = self.chatroom_manager.get_chatroom(
-                current_chatroom_name)
-            if chatroom:
-                # Ensure sorted display by timestamp
-                for message in sorted(chatroom.get_messages(), key=lambda m: m.timestamp):
-                    # Use to_display_string for formatting
-                    item = QListWidgetItem(message.to_display_string()+'\n')
-                    item.setData(Qt.ItemDataRole.UserRole,
-                                 message.timestamp)  # Store timestamp
-                    self.message_display_area.addItem(item)
+        Resets `message_list_model` to the messages of the currently selected
+        chatroom in `chatroom_list_widget`, which the chatroom keeps ordered
+        by timestamp. The model exposes each `MessageData` under `UserRole`
+        for operations like deletion. If no chatroom is selected, the model is
+        simply cleared.
+
+        The reset is skipped if the model already holds this chatroom's
+        messages, i.e. the chatroom's `update_count` has not changed since the
+        model was last brought in step with it. Incremental appends and
+        deletions advance the recorded count only when they were the sole
+        change, so any other change still forces a reset.
+        """
+        current_chatroom_name = self._current_chatroom_name()
+        chatroom = self.chatroom_manager.get_chatroom(
+            current_chatroom_name) if current_chatroom_name else None
+        if chatroom:
+            update_count = chatroom.update_count
+            if chatroom is self._message_display_chatroom and update_count == self._message_display_update_count:
+                return
+            # Chatroom keeps messages sorted by timestamp; the model copies the list
+            self.message_list_model.set_messages(chatroom.get_messages())
+            self._message_display_chatroom = chatroom
+            self._message_display_update_count = update_count
+        else:
+            self.message_list_model.clear()
+            self._message_display_chatroom = None
+            self._message_display_update_count = -1
+
+    def _append_message_item(self, message: MessageData):
+        """Appends a newly added message of the current chatroom to the display.
 
+        Only the new row is inserted instead of rebuilding the whole list. If
+        the message is not newer than the last displayed one (it arrived out
+        of order, or a full refresh already picked it up), the display is
+        refreshed from the chatroom instead.
+
+        Args:
+            message (MessageData): The message that was added.
+        """
+        row_count = self.message_list_model.rowCount()
+        if row_count and message.timestamp <= self.message_list_model.message_at(row_count - 1).timestamp:
+            self._update_message_display_qt()
+            return
+        self.message_list_model.append_message(message)
+        # If this message was the only change, the model is still in step
+        chatroom = self._message_display_chatroom
+        if chatroom is not None and chatroom.update_count == self._message_display_update_count + 1:
+            self._message_display_update_count = chatroom.update_count
+
+    def _selected_message_rows(self) -> list[int]:
+        """Returns the rows selected in `message_display_area`, in display order."""
+        selection_model = self.message_display_area.selectionModel()
+        return sorted(index.row() for index in selection_model.selectedRows())
+
+    @pyqtSlot()
     def _delete_selected_messages(self):
         """Deletes selected messages from the current chatroom's history.
 
         Retrieves the currently selected chatroom and the selected messages
         from `message_display_area`. After confirming with the user, it
-        iterates through the selected messages, using their stored timestamps
-        to delete them from the `Chatroom` object via `chatroom.delete_message()`.
-        Finally, it refreshes the message display.
+        deletes each selected message, as held by `message_list_model`, from
+        the `Chatroom` object via `chatroom.delete_message_data()`.
+        Finally, it removes the deleted rows from the message display.
         """
-        current_chatroom_name = self.chatroom_list_widget.currentItem(
-        ).text() if self.chatroom_list_widget.currentItem() else None
+        current_chatroom_name = self._current_chatroom_name()
         if not current_chatroom_name:
             QMessageBox.warning(self, self.tr("Warning"),
                                 self.tr("No chatroom selected."))
@@ -752,27 +1049,34 @@ class MainWindow(QMainWindow):
         if not chatroom:
             return  # Should not happen if UI is consistent
 
-        selected_items = self.message_display_area.selectedItems()
-        if not selected_items:
+        selected_rows = self._selected_message_rows()
+        if not selected_rows:
             QMessageBox.information(self, self.tr("Information"), self.tr(
                 "No messages selected to delete."))
             return
 
         reply = QMessageBox.question(self, self.tr("Confirm Deletion"),
                                      self.tr("Are you sure you want to delete {0} message(s)?").format(
-                                         len(selected_items)),
+                                         len(selected_rows)),
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
 
         if reply == QMessageBox.StandardButton.Yes:
-            deleted_count = 0
-            for item in selected_items:
-                timestamp = item.data(Qt.ItemDataRole.UserRole)
-                # delete_message calls _notify_chatroom_updated
-                if chatroom.delete_message(timestamp):
-                    deleted_count += 1
-            if deleted_count > 0:
-                self._update_message_display_qt()  # Refresh display
-
+            deleted_rows = []
+            update_count_before = chatroom.update_count
+            # Save the chatroom once for the whole selection
+            with chatroom.batch_update():
+                for row in selected_rows:
+                    if chatroom.delete_message_data(self.message_list_model.message_at(row)):
+                        deleted_rows.append(row)
+            # Drop just the deleted rows instead of rebuilding the display
+            self.message_list_model.remove_rows(deleted_rows)
+            # If these deletions were the only changes, the model is still in step
+            if (chatroom is self._message_display_chatroom
+                    and update_count_before == self._message_display_update_count
+                    and chatroom.update_count == update_count_before + len(deleted_rows)):
+                self._message_display_update_count = chatroom.update_count
+
+    @pyqtSlot()
     def _show_create_fake_message_dialog(self):
         """Opens a dialog to manually create and add a "fake" message.
 
@@ -782,8 +1086,7 @@ class MainWindow(QMainWindow):
         valid sender and content, the message is added to the current
         chatroom's history, and the message display is updated.
         """
-        current_chatroom_name = self.chatroom_list_widget.currentItem(
-        ).text() if self.chatroom_list_widget.currentItem() else None
+        current_chatroom_name = self._current_chatroom_name()
         if not current_chatroom_name:
             QMessageBox.warning(self, self.tr("Warning"),
                                 self.tr("No chatroom selected."))
@@ -793,8 +1096,12 @@ class MainWindow(QMainWindow):
         if not chatroom:
             return  # Should not happen
 
-        current_bot_names = [bot.name for bot in chatroom.list_bots()]
-        dialog = CreateFakeMessageDialog(current_bot_names, self)
+        current_bot_names = list(chatroom.bot_names())
+        if self._fake_message_dialog is None:
+            self._fake_message_dialog = CreateFakeMessageDialog(current_bot_names, self)
+        else:
+            self._fake_message_dialog.reset(current_bot_names)
+        dialog = self._fake_message_dialog
 
         exec_result = dialog.exec()
 
@@ -821,6 +1128,7 @@ class MainWindow(QMainWindow):
         )
 
 
+    @pyqtSlot()
     def _send_user_message(self):
         """Sends a message from the user to the current chatroom.
 
@@ -829,13 +1137,11 @@ class MainWindow(QMainWindow):
         to the `Chatroom` object with "User" as the sender.
         The message display is then updated, and the input area is cleared.
         """
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
             QMessageBox.warning(self, self.tr("Warning"), self.tr(
                 "No chatroom selected to send message."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:  # Should not happen if item is selected
             QMessageBox.critical(self, self.tr("Error"),
@@ -889,26 +1195,25 @@ class MainWindow(QMainWindow):
         It gathers the conversation history from the current chatroom.
         The method then calls `third_party_group.generate_response()`
         with the bot's configuration, API keys (retrieved via `thirdpartyapikey_manager`),
-        and conversation history.
+        and conversation history, in a worker thread so that neither the GUI
+        nor the background event loop waits on the network.
 
         The bot's response is added to the chatroom and the message display
         is updated. Errors during response generation (e.g., network issues,
         API errors, configuration problems) are caught, logged, and displayed
-        to the user via `QMessageBox`. A system message indicating the error
-        may also be added to the chat.
+        to the user via `QMessageBox` on the GUI thread. A system message
+        indicating the error may also be added to the chat.
 
         Args:
             bot_name_override (Optional[str]): If provided, this specific bot's name
                 is used to trigger the response, bypassing UI elements like
                 a bot selector dropdown. Defaults to None.
         """
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
             QMessageBox.warning(self, self.tr("Warning"),
                                 self.tr("No chatroom selected."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:
             self.logger.error(
@@ -942,17 +1247,12 @@ class MainWindow(QMainWindow):
                 "Bot '{0}' not found in chatroom.").format(selected_bot_name_to_use))
             return
 
-        # if isinstance(engine, (GeminiEngine, GrokEngine)):
-        #     thirdpartyapikey = self.thirdpartyapikey_manager.load_key(engine_type_name)
-        #     if not thirdpartyapikey:
-        #         self.logger.warning(f"Trigger bot response: API key missing for bot '{bot.get_name()}' using engine '{engine_type_name}'.")
-        #         QMessageBox.warning(self, self.tr("API Key Missing"),
-        #                             self.tr("Bot {0} (using {1}) needs an API key. Please set it in Settings.").format(bot.get_name(), engine_type_name))
-        #         return
-
         self.logger.info(
             f"Attempting to trigger bot response for bot '{selected_bot_name_to_use}' in chatroom '{chatroom_name}'.")
-        conversation_history = chatroom.get_messages()
+        # A single shallow copy of the message list: the engines read sender and
+        # content straight from the MessageData objects, and the copy keeps the
+        # worker thread's view stable while new messages are inserted.
+        conversation_history = list(chatroom.get_messages())
 
         if not conversation_history:
             self.logger.info(
@@ -961,19 +1261,12 @@ class MainWindow(QMainWindow):
                 "No messages in chat to respond to."))
             return
 
-        # UI updates to indicate processing, only for the main button
-        # original_button_text = None
-        # True if triggered by the main UI button
-        is_main_button_trigger = not bot_name_override
-        if is_main_button_trigger:
-            # original_button_text = self.trigger_bot_response_button.text()
-            # self.trigger_bot_response_button.setText(self.tr("Waiting for AI..."))
-            # self.trigger_bot_response_button.setEnabled(False)
-            QApplication.processEvents()
-
         async def _run():
             try:
-                ai_response = self.third_party_group.generate_response(
+                # The provider call blocks on network I/O, so it runs in a worker
+                # thread; the event loop stays free to deliver other messages.
+                ai_response = await asyncio.to_thread(
+                    self.third_party_group.generate_response,
                     aiengine_id=bot.aiengine_id,
                     aiengine_arg_dict=bot.aiengine_arg_dict,
                     thirdpartyapikey_list=self.thirdpartyapikey_manager.get_thirdpartyapikey_list(
@@ -987,7 +1280,7 @@ class MainWindow(QMainWindow):
             except ValueError as ve:  # Specific handling for ValueErrors from create_bot or engine
                 self.logger.error(
                     f"Configuration or input error for bot '{selected_bot_name_to_use}': {ve}", exc_info=True)
-                QMessageBox.critical(self, self.tr(
+                self._bot_response_failed_signal.emit(self.tr(
                     "Bot Configuration Error"), str(ve))
                 # Optionally add system message to chatroom for this type of error too
                 # chatroom.add_message("System", self.tr("Error with bot '{0}': {1}").format(selected_bot_name_to_use, str(ve)))
@@ -995,20 +1288,46 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 self.logger.error(
                     f"Error during bot response generation for bot '{selected_bot_name_to_use}' in chatroom '{chatroom_name}': {e}", exc_info=True)
-                QMessageBox.critical(self, self.tr("Error"), self.tr(
+                self._bot_response_failed_signal.emit(self._tr_error, self.tr(
                     "An error occurred while getting bot response for '{0}': {1}").format(selected_bot_name_to_use, str(e)))
                 await chatroom.add_message_async("System", self.tr(
                     "Error during bot response for '{0}': {1}").format(selected_bot_name_to_use, str(e)))
             finally:
-                # if is_main_button_trigger and original_button_text is not None:
-                #     self.trigger_bot_response_button.setText(original_button_text)
                 # The message related UI state should be updated regardless of which button triggered
-                self._update_message_related_ui_state(
-                    bool(self.chatroom_list_widget.currentItem()))
+                self._bot_response_done_signal.emit()
 
         asyncio.run_coroutine_threadsafe(_run(), self.threading_event_loop)
 
+    @pyqtSlot()
+    def _on_bot_response_done(self):
+        """Refreshes the message related UI state once a bot response finishes.
+
+        Connected to `_bot_response_done_signal`, which is emitted from the
+        background event loop whether the response succeeded or failed.
+        """
+        self._update_message_related_ui_state(
+            self._current_chatroom_name() is not None)
+
+    def _prepare_aiengine_in_background(self, aiengine_id: str):
+        """Prepares a bot's AI engine on the background event loop.
 
+        Slow one-time setup, like importing the provider SDK, then happens
+        right after the bot is added or edited rather than when the user
+        first asks it to respond. Failures are logged and otherwise ignored;
+        the same error will surface on the first real request.
+
+        Args:
+            aiengine_id (str): The ID of the AI engine the bot uses.
+        """
+        def _prepare():
+            try:
+                self.third_party_group.prepare(aiengine_id)
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.warning(f"Could not prepare AI engine '{aiengine_id}': {e}")
+
+        self.threading_event_loop.call_soon_threadsafe(_prepare)
+
+    @pyqtSlot()
     def _create_chatroom(self):
         """Initiates the creation of a new chatroom.
 
@@ -1028,10 +1347,7 @@ class MainWindow(QMainWindow):
                 self.logger.info(f"Chatroom '{name}' created successfully.")
                 self._update_chatroom_list()
                 # Optionally select the new chatroom
-                items = self.chatroom_list_widget.findItems(
-                    name, Qt.MatchFlag.MatchExactly)
-                if items:
-                    self.chatroom_list_widget.setCurrentItem(items[0])
+                self._select_chatroom_by_name(name)
                 self.statusBar().showMessage(self.tr("Chatroom '{0}' created.").format(name), 5000)
             else:
                 # WARNING - user action failed, but recoverable
@@ -1042,11 +1358,12 @@ class MainWindow(QMainWindow):
         # Name was provided but 'ok' was false (dialog cancelled) or name was empty after ok.
         elif name:
             self.logger.debug(
-                f"Chatroom creation cancelled or name was invalid: '{name}'.")
+                "Chatroom creation cancelled or name was invalid: '%s'.", name)
         # 'ok' was false and name was empty (dialog cancelled with no input).
         else:
             self.logger.debug("Chatroom creation cancelled by user.")
 
+    @pyqtSlot()
     def _rename_chatroom(self):
         """Initiates renaming of the selected chatroom.
 
@@ -1059,13 +1376,12 @@ class MainWindow(QMainWindow):
           the renamed chatroom is re-selected.
         - If renaming fails (e.g., new name already exists), a warning is shown.
         """
-        current_item = self.chatroom_list_widget.currentItem()
-        if not current_item:
+        old_name = self._current_chatroom_name()
+        if not old_name:
             QMessageBox.warning(self, self.tr("Warning"), self.tr(
                 "No chatroom selected to rename."))
             return
 
-        old_name = current_item.text()
         new_name, ok = QInputDialog.getText(self, self.tr(
             "Rename Chatroom"), self.tr("Enter new name:"), text=old_name)
 
@@ -1075,10 +1391,7 @@ class MainWindow(QMainWindow):
                     f"Chatroom '{old_name}' renamed to '{new_name}' successfully.")
                 self._update_chatroom_list()
                 # Re-select the renamed chatroom
-                items = self.chatroom_list_widget.findItems(
-                    new_name, Qt.MatchFlag.MatchExactly)
-                if items:
-                    self.chatroom_list_widget.setCurrentItem(items[0])
+                self._select_chatroom_by_name(new_name)
             else:
                 # WARNING - user action failed
                 self.logger.warning(
@@ -1093,8 +1406,9 @@ class MainWindow(QMainWindow):
                 "New chatroom name cannot be empty."))
         elif not ok:  # User cancelled the dialog
             self.logger.debug(
-                f"Chatroom rename for '{old_name}' cancelled by user.")
+                "Chatroom rename for '%s' cancelled by user.", old_name)
 
+    @pyqtSlot()
     def _delete_chatroom(self):
         """Initiates deletion of the selected chatroom(s).
 
@@ -1109,14 +1423,13 @@ class MainWindow(QMainWindow):
         - Feedback is provided to the user about the outcome (success, partial
           deletion, or failure).
         """
-        selected_items = self.chatroom_list_widget.selectedItems()
-        if not selected_items:
+        names_to_delete = self._selected_chatroom_names()
+        if not names_to_delete:
             QMessageBox.warning(self, self.tr("Warning"), self.tr(
                 "No chatroom(s) selected to delete."))
             return
 
-        num_selected = len(selected_items)
-        names_to_delete = [item.text() for item in selected_items]
+        num_selected = len(names_to_delete)
 
         # For single deletion, keep the old simple message
         if num_selected == 1:
@@ -1172,45 +1485,140 @@ class MainWindow(QMainWindow):
                                          self.tr("Failed to delete any of the selected {0} chatrooms. They may have already been deleted or an error occurred.").format(num_selected))
         else:
             self.logger.debug(
-                f"Deletion of {num_selected} chatroom(s) cancelled by user.")
+                "Deletion of %s chatroom(s) cancelled by user.", num_selected)
 
     def _update_bot_list(self, chatroom_name: Optional[str]):
         """Refreshes the bot list widget for the given chatroom.
 
-        Clears `bot_list_widget` and repopulates it with bots from the
-        chatroom specified by `chatroom_name`. Each bot is displayed using
-        a custom widget created by `_create_bot_list_item_widget()`.
+        Repopulates `bot_list_widget` with bots from the chatroom specified
+        by `chatroom_name`. Each bot is displayed using a custom widget
+        created by `_create_bot_list_item_widget()`, which depends only on
+        the bot's name, so the list is left untouched when the names are
+        the same as those already shown. When bots were only added or
+        removed, just their rows are inserted or taken out and the other
+        rows keep their widgets and selection. Otherwise, e.g. on a chatroom
+        switch, the list is rebuilt and previously selected bots that are
+        still present stay selected.
         If `chatroom_name` is None or the chatroom is not found, the list
         is cleared. The state of the bot panel is also updated.
 
+        While the window is hidden (e.g., during startup) the list is not
+        rebuilt; it is marked dirty and `showEvent()` rebuilds it once for
+        the chatroom that is current by then.
+
         Args:
             chatroom_name (Optional[str]): The name of the chatroom whose bots
                 are to be displayed. If None, the bot list is cleared.
         """
+        chatroom = self.chatroom_manager.get_chatroom(chatroom_name) if chatroom_name else None
+        # Update panel state based on whether a chatroom is active
+        self._update_bot_panel_state(chatroom is not None, chatroom_name)
+        if not self.isVisible():
+            self._bot_list_dirty = True
+            return
+        self._bot_list_dirty = False
+
+        new_bot_names = chatroom.bot_names() if chatroom else ()
+        shown_bot_names = self._shown_bot_names
+        # bot_names() returns the same tuple until the bots change, so an
+        # unchanged chatroom is recognised without comparing any names
+        if new_bot_names is shown_bot_names:
+            return
+        self._shown_bot_names = new_bot_names
+        if new_bot_names == shown_bot_names:
+            return
+
+        # Lay out and paint once, after all rows are in place
+        self.bot_list_widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.bot_list_widget):
+                self._apply_bot_names(new_bot_names, shown_bot_names)
+        finally:
+            self.bot_list_widget.setUpdatesEnabled(True)
+
+    def _apply_bot_names(self, new_bot_names: tuple[str, ...], shown_bot_names: tuple[str, ...]):
+        """Makes `bot_list_widget` show exactly `new_bot_names`.
+
+        See `_update_bot_list()` for when rows are changed in place and when
+        the list is rebuilt.
+
+        Args:
+            new_bot_names (tuple[str, ...]): The bot names to show, in order.
+            shown_bot_names (tuple[str, ...]): The bot names currently shown.
+        """
+        new_name_set = set(new_bot_names)
+        shown_name_set = set(shown_bot_names)
+        surviving_bot_names = [name for name in shown_bot_names if name in new_name_set]
+        if surviving_bot_names and surviving_bot_names == [
+                name for name in new_bot_names if name in shown_name_set]:
+            # Remove from the bottom up so earlier rows keep their row numbers.
+            for row in range(len(shown_bot_names) - 1, -1, -1):
+                if shown_bot_names[row] not in new_name_set:
+                    self.bot_list_widget.takeItem(row)
+            for row, bot_name_str in enumerate(new_bot_names):
+                if bot_name_str not in shown_name_set:
+                    self._insert_bot_list_row(row, bot_name_str)
+            return
+
+        selected_bot_names = {item.data(Qt.ItemDataRole.UserRole)
+                              for item in self.bot_list_widget.selectedItems()}
         self.bot_list_widget.clear()
-        if chatroom_name:
-            chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
-            if chatroom:
-                for bot in chatroom.list_bots():
-                    # self.bot_list_widget.addItem(QListWidgetItem(bot.get_name())) # Old way
-                    bot_name_str = bot.name  # Ensure it's a string
-                    item_widget = self._create_bot_list_item_widget(
-                        bot_name_str)
-
-                    list_item = QListWidgetItem(self.bot_list_widget)
-                    list_item.setData(Qt.ItemDataRole.UserRole,
-                                      bot_name_str)  # Store bot name
+        for row, bot_name_str in enumerate(new_bot_names):
+            list_item = self._insert_bot_list_row(row, bot_name_str)
+            if bot_name_str in selected_bot_names:
+                list_item.setSelected(True)
 
-                    # Set size hint for the list item to ensure custom widget is displayed correctly
-                    list_item.setSizeHint(item_widget.sizeHint())
+    def _insert_bot_list_row(self, row: int, bot_name: str) -> QListWidgetItem:
+        """Inserts a row for a bot into `bot_list_widget`.
 
-                    self.bot_list_widget.addItem(list_item)
-                    self.bot_list_widget.setItemWidget(list_item, item_widget)
+        Args:
+            row (int): The row to insert at.
+            bot_name (str): The name of the bot, stored under `UserRole`.
 
-        # Update panel state based on whether a chatroom is active
-        self._update_bot_panel_state(chatroom_name is not None and self.chatroom_manager.get_chatroom(
-            chatroom_name) is not None, chatroom_name)
+        Returns:
+            QListWidgetItem: The inserted item.
+        """
+        item_widget = self._create_bot_list_item_widget(bot_name)
 
+        list_item = QListWidgetItem()
+        list_item.setData(Qt.ItemDataRole.UserRole, bot_name)  # Store bot name
+
+        # Set size hint for the list item to ensure custom widget is displayed correctly
+        list_item.setSizeHint(item_widget.sizeHint())
+
+        self.bot_list_widget.insertItem(row, list_item)
+        self.bot_list_widget.setItemWidget(list_item, item_widget)
+        return list_item
+
+    def _schedule_bot_list_refresh(self, chatroom_name: str):
+        """Schedules a single debounced `_update_bot_list()` call.
+
+        Bot mutations call this instead of rebuilding the bot list directly.
+        Each call restarts `_bot_refresh_timer`, so a burst of adds, clones or
+        removals collapses into one rebuild once the burst has been quiet for
+        `_BOT_LIST_REFRESH_DELAY_MS`.
+
+        Args:
+            chatroom_name (str): The chatroom whose bots were changed.
+        """
+        self._bot_refresh_chatroom_names.add(chatroom_name)
+        self._bot_refresh_timer.start()
+
+    def _do_bot_list_refresh(self):
+        """Performs the bot list refresh scheduled by `_schedule_bot_list_refresh()`.
+
+        Only the selected chatroom's bots are shown, so the list is rebuilt
+        only if that chatroom is among those changed during the burst.
+        Changes to other chatrooms need no refresh: selecting one of them
+        rebuilds the bot list anyway.
+        """
+        chatroom_names = self._bot_refresh_chatroom_names
+        self._bot_refresh_chatroom_names = set()
+        current_chatroom_name = self._current_chatroom_name()
+        if current_chatroom_name in chatroom_names:
+            self._update_bot_list(current_chatroom_name)
+
+    @pyqtSlot(QPoint)
     def _show_bot_context_menu(self, position: QPoint):
         """Displays a context menu for selected bot(s) in the bot list.
 
@@ -1253,6 +1661,7 @@ class MainWindow(QMainWindow):
 
         menu.exec(self.bot_list_widget.mapToGlobal(position))
 
+    @pyqtSlot()
     def _edit_selected_bot(self):
         """Handles editing the configuration of the selected bot.
 
@@ -1273,12 +1682,10 @@ class MainWindow(QMainWindow):
             self.logger.error("Selected bot item has no name data.")
             return
 
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
             self.logger.error("No chatroom selected to edit a bot from.")
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:
             self.logger.error(f"Chatroom '{chatroom_name}' not found.")
@@ -1297,13 +1704,13 @@ class MainWindow(QMainWindow):
         # current_model_name = getattr(current_engine_instance, 'model_name', None) # Handle if no model_name
         # current_system_prompt = bot_to_edit.get_system_prompt()
 
-        all_bot_names_in_chatroom = [bot.name for bot in chatroom.list_bots()]
-        existing_bot_names_for_dialog = [
-            name for name in all_bot_names_in_chatroom if name != bot_to_edit.name]
+        existing_bot_names_for_dialog = set(chatroom.bot_names())
+        existing_bot_names_for_dialog.discard(bot_to_edit.name)
 
         dialog = BotInfoDialog(
             existing_bot_names=existing_bot_names_for_dialog,
             aiengine_info_list=self.third_party_group.aiengine_info_list,
+            aiengine_id_to_aiengine_info_dict=self.third_party_group.aiengine_id_to_aiengine_info_dict,
             thirdpartyapikey_query_list=self.thirdpartyapikey_manager.get_available_thirdpartyapikey_query_list(),
             old_bot=bot_to_edit,
             parent=self
@@ -1370,11 +1777,13 @@ class MainWindow(QMainWindow):
             # Explicitly notify chatroom manager about the update for saving
             self.chatroom_manager.notify_chatroom_updated(chatroom)
 
-            self._update_bot_list(chatroom_name)
+            self._schedule_bot_list_refresh(chatroom_name)
+            self._prepare_aiengine_in_background(new_bot.aiengine_id)
             # self._update_bot_response_selector()
         else:
-            self.logger.debug(f"Edit bot '{bot_name_to_edit}' cancelled.")
+            self.logger.debug("Edit bot '%s' cancelled.", bot_name_to_edit)
 
+    @pyqtSlot()
     def _clone_selected_bots(self):
         """Clones the selected bot(s) within the current chatroom.
 
@@ -1391,14 +1800,12 @@ class MainWindow(QMainWindow):
             self.logger.warning("Clone bot(s) called without any selection.")
             return
 
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:  # This should ideally not happen if items are selected from the list tied to a chatroom
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:  # This should ideally not happen if items are selected from the list tied to a chatroom
             self.logger.error("No chatroom selected to clone bots into.")
             QMessageBox.critical(self, self.tr("Error"), self.tr(
                 "No chatroom context for cloning."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:
             self.logger.error(
@@ -1429,7 +1836,7 @@ class MainWindow(QMainWindow):
             copy_number = 1
             # Update the list of existing names within the loop if multiple clones are made from the same original
             # or if multiple bots are selected for cloning in one go.
-            current_existing_names = [bot.name for bot in chatroom.list_bots()]
+            current_existing_names = chatroom.bot_names()
             while clone_name in current_existing_names:
                 clone_name = f"{base_clone_name} {copy_number}"
                 copy_number += 1
@@ -1461,9 +1868,8 @@ class MainWindow(QMainWindow):
                     f"Bot '{original_bot_name}' cloned as '{clone_name}' in chatroom '{chatroom_name}'.")
                 cloned_count += 1
                 # Add the new clone's name to the list for subsequent unique name checks in this loop
-                # This is implicitly handled by `current_existing_names = [bot.get_name() for bot in chatroom.list_bots()]`
-                # at the start of the loop, but if `add_bot` doesn't immediately update the source for `list_bots()`,
-                # this might be needed: current_existing_names.append(clone_name)
+                # This is implicitly handled by `current_existing_names = chatroom.bot_names()`
+                # at the start of the loop, since `add_bot` invalidates the cached names.
             else:
                 self.logger.error(
                     f"Failed to add cloned bot '{clone_name}' to chatroom '{chatroom_name}'. This might be due to a duplicate name if check failed.")
@@ -1471,7 +1877,7 @@ class MainWindow(QMainWindow):
                     "Could not add cloned bot '{0}' to chatroom. It might already exist.").format(clone_name))
 
         if cloned_count > 0:
-            self._update_bot_list(chatroom_name)
+            self._schedule_bot_list_refresh(chatroom_name)
             # self._update_bot_response_selector()
             # chatroom.add_bot should call _notify_chatroom_updated, so an explicit call here might be redundant
             # but ensures saving if multiple bots are added in a loop and add_bot is not immediately saving.
@@ -1485,31 +1891,46 @@ class MainWindow(QMainWindow):
                 "Successfully cloned {0} out of {1} selected bots.").format(cloned_count, len(selected_items)))
         # If cloned_count is 0 and selected_items was not empty, individual errors were already shown.
 
+    def _is_managed_chatroom(self, chatroom: Chatroom) -> bool:
+        """Checks that a chatroom captured earlier is still managed.
+
+        Callbacks of non-modal dialogs hold on to the `Chatroom` object rather
+        than its name, so a rename while the dialog is open is harmless. This
+        check catches the chatroom having been deleted in the meantime.
+
+        Args:
+            chatroom (Chatroom): The chatroom captured when the dialog was opened.
+
+        Returns:
+            bool: True if `chatroom` is still registered with the manager.
+        """
+        return self.chatroom_manager.get_chatroom(chatroom.name) is chatroom
+
+    @pyqtSlot()
     def _delete_selected_bots(self):
         """Deletes the selected bot(s) from the current chatroom.
 
         Triggered by the "Delete" or "Delete Selected Bots" action in the bot
-        context menu. It prompts the user for confirmation before removing
-        the bots. Updates the UI and notifies the user of the outcome.
+        context menu. It prompts the user for confirmation with a non-blocking
+        `QMessageBox` shown via `open()`; the bots are removed, and the user
+        notified of the outcome, in `_on_delete_bots_confirmed()`.
         """
         selected_items = self.bot_list_widget.selectedItems()
         if not selected_items:
             self.logger.warning("Delete bot(s) called without any selection.")
             return
 
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
             self.logger.error("No chatroom selected to delete bots from.")
-            QMessageBox.critical(self, self.tr("Error"), self.tr(
+            self._error(self._tr_error, self.tr(
                 "No chatroom context for deletion."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:
             self.logger.error(
                 f"Chatroom '{chatroom_name}' not found for deleting bots.")
-            QMessageBox.critical(self, self.tr("Error"), self.tr(
+            self._error(self._tr_error, self.tr(
                 "Could not find the current chatroom."))
             return
 
@@ -1522,41 +1943,61 @@ class MainWindow(QMainWindow):
         if not bot_names_to_delete:
             self.logger.error(
                 "Could not retrieve bot names for deletion from selected items.")
-            QMessageBox.warning(self, self.tr("Error"), self.tr(
+            self._warn(self._tr_error, self.tr(
                 "Could not identify bots to delete."))
             return
 
         confirm_message = self.tr("Are you sure you want to delete the selected {0} bot(s)?\n\n{1}").format(
             num_selected, "\n".join(bot_names_to_delete))
-        reply = QMessageBox.question(self, self.tr("Confirm Deletion"), confirm_message,
-                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                     QMessageBox.StandardButton.No)
+        confirm_box = QMessageBox(QMessageBox.Icon.Question, self.tr("Confirm Deletion"), confirm_message,
+                                  QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                  self)
+        confirm_box.setDefaultButton(QMessageBox.StandardButton.No)
+        confirm_box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        confirm_box.finished.connect(
+            lambda result, cr=chatroom, bn=bot_names_to_delete: self._on_delete_bots_confirmed(result, cr, bn))
+        confirm_box.open()
+
+    def _on_delete_bots_confirmed(self, result: int, chatroom: Chatroom, bot_names_to_delete: list[str]):
+        """Removes bots once the confirmation box opened by `_delete_selected_bots()` closes.
 
-        if reply == QMessageBox.StandardButton.No:
+        Args:
+            result (int): The `QMessageBox.StandardButton` value the user clicked.
+            chatroom (Chatroom): The chatroom to delete bots from, captured
+                when the confirmation was opened.
+            bot_names_to_delete (list[str]): The names of the bots to delete.
+        """
+        if result != QMessageBox.StandardButton.Yes.value:
             self.logger.debug("Bot deletion cancelled by user.")
             return
 
+        chatroom_name = chatroom.name
+        if not self._is_managed_chatroom(chatroom):  # Chatroom removed while the confirmation was open
+            self.logger.error(
+                f"Chatroom '{chatroom_name}' not found for deleting bots.")
+            self._error(self._tr_error, self.tr(
+                "Could not find the current chatroom."))
+            return
+
         deleted_count = 0
-        for bot_name in bot_names_to_delete:
-            # remove_bot should notify the manager for saving
-            if chatroom.remove_bot(bot_name):
-                self.logger.info(
-                    f"Bot '{bot_name}' removed from chatroom '{chatroom_name}'.")
-                deleted_count += 1
-            else:
-                self.logger.warning(
-                    f"Failed to remove bot '{bot_name}' from chatroom '{chatroom_name}' (it might have already been removed or not found).")
+        # remove_bot notifies the manager for saving; batch it into one save
+        with chatroom.batch_update():
+            for bot_name in bot_names_to_delete:
+                if chatroom.remove_bot(bot_name):
+                    self.logger.info(
+                        f"Bot '{bot_name}' removed from chatroom '{chatroom_name}'.")
+                    deleted_count += 1
+                else:
+                    self.logger.warning(
+                        f"Failed to remove bot '{bot_name}' from chatroom '{chatroom_name}' (it might have already been removed or not found).")
 
         if deleted_count > 0:
-            self._update_bot_list(chatroom_name)
+            self._schedule_bot_list_refresh(chatroom_name)
             # self._update_bot_response_selector()
-            # Chatroom.remove_bot is expected to call _notify_chatroom_updated.
-            # If it doesn't, an explicit call here would be:
-            # self.chatroom_manager._notify_chatroom_updated(chatroom)
             QMessageBox.information(self, self.tr("Deletion Successful"), self.tr(
                 "{0} bot(s) deleted successfully.").format(deleted_count))
-        elif selected_items:  # Attempted deletion but nothing was actually deleted
-            QMessageBox.warning(self, self.tr("Deletion Failed"), self.tr(
+        else:  # Attempted deletion but nothing was actually deleted
+            self._warn(self.tr("Deletion Failed"), self.tr(
                 "No bots were deleted. They may have already been removed or an error occurred."))
 
     def _create_bot_list_item_widget(self, bot_name: str) -> QWidget:
@@ -1579,8 +2020,8 @@ class MainWindow(QMainWindow):
         # Avatar Placeholder
         avatar_label = QLabel()
         avatar_label.setFixedSize(40, 40)
-        avatar_label.setStyleSheet(
-            "border: 1px solid gray; background-color: lightgray;")
+        # Styled by the rule set once on bot_list_widget
+        avatar_label.setObjectName("botAvatar")
         # Center placeholder text if any
         avatar_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         # You could add text like "Ava" or an icon here if desired
@@ -1618,10 +2059,10 @@ class MainWindow(QMainWindow):
         Args:
             bot_name (str): The name of the bot whose response button was clicked.
         """
-        self.logger.debug(f"Response button clicked for bot: {bot_name}")
+        self.logger.debug("Response button clicked for bot: %s", bot_name)
 
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
             # This case should ideally not be reached if the button is part of a visible list
             # that implies an active chatroom.
             self.logger.warning(
@@ -1629,8 +2070,6 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.tr("Action Failed"), self.tr(
                 "No chatroom is currently selected."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:
             self.logger.error(
@@ -1646,11 +2085,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.tr("Action Failed"),
                                 self.tr("Bot '{0}' seems to have been removed. Please refresh or try again.").format(bot_name))
             # Refresh the list to reflect current state
-            self._update_bot_list(chatroom_name)
+            self._schedule_bot_list_refresh(chatroom_name)
             return
 
         self._trigger_bot_response(bot_name_override=bot_name)
 
+    @pyqtSlot()
     def _add_bot_to_chatroom(self):
         """Initiates adding a new bot to the currently selected chatroom.
 
@@ -1659,84 +2099,78 @@ class MainWindow(QMainWindow):
         duplicates), a list of available AI engine information, and available API
         key queries.
 
-        If the dialog is accepted and returns a valid new `Bot` object:
-        - The new bot is added to the current chatroom using `chatroom.add_bot()`.
-        - The bot list UI is updated.
-        - If adding fails for some reason after dialog acceptance, an error is shown.
+        The dialog is shown with `open()` rather than `exec()`, so no nested
+        event loop is spun while it is visible. The result is handled by
+        `_on_add_bot_dialog_finished()` once the dialog's `finished` signal fires.
         """
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
-            QMessageBox.warning(self, self.tr("Warning"), self.tr(
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
+            self._warn(self._tr_warning, self.tr(
                 "No chatroom selected to add a bot to."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:  # Should not happen if item is selected
-            QMessageBox.critical(self, self.tr("Error"),
-                                 self.tr("Selected chatroom not found."))
+            self._error(self._tr_error,
+                        self.tr("Selected chatroom not found."))
             return
 
-        existing_bot_names_in_chatroom = [
-            bot.name for bot in chatroom.list_bots()]
+        existing_bot_names_in_chatroom = set(chatroom.bot_names())
         dialog = BotInfoDialog(
             existing_bot_names=existing_bot_names_in_chatroom,
             aiengine_info_list=self.third_party_group.aiengine_info_list,
+            aiengine_id_to_aiengine_info_dict=self.third_party_group.aiengine_id_to_aiengine_info_dict,
             thirdpartyapikey_query_list=self.thirdpartyapikey_manager.get_available_thirdpartyapikey_query_list(),
             parent=self
         )
+        dialog.finished.connect(
+            lambda result, d=dialog, cr=chatroom: self._on_add_bot_dialog_finished(result, d, cr))
+        dialog.open()
 
-        if dialog.exec():  # This now uses the overridden accept method for validation
-            # data = dialog.get_data()
-            new_bot = dialog.get_bot()  # This will return None if validation fails
-            if not new_bot:  # Safeguard, should not happen if accept validation passed
-                return
+    def _on_add_bot_dialog_finished(self, result: int, dialog: BotInfoDialog, chatroom: Chatroom):
+        """Handles the result of the `BotInfoDialog` opened by `_add_bot_to_chatroom()`.
 
-            # Bot name validation (emptiness, duplication) is now handled within BotInfoDialog.accept()
-            # bot_name = data["bot_name"] # Already stripped in dialog's get_data or accept
-            # engine_type = data["engine_type"]
-            # model_name = data["model_name"] # Already stripped
-            # system_prompt = data["system_prompt"]
-            # Validation for bot_name (empty, duplicate) is now done in BotInfoDialog.accept()
-
-            # Check if the selected engine type requires an API key by looking at the class constructor
-            # This check is illustrative; a more robust check might involve inspecting constructor parameters
-            # or having a metadata attribute in engine classes.
-            # engine_class = ai_engines.ENGINE_TYPE_TO_CLASS_MAP.get(engine_type)
-
-            # new_bot_aiengine_id = new_bot.aiengine_id
-            # new_bot_thirdpartyapikey_slot_id_list = self.third_party_group.aiengine_id_to_aiengine_info_dict[new_bot_aiengine_id].thirdpartyapikey_slot_id_list
-
-            # thirdpartyapikey_exist = any(map(lambda thirdpartyapikey_slot_id: self.thirdpartyapikey_manager.has_key(thirdpartyapikey_slot_id), new_bot_thirdpartyapikey_slot_id_list))
+        If the dialog was accepted and returns a valid new `Bot` object:
+        - The new bot is added to the chatroom using `chatroom.add_bot()`.
+        - The bot list UI is updated.
+        - If adding fails for some reason after dialog acceptance, an error is shown.
 
-            # thirdpartyapikey = self.thirdpartyapikey_manager.load_key(engine_type)
+        Args:
+            result (int): The dialog result code passed by the `finished` signal.
+            dialog (BotInfoDialog): The dialog that finished. It is scheduled
+                for deletion once its data has been read.
+            chatroom (Chatroom): The chatroom the bot is added to, captured
+                when the dialog was opened.
+        """
+        dialog.deleteLater()
+        chatroom_name = chatroom.name
+        if result != QDialog.DialogCode.Accepted:
+            self.logger.debug(
+                "Add bot to chatroom '%s' cancelled by user in dialog.", chatroom_name)
+            return
 
-            # engine_config = {"engine_type": engine_type, "thirdpartyapikey": thirdpartyapikey if thirdpartyapikey else None}
-            # if model_name:
-            #     engine_config["model_name"] = model_name
+        new_bot = dialog.get_bot()  # This will return None if validation fails
+        if not new_bot:  # Safeguard, should not happen if accept validation passed
+            return
 
-            # try:
-            #     new_bot = create_bot(bot_name=bot_name, system_prompt=system_prompt, engine_config=engine_config)
-            # except ValueError as e:
-            #     self.logger.error(f"Error creating bot '{bot_name}' with engine '{engine_type}': {e}", exc_info=True)
-            #     QMessageBox.critical(self, self.tr("Error Creating Bot"), self.tr("Could not create bot: {0}").format(str(e)))
-            #     return
+        if not self._is_managed_chatroom(chatroom):  # Chatroom removed while the dialog was open
+            self._error(self._tr_error,
+                        self.tr("Selected chatroom not found."))
+            return
 
-            if chatroom.add_bot(new_bot):
-                self.logger.info(
-                    f"Bot '{new_bot.name}' added to chatroom '{chatroom_name}' successfully.")
-                self._update_bot_list(chatroom_name)
-                self.statusBar().showMessage(self.tr("Bot '{0}' added to chatroom '{1}'.").format(new_bot.name, chatroom_name), 5000)
-                # self._update_bot_response_selector()
-            else:
-                self.logger.error(
-                    f"Failed to add bot '{new_bot}' to chatroom '{chatroom_name}' for an unknown reason after initial checks.")
-                QMessageBox.critical(self, self.tr("Error"), self.tr(
-                    "Could not add bot. An unexpected error occurred."))
+        if chatroom.add_bot(new_bot):
+            self.logger.info(
+                f"Bot '{new_bot.name}' added to chatroom '{chatroom_name}' successfully.")
+            self._schedule_bot_list_refresh(chatroom_name)
+            self._prepare_aiengine_in_background(new_bot.aiengine_id)
+            self.statusBar().showMessage(self.tr("Bot '{0}' added to chatroom '{1}'.").format(new_bot.name, chatroom_name), 5000)
+            # self._update_bot_response_selector()
         else:
-            self.logger.debug(
-                f"Add bot to chatroom '{chatroom_name}' cancelled by user in dialog.")
+            self.logger.error(
+                f"Failed to add bot '{new_bot}' to chatroom '{chatroom_name}' for an unknown reason after initial checks.")
+            self._error(self._tr_error, self.tr(
+                "Could not add bot. An unexpected error occurred."))
 
+    @pyqtSlot()
     def _show_thirdpartyapikey_dialog(self):
         """Displays the API Key Management dialog (`ThirdPartyApiKeyDialog`).
 
@@ -1744,9 +2178,9 @@ class MainWindow(QMainWindow):
         available and if a master password has been set (via `password_manager`).
         If these prerequisites are not met (which typically shouldn't happen if
         the application startup sequence is correct), it shows an error message.
-        Otherwise, it creates and executes an `ThirdPartyApiKeyDialog` instance, passing
-        necessary information like available API key slot info and the
-        `thirdpartyapikey_manager`.
+        Otherwise, it shows the `ThirdPartyApiKeyDialog` with `open()`. The
+        dialog is created on first use, with the available API key slot info
+        and the `thirdpartyapikey_manager`, and reused afterwards.
         """
         if not self.encryption_service or not self.password_manager.has_master_password():
             QMessageBox.critical(self, self.tr("Error"), self.tr(
@@ -1754,12 +2188,16 @@ class MainWindow(QMainWindow):
             return
 
         self.logger.debug("Showing API Key Management dialog.")
-        dialog = ThirdPartyApiKeyDialog(
-            thirdpartyapikey_slot_info_list=self.third_party_group.thirdpartyapikey_slot_info_list,
-            thirdpartyapikey_manager=self.thirdpartyapikey_manager,
-            parent=self
-        )
-        dialog.exec()
+        if self._thirdpartyapikey_dialog is None:
+            self._thirdpartyapikey_dialog = ThirdPartyApiKeyDialog(
+                thirdpartyapikey_slot_info_list=self.third_party_group.thirdpartyapikey_slot_info_list,
+                thirdpartyapikey_manager=self.thirdpartyapikey_manager,
+                parent=self
+            )
+        else:
+            # The manager is replaced when all data is cleared
+            self._thirdpartyapikey_dialog.reload(self.thirdpartyapikey_manager)
+        self._thirdpartyapikey_dialog.open()
 
     def _handle_master_password_startup(self) -> bool:
         """Manages master password creation or entry at application launch.
@@ -1845,6 +2283,7 @@ class MainWindow(QMainWindow):
                 return False
         return False  # Fallback, should ideally be covered by above logic
 
+    @pyqtSlot()
     def _show_change_master_password_dialog(self):
         """Manages the process of changing the master password.
 
@@ -1920,6 +2359,11 @@ class MainWindow(QMainWindow):
                                     self.tr("Master password changed successfully. All relevant API keys have been re-encrypted."))
                 self.logger.info(
                     "Master password changed and API keys re-encrypted successfully.")
+            elif self.password_manager.verify_rate_limited:
+                QMessageBox.warning(self, self.tr("Too Many Attempts"), self.tr(
+                    "Too many password attempts. Please wait a few seconds and try again."))
+                self.logger.warning(
+                    "Old password check refused by the rate limit during master password change.")
             else:
                 QMessageBox.critical(self, self.tr(
                     "Error"), self.tr("Incorrect old password."))
@@ -1985,6 +2429,7 @@ class MainWindow(QMainWindow):
 
         self.logger.info("All data clearing actions performed.")
 
+    @pyqtSlot()
     def _clear_all_user_data_via_menu(self):
         """Handles the 'Clear All Stored Data' action from the settings menu.
 
@@ -2054,8 +2499,8 @@ class MainWindow(QMainWindow):
             self.logger.info(
                 "Data cleared and master password setup re-initiated. Refreshing UI.")
             self._update_chatroom_list()  # Will clear messages if no chatroom selected
-            self.message_display_area.clear()  # Explicitly clear current messages
-            self.bot_list_widget.clear()  # Explicitly clear bot list
+            self.message_list_model.clear()  # Explicitly clear current messages
+            self._update_bot_list(None)  # Explicitly clear bot list
             self._update_bot_panel_state(False)
             self._update_message_related_ui_state(False)
             self._update_bot_template_list()  # Refresh template list
@@ -2063,6 +2508,7 @@ class MainWindow(QMainWindow):
             self.logger.info("User cancelled 'Clear All Stored Data' action.")
 
 
+    @pyqtSlot()
     def _show_ccapikey_dialog(self):
         """Displays the CcApiKeyDialog for managing CogniChoir API Keys."""
         if not self.ccapikey_manager:
@@ -2090,26 +2536,32 @@ class MainWindow(QMainWindow):
         if current_item:
             current_selection_id = current_item.data(Qt.ItemDataRole.UserRole)
 
-        self.bot_template_list_widget.clear()
         templates_with_ids = self.bot_template_manager.list_templates_with_ids()
 
-        for template_id, template_bot in templates_with_ids:
-            # Make sure template_bot.name is accessible; if template_bot is a dict, adjust access
-            bot_name = template_bot.name if hasattr(
-                template_bot, 'name') else "Unnamed Template"
-            item_widget = self._create_bot_template_list_item_widget(
-                template_id, bot_name)
-
-            list_item = QListWidgetItem(self.bot_template_list_widget)
-            list_item.setData(Qt.ItemDataRole.UserRole,
-                              template_id)  # Store template_id
+        # Lay out and paint once; the button states are updated below anyway
+        self.bot_template_list_widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.bot_template_list_widget):
+                self.bot_template_list_widget.clear()
+                for template_id, template_bot in templates_with_ids:
+                    # Make sure template_bot.name is accessible; if template_bot is a dict, adjust access
+                    bot_name = template_bot.name if hasattr(
+                        template_bot, 'name') else "Unnamed Template"
+                    item_widget = self._create_bot_template_list_item_widget(
+                        template_id, bot_name)
+
+                    list_item = QListWidgetItem(self.bot_template_list_widget)
+                    list_item.setData(Qt.ItemDataRole.UserRole,
+                                      template_id)  # Store template_id
 
-            list_item.setSizeHint(item_widget.sizeHint())
-            self.bot_template_list_widget.addItem(list_item)
-            self.bot_template_list_widget.setItemWidget(list_item, item_widget)
+                    list_item.setSizeHint(item_widget.sizeHint())
+                    self.bot_template_list_widget.addItem(list_item)
+                    self.bot_template_list_widget.setItemWidget(list_item, item_widget)
 
-            if template_id == current_selection_id:
-                self.bot_template_list_widget.setCurrentItem(list_item)
+                    if template_id == current_selection_id:
+                        self.bot_template_list_widget.setCurrentItem(list_item)
+        finally:
+            self.bot_template_list_widget.setUpdatesEnabled(True)
 
         self._update_template_button_states()
 
@@ -2136,6 +2588,7 @@ class MainWindow(QMainWindow):
         item_widget.setLayout(item_layout)
         return item_widget
 
+    @pyqtSlot(QPoint)
     def _show_bot_template_context_menu(self, position: QPoint):
         selected_items = self.bot_template_list_widget.selectedItems()
         if not selected_items:
@@ -2164,13 +2617,13 @@ class MainWindow(QMainWindow):
         add_to_chat_action = QAction(self.tr("Add to Current Chatroom"), self)
         add_to_chat_action.triggered.connect(
             lambda: self._add_template_to_chatroom(template_id))
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
         # Enable only if a chatroom is selected
-        add_to_chat_action.setEnabled(bool(current_chatroom_item))
+        add_to_chat_action.setEnabled(self._current_chatroom_name() is not None)
         menu.addAction(add_to_chat_action)
 
         menu.exec(self.bot_template_list_widget.mapToGlobal(position))
 
+    @pyqtSlot()
     def _create_bot_template(self):
         self.logger.info("Attempting to create a new bot template.")
         # Pass an empty list for existing_bot_names if template names can be non-unique globally,
@@ -2181,13 +2634,14 @@ class MainWindow(QMainWindow):
         # We will rely on the user to manage meaningful names for templates.
 
         # Get all existing template names to prevent duplicates if desired at this level
-        existing_template_names = [
-            t.name for t in self.bot_template_manager.list_templates()]
+        existing_template_names = {
+            t.name for t in self.bot_template_manager.list_templates()}
 
         dialog = BotInfoDialog(
             # To check for duplicate names among templates
             existing_bot_names=existing_template_names,
             aiengine_info_list=self.third_party_group.aiengine_info_list,
+            aiengine_id_to_aiengine_info_dict=self.third_party_group.aiengine_id_to_aiengine_info_dict,
             thirdpartyapikey_query_list=self.thirdpartyapikey_manager.get_available_thirdpartyapikey_query_list(),
             old_bot=None,  # Creating a new template
             parent=self
@@ -2224,6 +2678,7 @@ class MainWindow(QMainWindow):
         else:
             self.logger.info("Bot template creation cancelled by user.")
 
+    @pyqtSlot()
     def _edit_selected_bot_template(self, template_id_override: str | None = None):
         template_id_to_edit = template_id_override
         if not template_id_to_edit:
@@ -2254,13 +2709,14 @@ class MainWindow(QMainWindow):
             f"Attempting to edit bot template '{template_to_edit.name}' (ID: {template_id_to_edit}).")
 
         # Get all existing template names *excluding* the current one for validation
-        existing_template_names = [
+        existing_template_names = {
             t.name for t_id, t in self.bot_template_manager.list_templates_with_ids() if t_id != template_id_to_edit
-        ]
+        }
 
         dialog = BotInfoDialog(
             existing_bot_names=existing_template_names,  # For duplicate name check
             aiengine_info_list=self.third_party_group.aiengine_info_list,
+            aiengine_id_to_aiengine_info_dict=self.third_party_group.aiengine_id_to_aiengine_info_dict,
             thirdpartyapikey_query_list=self.thirdpartyapikey_manager.get_available_thirdpartyapikey_query_list(),
             old_bot=template_to_edit,  # Pass the existing bot config
             parent=self
@@ -2295,6 +2751,7 @@ class MainWindow(QMainWindow):
             self.logger.info(
                 f"Editing of bot template '{template_to_edit.name}' cancelled by user.")
 
+    @pyqtSlot()
     def _remove_selected_bot_template(self, template_id_override: str | None = None):
         template_id_to_delete = template_id_override
         if not template_id_to_delete:
@@ -2352,13 +2809,11 @@ class MainWindow(QMainWindow):
         self.logger.info(
             f"Attempting to add bot from template ID '{template_id}' to current chatroom.")
 
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
             QMessageBox.warning(self, self.tr("Warning"), self.tr(
                 "No chatroom selected to add the bot to."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:
             self.logger.error(
@@ -2390,8 +2845,7 @@ class MainWindow(QMainWindow):
         base_name = new_bot_instance.name
         bot_name_in_chatroom = base_name
         suffix = 1
-        existing_bot_names_in_chatroom = [
-            bot.name for bot in chatroom.list_bots()]
+        existing_bot_names_in_chatroom = set(chatroom.bot_names())
         while bot_name_in_chatroom in existing_bot_names_in_chatroom:
             bot_name_in_chatroom = f"{base_name} ({suffix})"
             suffix += 1
@@ -2406,7 +2860,8 @@ class MainWindow(QMainWindow):
             self.logger.info(
                 f"Bot '{new_bot_instance.name}' (from template ID '{template_id}') added to chatroom '{chatroom_name}'.")
             # Refresh the bot list for the current chatroom
-            self._update_bot_list(chatroom_name)
+            self._schedule_bot_list_refresh(chatroom_name)
+            self._prepare_aiengine_in_background(new_bot_instance.aiengine_id)
             QMessageBox.information(self, self.tr("Success"),
                                     self.tr("Bot '{0}' added to chatroom '{1}' from template.").format(new_bot_instance.name, chatroom_name))
         else:
@@ -2418,14 +2873,18 @@ class MainWindow(QMainWindow):
 
     def _update_template_button_states(self):
         has_selection = bool(self.bot_template_list_widget.currentItem())
-        self.edit_template_button.setEnabled(has_selection)
-        self.remove_template_button.setEnabled(has_selection)
+        self._apply_ui_state("edit_template_button", has_selection,
+                             self.edit_template_button.setEnabled)
+        self._apply_ui_state("remove_template_button", has_selection,
+                             self.remove_template_button.setEnabled)
         # Add other button state updates if needed
 
+    @pyqtSlot(QListWidgetItem, QListWidgetItem)
     def _on_selected_bot_template_changed(self, _current: QListWidgetItem, _previous: QListWidgetItem):
         self._update_template_button_states()
     # --- End Bot Template Methods ---
 
+    @pyqtSlot(bool)
     def _handle_api_server_toggle(self, is_checked: bool):
         """Handles the toggling of the API server enabled state.
 
@@ -2589,6 +3048,7 @@ class MainWindow(QMainWindow):
         settings.setValue("api_server_enabled_on_startup", self.api_server_enabled_on_startup)
         self.logger.info(f"Saved API server enabled_on_startup: {self.api_server_enabled_on_startup}")
 
+    @pyqtSlot()
     def _show_configure_api_port_dialog(self):
         """
         Displays a dialog to allow the user to configure the API server port.
@@ -2636,20 +3096,18 @@ class MainWindow(QMainWindow):
         - Call `chatroom.remove_bot()`.
         - Update the UI.
         """
-        current_chatroom_item = self.chatroom_list_widget.currentItem()
-        if not current_chatroom_item:
-            QMessageBox.warning(self, self.tr("Warning"),
-                                self.tr("No chatroom selected."))
+        chatroom_name = self._current_chatroom_name()
+        if not chatroom_name:
+            self._warn(self._tr_warning,
+                       self.tr("No chatroom selected."))
             return
-
-        chatroom_name = current_chatroom_item.text()
         chatroom = self.chatroom_manager.get_chatroom(chatroom_name)
         if not chatroom:
             # ERROR - prerequisite failed
             self.logger.error(
                 f"Remove bot: Selected chatroom '{chatroom_name}' not found.")
-            QMessageBox.critical(self, self.tr("Error"),
-                                 self.tr("Selected chatroom not found."))
+            self._error(self._tr_error,
+                        self.tr("Selected chatroom not found."))
             return
 
         # This method is no longer needed as the button is removed.
@@ -2659,19 +3117,19 @@ class MainWindow(QMainWindow):
     def keyPressEvent(self, event):
         # Check if Ctrl+C is pressed, the message display area has focus, and items are selected
         if event.key() == Qt.Key.Key_C and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            if self.message_display_area.hasFocus() and self.message_display_area.selectedItems():
+            if self.message_display_area.hasFocus() and self.message_display_area.selectionModel().hasSelection():
                 self._copy_selected_messages_to_clipboard()
                 event.accept() # Indicate that the event has been handled
                 return
         super().keyPressEvent(event) # Call base class implementation for other keys
 
-    def _chatroom_add_message_handler(self, _event_type: str, chatroom_name: str, _message_data: str):
-        self._update_message_display_qt()
-        current_chatroom_name = self.chatroom_list_widget.currentItem(
-        ).text() if self.chatroom_list_widget.currentItem() else None
+    @pyqtSlot(str, str, object)
+    def _chatroom_add_message_handler(self, _event_type: str, chatroom_name: str, message: MessageData):
+        current_chatroom_name = self._current_chatroom_name()
         if current_chatroom_name == chatroom_name:
+            self._append_message_item(message)
             self.message_input_area.clear()
-        self.statusBar().showMessage(self.tr("Message sent to {0}.").format(chatroom_name), 3000)
+        self.statusBar().showMessage(self._tr_message_sent_to.format(chatroom_name), 3000)
 
     def _event_signal_method(self, event_type, signal, method):
         """
@@ -2687,13 +3145,82 @@ class MainWindow(QMainWindow):
         signal = self._event_type_to_signal_dict.get(event_type, None)
         if not signal:
             return
-        args0 = []
-        for arg in args:
-            if isinstance(arg, BaseModel):
-                args0.append(arg.model_dump_json())
-            else:
-                args0.append(arg)
-        signal.emit(event_type, *args0, **kwargs)
+        # Arguments cross to the GUI thread as they are, with no JSON round
+        # trip; the event payloads (e.g. the frozen MessageData) are immutable.
+        signal.emit(event_type, *args, **kwargs)
+
+
+def _load_qt_base_translator(locale_name: str, target_thread: QThread) -> Optional[QTranslator]:
+    """Loads Qt's own base translations for the given locale.
+
+    Intended to run on a worker thread. On success the translator is moved to
+    `target_thread` so it can be installed from the GUI thread.
+
+    Args:
+        locale_name: The system locale name, e.g. "en_US" or "zh_TW".
+        target_thread: The thread the returned translator should belong to.
+
+    Returns:
+        The loaded QTranslator, or None if no matching translation was found.
+    """
+    qt_translator = QTranslator()
+    language_qm_name = "qtbase_" + locale_name.split('_')[0]
+    candidate_args_list = [
+        (QLocale.system(), "qtbase", "_", _QT_TR_PATH),
+    ]
+    # Try just language e.g. qtbase_en, with a single stat instead of Qt's
+    # probing for the suffixed file names load() would try first
+    if os.path.isfile(os.path.join(_QT_TR_PATH, language_qm_name + ".qm")):
+        candidate_args_list.append((language_qm_name, _QT_TR_PATH))
+    for candidate_args in candidate_args_list:
+        if qt_translator.load(*candidate_args):
+            qt_translator.moveToThread(target_thread)
+            return qt_translator
+    return None
+
+
+def _init_logging() -> logging.handlers.QueueListener:
+    """Sends all log records through a queue to a background file writer.
+
+    The root logger only gets a `QueueHandler`. A log call still merges the
+    message with its arguments on the calling thread, as
+    `QueueHandler.prepare()` does, and then enqueues the record. A
+    `QueueListener` thread applies the file format and writes the record to
+    app.log. The listener is stopped at exit, after it has written every
+    record still queued.
+
+    app.log is capped at `_LOG_FILE_MAX_BYTES` and rolled over to app.log.1,
+    app.log.2, ... up to `_LOG_FILE_BACKUP_COUNT` files. Each run starts a
+    fresh app.log, so the previous run's log is kept as app.log.1.
+
+    The root level is INFO unless `_LOG_LEVEL_ENV_VAR` names another level,
+    so debug calls return before building a record in normal use; set
+    COGNI_LOG_LEVEL=DEBUG to get them.
+
+    Returns:
+        The started QueueListener.
+    """
+    # A size-capped handler always appends, so roll over by hand to start fresh
+    file_handler = logging.handlers.RotatingFileHandler(
+        'app.log',
+        maxBytes=_LOG_FILE_MAX_BYTES,
+        backupCount=_LOG_FILE_BACKUP_COUNT,
+        encoding='utf-8'  # Ensure UTF-8 encoding for log file
+    )
+    if file_handler.stream.tell() > 0:
+        file_handler.doRollover()
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    root_logger = logging.getLogger()
+    log_level = logging.getLevelName(os.environ.get(_LOG_LEVEL_ENV_VAR, "INFO").upper())
+    root_logger.setLevel(log_level if isinstance(log_level, int) else logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    # Registered after logging's own exit hook, so it runs before handlers are closed
+    atexit.register(listener.stop)
+    return listener
 
 
 def main():
@@ -2703,52 +3230,44 @@ def main():
     by loading translation files, creates and shows the MainWindow, and starts
     the application event loop.
     """
-    logging.basicConfig(
-        level=logging.DEBUG,  # Changed to DEBUG
-        format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-        filename='app.log',
-        filemode='w',  # Overwrite log file each time for now, can be changed to 'a' for append
-        encoding='utf-8'  # Ensure UTF-8 encoding for log file
-    )
+    _init_logging()
     logging.info("Application starting")
     app = QApplication(sys.argv)
     app.setStyleSheet("QWidget { font-size: 12pt; }")
 
-    translator = QTranslator()
     # Try to load system locale, fallback to zh_TW for testing, then to nothing
     locale_name = QLocale.system().name()  # e.g., "en_US", "zh_TW"
 
-    # Construct path to i18n directory relative to this script
-    # This assumes i18n is a sibling to the directory containing this script (e.g. src/main/i18n)
-    # More robust path handling might be needed depending on project structure
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    # Corrected path: Assume main_window.py is in src/main/, and i18n is in project_root/i18n/
-    # up to src, then up to project_root
-    project_root = os.path.dirname(os.path.dirname(current_dir))
-    i18n_dir = os.path.join(project_root, "i18n")
+    # Fallback for Qt's own standard dialog translations (e.g. "Cancel", "OK").
+    # Load them on a worker thread while the app's own translations load
+    # below; both must be installed before MainWindow() runs the master
+    # password startup, whose dialogs and message boxes use these buttons.
+    qt_translator_executor = ThreadPoolExecutor(max_workers=1)
+    qt_translator_future = qt_translator_executor.submit(
+        _load_qt_base_translator, locale_name, app.thread())
+
+    translator = QTranslator()
+    i18n_dir = _I18N_DIR
 
     # translation_loaded = False
-    # Try specific locale first
-    # e.g. app_zh_TW.qm or app_en_US.qm
-    if translator.load(locale_name, "app", "_", i18n_dir):
-        QApplication.installTranslator(translator)
-        # translation_loaded = True
-    # Fallback to zh_TW if system locale not found or different
+    # Try specific locale first, e.g. app_zh_TW.qm or app_en_US.qm, then
+    # fall back to zh_TW. Each candidate is checked with a single stat so
+    # QTranslator.load() does not probe for files that are not there.
+    # Loading by file name lets Qt memory-map the .qm file itself; reading
+    # it into a Python buffer first would only add a copy.
+    app_qm_candidates = [os.path.join(i18n_dir, f"app_{locale_name}.qm")]
     # Avoid double loading if system is zh_TW
-    elif locale_name != "zh_TW" and translator.load("app_zh_TW", i18n_dir):
-        QApplication.installTranslator(translator)
-        # translation_loaded = True
-
-    # Fallback for Qt's own standard dialog translations (e.g. "Cancel", "OK")
-    qt_translator = QTranslator()
-    # Try to find Qt's base translations, often in a path like /usr/share/qt6/translations/
-    # QLibraryInfo.path(QLibraryInfo.LibraryPath.TranslationsPath) is the most reliable way
-    qt_translations_path = QLibraryInfo.path(
-        QLibraryInfo.LibraryPath.TranslationsPath)
-    if qt_translator.load(QLocale.system(), "qtbase", "_", qt_translations_path):
-        QApplication.installTranslator(qt_translator)
-    # Try just language e.g. qtbase_en
-    elif qt_translator.load("qtbase_" + locale_name.split('_')[0], qt_translations_path):
+    if locale_name != "zh_TW":
+        app_qm_candidates.append(os.path.join(i18n_dir, "app_zh_TW.qm"))
+    for qm_path in app_qm_candidates:
+        if os.path.isfile(qm_path) and translator.load(qm_path):
+            QApplication.installTranslator(translator)
+            # translation_loaded = True
+            break
+
+    qt_translator = qt_translator_future.result()
+    qt_translator_executor.shutdown(wait=False)
+    if qt_translator is not None:
         QApplication.installTranslator(qt_translator)
 
     main_window = MainWindow()
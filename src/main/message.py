@@ -1,14 +1,16 @@
-"""Defines the Message class used for representing chat messages.
+"""Defines the MessageData class used for representing chat messages.
 
-This module contains the `Message` class, which encapsulates the sender,
+This module contains the `MessageData` class, the single message type used
+throughout the application, which encapsulates the sender,
 content, and timestamp of a message within the chat application. It provides
 methods for string representation, conversion to dictionary for serialization,
 and creation from a dictionary for deserialization.
 """
-import datetime
-# from dataclasses import dataclass
+import functools
+import sys
+import time
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
 
 class MessageData(BaseModel):
     """Represents a single message in a chatroom.
@@ -17,23 +19,69 @@ class MessageData(BaseModel):
         sender (str): The name of the entity (user or bot) that sent the message.
         content (str): The textual content of the message.
         timestamp (float): The UNIX timestamp indicating when the message was created.
+
+    Messages are immutable once created, which is what lets `display_string`
+    be cached on the instance.
     """
+    model_config = ConfigDict(frozen=True)
+
     sender: str
     content: str
     timestamp: float
 
+    @field_validator("sender")
+    @classmethod
+    def _intern_sender(cls, sender: str) -> str:
+        """Interns the sender name.
+
+        A history holds many messages but only a few distinct senders, so
+        every message from the same sender, including ones loaded from JSON,
+        shares one string object.
+        """
+        return sys.intern(sender)
+
+    @functools.cached_property
+    def timestamp_string(self) -> str:
+        """The timestamp as local time in '%Y-%m-%d %H:%M:%S' form, formatted once per message."""
+        # time.localtime() fills a C struct_time, no datetime object is built
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.timestamp))
+
     def __str__(self) -> str:
         """Returns a string representation of the message, including timestamp, sender, and content."""
-        return f"[{datetime.datetime.fromtimestamp(self.timestamp).strftime('%Y-%m-%d %H:%M:%S')}] {self.sender}: {self.content}"
+        return f"[{self.timestamp_string}] {self.sender}: {self.content}"
 
-    def to_display_string(self) -> str:
-        """Returns a string suitable for displaying the message in the UI.
+    @functools.cached_property
+    def display_string(self) -> str:
+        """The string shown for this message in the UI, formatted once per message.
 
-        Currently, this is the same as `__str__`.
+        Currently, this is the same as `__str__`. The model is frozen, so the
+        formatted string is kept on the instance.
         """
         # For now, same as __str__. Can be customized later for UI if needed.
         return str(self)
 
+    def to_display_string(self) -> str:
+        """Returns a string suitable for displaying the message in the UI.
+
+        Returns:
+            The cached `display_string`.
+        """
+        return self.display_string
+
+    @functools.cached_property
+    def stripped_content(self) -> str:
+        """The content without surrounding whitespace, as sent to AI engines; stripped once per message."""
+        return self.content.strip()
+
+    @functools.cached_property
+    def attributed_content(self) -> str:
+        """The stripped content headed by "<sender> said:", as AI engines are shown other speakers' messages.
+
+        Built once per message, so resending the same history to a bot does
+        not format it again.
+        """
+        return f'{self.sender} said:\n{self.stripped_content}'
+
     def to_dict(self) -> dict:
         """Serializes the message to a dictionary.
 
@@ -51,7 +99,7 @@ class MessageData(BaseModel):
                   "content", and "timestamp".
 
         Returns:
-            A `Message` instance created from the provided data.
+            A `MessageData` instance created from the provided data.
         """
         return MessageData(sender=data["sender"], content=data["content"], timestamp=data["timestamp"])
 
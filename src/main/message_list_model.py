@@ -0,0 +1,117 @@
+"""List model backing the chat message view in the main window.
+
+`MessageListModel` exposes a chatroom's messages to a `QListView`, so only
+the rows that are actually visible are laid out and painted, and individual
+messages can be inserted or removed without rebuilding the whole list.
+"""
+from typing import Iterable
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from .message import MessageData
+
+
+class MessageListModel(QAbstractListModel):
+    """A read-only list model of chat messages, ordered by timestamp.
+
+    The display role returns the message's display string and
+    `Qt.ItemDataRole.UserRole` returns the `MessageData` itself. Messages are expected to arrive in
+    timestamp order; the model does not sort them itself.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes an empty MessageListModel.
+
+        Args:
+            parent: The parent QObject, if any.
+        """
+        super().__init__(parent)
+        self._messages: list[MessageData] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # pylint: disable=invalid-name
+        """Returns the number of messages; zero for any valid parent, as this is a flat list."""
+        if parent.isValid():
+            return 0
+        return len(self._messages)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Returns the data stored under the given role for the message at `index`.
+
+        Args:
+            index (QModelIndex): The index of the message.
+            role (int): The requested data role.
+
+        Returns:
+            The display string for `DisplayRole`, the `MessageData` for
+            `UserRole`, or None for any other role or an invalid index.
+        """
+        if not index.isValid() or not 0 <= index.row() < len(self._messages):
+            return None
+        message = self._messages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return message.display_string + '\n'
+        if role == Qt.ItemDataRole.UserRole:
+            return message
+        return None
+
+    def message_at(self, row: int) -> MessageData:
+        """Returns the message shown in the given row.
+
+        Args:
+            row (int): The row of the message.
+
+        Returns:
+            MessageData: The message at `row`.
+        """
+        return self._messages[row]
+
+    def set_messages(self, messages: Iterable[MessageData]):
+        """Replaces all messages in the model.
+
+        Args:
+            messages (Iterable[MessageData]): The messages to show, already
+                ordered by timestamp as `Chatroom.get_messages()` returns
+                them. The caller's list is copied, not kept.
+        """
+        self.beginResetModel()
+        self._messages = list(messages)
+        self.endResetModel()
+
+    def append_message(self, message: MessageData):
+        """Appends a single message as a new last row.
+
+        Args:
+            message (MessageData): The message to append. It is expected to
+                be at least as recent as the current last message.
+        """
+        row = len(self._messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._messages.append(message)
+        self.endInsertRows()
+
+    def remove_rows(self, rows: Iterable[int]):
+        """Removes the given rows, one contiguous run at a time.
+
+        Args:
+            rows (Iterable[int]): The rows to remove. Duplicates are ignored.
+        """
+        # Remove from the bottom up so earlier runs keep their row numbers.
+        sorted_rows = sorted(set(rows), reverse=True)
+        run_start = 0
+        while run_start < len(sorted_rows):
+            run_end = run_start
+            while run_end + 1 < len(sorted_rows) and sorted_rows[run_end + 1] == sorted_rows[run_end] - 1:
+                run_end += 1
+            first, last = sorted_rows[run_end], sorted_rows[run_start]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._messages[first:last + 1]
+            self.endRemoveRows()
+            run_start = run_end + 1
+
+    def clear(self):
+        """Removes all messages from the model."""
+        if not self._messages:
+            return
+        self.beginResetModel()
+        self._messages = []
+        self.endResetModel()
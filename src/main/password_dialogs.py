@@ -4,12 +4,55 @@ This module provides dialog classes for creating, entering, and changing
 the master password used to secure sensitive data within the application.
 These dialogs handle user input and basic validation.
 """
-import sys
 from PyQt6.QtWidgets import (
-    QApplication, QDialog, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout,
+    QDialog, QFormLayout, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout,
     QLabel, QMessageBox
 )
-from PyQt6.QtCore import Qt # Required for Qt.AlignmentFlag
+from PyQt6.QtCore import Qt, QEvent, QObject # Qt for Qt.AlignmentFlag
+
+_ERROR_LABEL_STYLE = "color: red;"
+_LINK_BUTTON_STYLE = "color: blue; text-decoration: underline;"
+
+
+def _create_password_input() -> QLineEdit:
+    """Creates a line edit that masks its input as a password."""
+    line_edit = QLineEdit()
+    line_edit.setEchoMode(QLineEdit.EchoMode.Password)
+    return line_edit
+
+
+class _ReturnKeyFilter(QObject):
+    """Event filter that handles Enter in a dialog's password fields.
+
+    Enter in each field focuses the next one, and Enter in the last field
+    calls the dialog's `accept` directly. The key press is consumed, so it
+    does not also reach QDialog's default button handling and submit the
+    dialog a second time. Enter on a focused button is left to Qt.
+    """
+    def __init__(self, dialog: QDialog, inputs: list[QLineEdit]):
+        """Installs the filter on every password field of `dialog`.
+
+        Args:
+            dialog (QDialog): The dialog owning the fields; also the filter's parent.
+            inputs (list[QLineEdit]): The password fields, in tab order.
+        """
+        super().__init__(dialog)
+        self._dialog = dialog
+        self._input_to_next_dict = dict(zip(inputs, inputs[1:]))
+        for line_edit in inputs:
+            line_edit.installEventFilter(self)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # pylint: disable=invalid-name
+        """Moves on or submits when Enter is pressed in a password field."""
+        if event.type() != QEvent.Type.KeyPress or event.key() not in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            return False
+        next_input = self._input_to_next_dict.get(watched)
+        if next_input is None:
+            self._dialog.accept()
+        else:
+            next_input.setFocus()
+        return True
+
 
 class CreateMasterPasswordDialog(QDialog):
     """A dialog for users to create a new master password.
@@ -38,20 +81,15 @@ class CreateMasterPasswordDialog(QDialog):
         info_label = QLabel("Create a new master password to secure your API keys.")
         layout.addWidget(info_label)
 
-        password_label = QLabel("Password:")
-        self.password_input = QLineEdit()
-        self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(password_label)
-        layout.addWidget(self.password_input)
-
-        confirm_password_label = QLabel("Confirm Password:")
-        self.confirm_password_input = QLineEdit()
-        self.confirm_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(confirm_password_label)
-        layout.addWidget(self.confirm_password_input)
+        self.password_input = _create_password_input()
+        self.confirm_password_input = _create_password_input()
+        form_layout = QFormLayout()
+        form_layout.addRow("Password:", self.password_input)
+        form_layout.addRow("Confirm Password:", self.confirm_password_input)
+        layout.addLayout(form_layout)
 
         self.error_label = QLabel()
-        self.error_label.setStyleSheet("color: red;")
+        self.error_label.setStyleSheet(_ERROR_LABEL_STYLE)
         layout.addWidget(self.error_label)
 
         button_layout = QHBoxLayout()
@@ -64,6 +102,7 @@ class CreateMasterPasswordDialog(QDialog):
 
         self.ok_button.clicked.connect(self.accept)
         self.cancel_button.clicked.connect(self.reject)
+        _ReturnKeyFilter(self, [self.password_input, self.confirm_password_input])
 
     def accept(self):
         """Handles the OK button click and validates the password fields.
@@ -124,14 +163,13 @@ class EnterMasterPasswordDialog(QDialog):
         info_label = QLabel("Enter your master password to unlock API keys.")
         layout.addWidget(info_label)
 
-        password_label = QLabel("Master Password:")
-        self.password_input = QLineEdit()
-        self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(password_label)
-        layout.addWidget(self.password_input)
+        self.password_input = _create_password_input()
+        form_layout = QFormLayout()
+        form_layout.addRow("Master Password:", self.password_input)
+        layout.addLayout(form_layout)
 
         self.error_label = QLabel()
-        self.error_label.setStyleSheet("color: red;")
+        self.error_label.setStyleSheet(_ERROR_LABEL_STYLE)
         layout.addWidget(self.error_label)
 
         button_layout = QHBoxLayout()
@@ -142,7 +180,7 @@ class EnterMasterPasswordDialog(QDialog):
         layout.addLayout(button_layout)
 
         self.forgot_password_button = QPushButton("Forgot Password? Clear all data")
-        self.forgot_password_button.setStyleSheet("color: blue; text-decoration: underline;") # Make it look like a link
+        self.forgot_password_button.setStyleSheet(_LINK_BUTTON_STYLE) # Make it look like a link
         self.forgot_password_button.setFlat(True) # Remove button border
         layout.addWidget(self.forgot_password_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -150,6 +188,7 @@ class EnterMasterPasswordDialog(QDialog):
         self.ok_button.clicked.connect(self.accept)
         self.cancel_button.clicked.connect(self.reject)
         self.forgot_password_button.clicked.connect(self._handle_forgot_password)
+        _ReturnKeyFilter(self, [self.password_input])
 
 
     def accept(self):
@@ -229,26 +268,17 @@ class ChangeMasterPasswordDialog(QDialog):
         info_label = QLabel("Enter your old password and set a new one.")
         layout.addWidget(info_label)
 
-        old_password_label = QLabel("Old Password:")
-        self.old_password_input = QLineEdit()
-        self.old_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(old_password_label)
-        layout.addWidget(self.old_password_input)
-
-        new_password_label = QLabel("New Password:")
-        self.new_password_input = QLineEdit()
-        self.new_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(new_password_label)
-        layout.addWidget(self.new_password_input)
-
-        confirm_new_password_label = QLabel("Confirm New Password:")
-        self.confirm_new_password_input = QLineEdit()
-        self.confirm_new_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(confirm_new_password_label)
-        layout.addWidget(self.confirm_new_password_input)
+        self.old_password_input = _create_password_input()
+        self.new_password_input = _create_password_input()
+        self.confirm_new_password_input = _create_password_input()
+        form_layout = QFormLayout()
+        form_layout.addRow("Old Password:", self.old_password_input)
+        form_layout.addRow("New Password:", self.new_password_input)
+        form_layout.addRow("Confirm New Password:", self.confirm_new_password_input)
+        layout.addLayout(form_layout)
 
         self.error_label = QLabel()
-        self.error_label.setStyleSheet("color: red;")
+        self.error_label.setStyleSheet(_ERROR_LABEL_STYLE)
         layout.addWidget(self.error_label)
 
         button_layout = QHBoxLayout()
@@ -260,6 +290,8 @@ class ChangeMasterPasswordDialog(QDialog):
 
         self.ok_button.clicked.connect(self.accept)
         self.cancel_button.clicked.connect(self.reject)
+        _ReturnKeyFilter(
+            self, [self.old_password_input, self.new_password_input, self.confirm_new_password_input])
 
     def accept(self):
         """Handles the OK button click and validates the password fields.
@@ -300,6 +332,9 @@ class ChangeMasterPasswordDialog(QDialog):
 
 
 if __name__ == '__main__':
+    import sys
+    from PyQt6.QtWidgets import QApplication
+
     app = QApplication(sys.argv)
 
     print("Testing CreateMasterPasswordDialog...")
@@ -1,24 +1,40 @@
 import os
 import json
 import hashlib
-import binascii
 import hmac
+import time
 
 DEFAULT_MASTER_KEY_FILE = os.path.join("data", "master_key.json")
 
+# Key derivation functions, as recorded under "kdf" in the master key file.
+# Files written before the "kdf" entry existed use PBKDF2.
+KDF_PBKDF2_SHA256 = "pbkdf2_sha256"
+KDF_SCRYPT = "scrypt"
+
+# Token bucket bounding how many key derivations verify_master_password runs:
+# up to _VERIFY_BURST back to back, then _VERIFY_REFILL_PER_SECOND. Attempts
+# over the limit fail at once without deriving a key, even for the correct
+# password; callers check `verify_rate_limited` to tell the user to wait.
+_VERIFY_BURST = 5.0
+_VERIFY_REFILL_PER_SECOND = 1.0
+
 class PasswordManager:
     """Manages the lifecycle of a master password for the application.
 
     This class handles the storage, verification, and management of a master
-    password. The password hash and salt are stored in a JSON file.
-    It uses PBKDF2 HMAC SHA256 for password hashing and securely compares
-    hashes using `hmac.compare_digest`.
+    password. The password hash, salt and key derivation function are stored
+    in a JSON file. New passwords are hashed with scrypt; passwords stored by
+    older versions keep using PBKDF2 HMAC SHA256 until they are changed.
+    Hashes are compared securely using `hmac.compare_digest`.
 
     Attributes:
         hashed_password (Optional[bytes]): The hashed master password, loaded
             from `MASTER_KEY_FILE` or None if not set.
         salt (Optional[bytes]): The salt used for hashing, loaded from
             `MASTER_KEY_FILE` or None if not set.
+        kdf (Optional[str]): The key derivation function `hashed_password`
+            was derived with, `KDF_SCRYPT` or `KDF_PBKDF2_SHA256`, or None if
+            not set.
     """
 
     def __init__(self, master_key_file: str = DEFAULT_MASTER_KEY_FILE):
@@ -30,22 +46,36 @@ class PasswordManager:
         self._master_key_file = master_key_file
         self.hashed_password: bytes | None = None
         self.salt: bytes | None = None
+        self.kdf: str | None = None
+        # (probe, derived key) of the last password checked against `salt`,
+        # so repeated verifications skip the key derivation. Kept in memory only.
+        self._verify_cache: tuple[bytes, bytes] | None = None
+        # (last refill time, tokens) of the verification rate limit.
+        self._verify_bucket: tuple[float, float] = (time.monotonic(), _VERIFY_BURST)
+        # Whether the last verify_master_password call was refused by the rate limit.
+        self.verify_rate_limited = False
+        self._master_key_dir_ready = False
         self._load_master_key_data()
 
     def _load_master_key_data(self):
         """Loads master key data (hashed password and salt) from storage.
 
-        Reads `MASTER_KEY_FILE`, decodes hex-encoded values for
-        `hashed_password` and `salt`. Handles `FileNotFoundError`,
-        `json.JSONDecodeError`, or `KeyError` by leaving attributes as `None`
-        and printing an error message.
+        Opens `MASTER_KEY_FILE` directly (a missing file simply means no
+        master password is set), decodes hex-encoded values for
+        `hashed_password` and `salt` and reads `kdf`, defaulting to PBKDF2
+        for files that predate it. Handles `FileNotFoundError`,
+        `json.JSONDecodeError`, `KeyError`, or an unknown `kdf` by leaving
+        attributes as `None` and printing an error message.
         """
         try:
-            if os.path.exists(self._master_key_file):
-                with open(self._master_key_file, 'r') as f:
-                    data = json.load(f)
-                    self.hashed_password = binascii.unhexlify(data['hashed_password'])
-                    self.salt = binascii.unhexlify(data['salt'])
+            with open(self._master_key_file, 'r') as f:
+                data = json.load(f)
+            kdf = data.get('kdf', KDF_PBKDF2_SHA256)
+            if kdf not in (KDF_PBKDF2_SHA256, KDF_SCRYPT):
+                raise KeyError(f"unknown kdf {kdf!r}")
+            self.hashed_password = bytes.fromhex(data['hashed_password'])
+            self.salt = bytes.fromhex(data['salt'])
+            self.kdf = kdf
         except FileNotFoundError:
             # File not found, master key not set yet.
             pass
@@ -54,25 +84,41 @@ class PasswordManager:
             print(f"Error loading master key data: {e}")
             self.hashed_password = None
             self.salt = None
+            self.kdf = None
 
     def _save_master_key_data(self):
         """Saves the current master key data (hashed password and salt) to storage.
 
-        Ensures the "data" directory exists. If `hashed_password` and `salt`
-        are set, they are hex-encoded and stored in `MASTER_KEY_FILE` as a
-        JSON object. If they are `None` (e.g., after `clear_master_password`),
-        `MASTER_KEY_FILE` is deleted if it exists. Handles potential `IOError`
-        or `OSError` during file operations.
+        Ensures the "data" directory exists the first time it saves. If
+        `hashed_password` and `salt` are set, they are hex-encoded and
+        stored in `MASTER_KEY_FILE` as a JSON object: the serialised bytes
+        are written in one call to a temporary file readable only by the
+        owner, which then atomically replaces `MASTER_KEY_FILE`, so a crash
+        never leaves a partially written key file. If they are `None`
+        (e.g., after `clear_master_password`), `MASTER_KEY_FILE` is deleted
+        if it exists. Handles potential `IOError` or `OSError` during file
+        operations.
         """
-        os.makedirs(os.path.dirname(self._master_key_file), exist_ok=True)
         try:
+            if not self._master_key_dir_ready:
+                os.makedirs(os.path.dirname(self._master_key_file) or '.', exist_ok=True)
+                self._master_key_dir_ready = True
             if self.hashed_password and self.salt:
-                data = {
-                    'hashed_password': binascii.hexlify(self.hashed_password).decode('utf-8'),
-                    'salt': binascii.hexlify(self.salt).decode('utf-8'),
-                }
-                with open(self._master_key_file, 'w') as f:
-                    json.dump(data, f)
+                payload = json.dumps({
+                    'hashed_password': self.hashed_password.hex(),
+                    'salt': self.salt.hex(),
+                    'kdf': self.kdf,
+                }).encode('utf-8')
+                tmp_file = self._master_key_file + '.tmp'
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(payload)
+                    os.replace(tmp_file, self._master_key_file)
+                except OSError:
+                    if os.path.exists(tmp_file):
+                        os.remove(tmp_file)
+                    raise
             else:
                 if os.path.exists(self._master_key_file):
                     try:
@@ -86,10 +132,12 @@ class PasswordManager:
 
 
     def _hash_password(self, password: str, salt: bytes) -> bytes:
-        """Hashes a password using PBKDF2-HMAC-SHA256.
+        """Hashes a password with the key derivation function in `kdf`.
 
-        The iteration count is reduced if the `CI_TEST_MODE` environment
-        variable is set to 'true'.
+        scrypt (N=2**14, r=8, p=1) is memory-hard and takes about as long as
+        the PBKDF2-HMAC-SHA256 (100000 iterations) used by older files. The
+        work factors are reduced if the `CI_TEST_MODE` environment variable
+        is set to 'true'.
 
         Args:
             password (str): The password string to hash.
@@ -98,14 +146,35 @@ class PasswordManager:
         Returns:
             bytes: The derived hashed password.
         """
-        # Reduce iterations in test mode to speed up tests
-        iterations = 1 if os.environ.get('CI_TEST_MODE') == 'true' else 100000
-        return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations, dklen=64)
+        # Reduce work factors in test mode to speed up tests
+        test_mode = os.environ.get('CI_TEST_MODE') == 'true'
+        if self.kdf == KDF_PBKDF2_SHA256:
+            iterations = 1 if test_mode else 100000
+            return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations, dklen=64)
+        n = 2 if test_mode else 2 ** 14
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=8, p=1, dklen=64)
+
+    @staticmethod
+    def _verify_probe(password: str, salt: bytes) -> bytes:
+        """Returns a cheap keyed digest identifying a (password, salt) pair.
+
+        Used only as the in-memory lookup key of the verification cache; the
+        stored hash is still derived with `_hash_password`.
+
+        Args:
+            password (str): The password being verified.
+            salt (bytes): The salt of the stored master password.
+
+        Returns:
+            bytes: A 16-byte BLAKE2b digest of the password keyed by the salt.
+        """
+        return hashlib.blake2b(password.encode('utf-8'), key=salt, digest_size=16).digest()
 
     def set_master_password(self, password: str) -> bool:
         """Sets or updates the master password.
 
-        A new salt is generated, the password is hashed, and the data is saved.
+        A new salt is generated, the password is hashed with scrypt, and the
+        data is saved.
         If a master password already exists, this method effectively overwrites it
         by generating a new salt and hash.
 
@@ -121,7 +190,9 @@ class PasswordManager:
         if not password:
             raise ValueError("Password cannot be empty.")
         self.salt = os.urandom(16)
+        self.kdf = KDF_SCRYPT
         self.hashed_password = self._hash_password(password, self.salt)
+        self._verify_cache = None
         self._save_master_key_data()
         return True
 
@@ -129,7 +200,12 @@ class PasswordManager:
         """Verifies a given password against the stored master password.
 
         Hashes the provided password using the stored salt and compares it
-        securely against the stored hashed password.
+        securely against the stored hashed password. The derived key of the
+        last verified password is cached in memory, so verifying the same
+        password again does not repeat the key derivation. Key derivations
+        are rate limited: an attempt over the limit returns False at once,
+        without deriving a key and even if the password is correct, and sets
+        `verify_rate_limited` so the caller can ask the user to wait.
 
         Args:
             password (str): The password to verify.
@@ -138,6 +214,7 @@ class PasswordManager:
             bool: True if the password matches the stored master password,
                   False otherwise or if no master password is set.
         """
+        self.verify_rate_limited = False
         if not self.has_master_password():
             return False
         # Type guard for salt, as has_master_password ensures it's not None
@@ -145,7 +222,17 @@ class PasswordManager:
         if current_salt is None: # Should not be reached if has_master_password is True
              return False
 
-        hashed_input_password = self._hash_password(password, current_salt)
+        probe = self._verify_probe(password, current_salt)
+        cache = self._verify_cache
+        if cache is not None and hmac.compare_digest(cache[0], probe):
+            hashed_input_password = cache[1]
+        else:
+            if not self._take_verify_token():
+                # Rejected without checking, so a correct password fails too
+                self.verify_rate_limited = True
+                return False
+            hashed_input_password = self._hash_password(password, current_salt)
+            self._verify_cache = (probe, hashed_input_password)
         # Use hmac.compare_digest for compatibility with older Python versions
         # and for secure comparison against timing attacks.
         # Type guard for hashed_password
@@ -154,6 +241,22 @@ class PasswordManager:
             return False
         return hmac.compare_digest(current_hashed_password, hashed_input_password)
 
+    def _take_verify_token(self) -> bool:
+        """Refills the verification token bucket and takes one token from it.
+
+        Returns:
+            bool: True if a token was available, False if the rate limit is
+                  exhausted.
+        """
+        last_refill, tokens = self._verify_bucket
+        now = time.monotonic()
+        tokens = min(_VERIFY_BURST, tokens + (now - last_refill) * _VERIFY_REFILL_PER_SECOND)
+        if tokens < 1.0:
+            self._verify_bucket = (now, tokens)
+            return False
+        self._verify_bucket = (now, tokens - 1.0)
+        return True
+
     def has_master_password(self) -> bool:
         """Checks if a master password (hash and salt) is currently set and loaded.
 
@@ -189,14 +292,22 @@ class PasswordManager:
     def clear_master_password(self):
         """Clears the current master password from memory and storage.
 
-        Sets `hashed_password` and `salt` attributes to `None` and deletes
-        the `MASTER_KEY_FILE` from disk.
+        Sets `hashed_password`, `salt` and `kdf` attributes to `None` and
+        deletes the `MASTER_KEY_FILE` from disk.
         """
         self.hashed_password = None
         self.salt = None
+        self.kdf = None
+        self._verify_cache = None
         self._save_master_key_data()
 
 if __name__ == '__main__':
+    import sys
+
+    if '--fast' in sys.argv[1:]:
+        # Use the reduced test-mode work factors for a quick smoke run.
+        os.environ.setdefault('CI_TEST_MODE', 'true')
+
     pm = PasswordManager()
 
     if not pm.has_master_password():
@@ -275,77 +386,3 @@ if __name__ == '__main__':
         print(f"Directory {data_dir} does not exist or was already removed.")
 
     print("Cleanup process finished.")
-
-    print("No master password set. Setting one now.")
-    pm.set_master_password("StrongPassword123!")
-    print("Master password set.")
-
-    print("\nVerifying master password:")
-    if pm.verify_master_password("StrongPassword123!"):
-        print("Password verification successful.")
-    else:
-        print("Password verification failed.")
-
-    print("\nChanging master password:")
-    if pm.change_master_password("StrongPassword123!", "EvenStrongerPassword456!"):
-        print("Master password changed successfully.")
-        # Verify with the new password
-        if pm.verify_master_password("EvenStrongerPassword456!"):
-            print("New password verification successful.")
-        else:
-            print("New password verification failed.")
-    else:
-        print("Failed to change master password. Old password might be incorrect.")
-
-    print("\nClearing master password.")
-    pm.clear_master_password()
-    if not pm.has_master_password():
-        print("Master password cleared successfully.")
-    else:
-        print("Failed to clear master password.")
-
-    # Test setting password again after clearing
-    print("\nSetting master password again after clearing.")
-    pm.set_master_password("NewPassword789!")
-    if pm.has_master_password() and pm.verify_master_password("NewPassword789!"):
-        print("Master password set and verified successfully after clearing.")
-    else:
-        print("Failed to set/verify master password after clearing.")
-
-    # Final cleanup
-    print("\nPerforming final cleanup...")
-    pm.clear_master_password() # Ensure the master_key.json is deleted by the manager
-
-    data_dir = os.path.dirname(DEFAULT_MASTER_KEY_FILE)
-    gitkeep_file = os.path.join(data_dir, ".gitkeep")
-
-    if os.path.exists(gitkeep_file):
-        try:
-            os.remove(gitkeep_file)
-            print(f"Removed {gitkeep_file}.")
-        except OSError as e:
-            print(f"Error removing {gitkeep_file}: {e}")
-
-    # master_key.json should have been deleted by pm.clear_master_password()
-    # but check and remove if it still exists for any reason.
-    if os.path.exists(DEFAULT_MASTER_KEY_FILE):
-        print(f"Warning: {DEFAULT_MASTER_KEY_FILE} still exists after clear. Attempting removal again.")
-        try:
-            os.remove(DEFAULT_MASTER_KEY_FILE)
-        except OSError as e:
-            print(f"Error removing {DEFAULT_MASTER_KEY_FILE} during cleanup: {e}")
-
-    if os.path.exists(data_dir):
-        try:
-            # Attempt to remove the directory
-            os.rmdir(data_dir)
-            print(f"Directory {data_dir} removed successfully.")
-        except OSError as e:
-            print(f"Error removing directory {data_dir}: {e}")
-            # If rmdir failed, list contents to see what's left
-            if os.path.exists(data_dir):
-                print(f"Final check: Contents of {data_dir} after failed rmdir: {os.listdir(data_dir)}")
-    else:
-        print(f"Directory {data_dir} does not exist or was already removed.")
-
-    print("Cleanup process finished.")
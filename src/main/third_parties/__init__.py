@@ -1,3 +1,9 @@
+"""Third-party AI service integrations.
+
+Each provider module imports its SDK only when a request is first made, so
+importing them here to build `THIRD_PARTY_CLASSES` stays cheap and does not
+load openai or google-genai.
+"""
 from . import xai as _xai
 from . import azure_openai as _azure_openai
 from . import google as _google
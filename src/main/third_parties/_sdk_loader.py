@@ -0,0 +1,39 @@
+"""Deferred imports of provider SDKs shared by the provider modules.
+
+The SDKs are slow to import, so the provider modules do not import them at
+module level. They call the loaders here when a client is first needed.
+"""
+from typing import Callable
+
+
+def load_openai():
+    """Imports the openai SDK, which the Azure OpenAI and xAI providers share.
+
+    Returns:
+        module: The `openai` module. Python caches it after the first call.
+    """
+    import openai  # pylint: disable=import-outside-toplevel
+    return openai
+
+
+def make_module_getattr(module_name: str, name_to_loader_dict: dict[str, Callable]) -> Callable:
+    """Builds a module-level `__getattr__` that resolves SDK names on access.
+
+    This lets a provider module's SDK be reached as a module attribute, e.g.
+    by `mock.patch('src.main.third_parties.xai.openai.OpenAI')`, before the
+    provider has loaded it.
+
+    Args:
+        module_name (str): The `__name__` of the provider module.
+        name_to_loader_dict (dict[str, Callable]): Loader to call for each
+            attribute name.
+
+    Returns:
+        Callable: The function to assign to the module's `__getattr__`.
+    """
+    def __getattr__(name: str):
+        loader = name_to_loader_dict.get(name)
+        if loader is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return loader()
+    return __getattr__
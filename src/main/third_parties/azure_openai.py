@@ -6,11 +6,17 @@ generation using the Azure OpenAI API.
 """
 import logging
 import os
-
-import openai
+from typing import TYPE_CHECKING
 
 from .. import third_party
 from .. import commons
+from ._sdk_loader import load_openai, make_module_getattr
+
+if TYPE_CHECKING:
+    import openai
+
+__getattr__ = make_module_getattr(__name__, {"openai": load_openai})
+
 
 class AzureOpenAI(third_party.ThirdPartyBase):
     """Integrates with Azure OpenAI services.
@@ -83,6 +89,10 @@ class AzureOpenAI(third_party.ThirdPartyBase):
             )
         ]
 
+    def prepare(self) -> None:
+        """Imports the openai SDK now, so the first Azure OpenAI request does not pay for it."""
+        load_openai()
+
     def generate_response(
         self,
         _aiengine_id: str,
@@ -123,16 +133,18 @@ class AzureOpenAI(third_party.ThirdPartyBase):
         system_prompt = aiengine_arg_dict.get("system_prompt", "")
         thirdpartyapikey = thirdpartyapikey_list[0]
 
+        openai = load_openai()  # pylint: disable=redefined-outer-name
         client = self._get_client(
             thirdpartyapikey=thirdpartyapikey,
             azure_endpoint=azure_endpoint,
             api_version=api_version
         )
 
-        messages = [{"role": "system", "content": system_prompt}]
+        # Omit the system message entirely when no system prompt is configured.
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
         for msg in conversation_history:
             if msg.sender == role_name:
-                messages.append({"role": "assistant", "content": msg.content.strip()})
+                messages.append({"role": "assistant", "content": msg.stripped_content})
             else:
                 # messages.append({"role": "user", "content": msg['text']})
                 reuse_content = True
@@ -145,7 +157,7 @@ class AzureOpenAI(third_party.ThirdPartyBase):
                     messages[-1]["content"] += '\n\n'
                 else:
                     messages.append({"role": "user", "content": ""})
-                messages[-1]["content"] += f'{msg.sender} said:\n{msg.content.strip()}'
+                messages[-1]["content"] += msg.attributed_content
 
         # Log the constructed messages list for debugging, if necessary (optional)
         # logging.debug(f"Constructed messages for Azure OpenAI: {messages}")
@@ -179,7 +191,7 @@ class AzureOpenAI(third_party.ThirdPartyBase):
             logging.error(f"An unexpected error occurred for role {role_name}: {e}")
             return f"Error: An unexpected error occurred. Details: {e}"
 
-    def _get_client(self, thirdpartyapikey: str, azure_endpoint: str, api_version: str) -> openai.AzureOpenAI:
+    def _get_client(self, thirdpartyapikey: str, azure_endpoint: str, api_version: str) -> "openai.AzureOpenAI":
         """Retrieves or creates an AzureOpenAI client.
 
         Manages a dictionary of client instances, keyed by a tuple of
@@ -194,11 +206,12 @@ class AzureOpenAI(third_party.ThirdPartyBase):
             openai.AzureOpenAI: An initialized AzureOpenAI client instance.
         """
         client_key = (thirdpartyapikey, azure_endpoint, api_version)
-        if client_key not in self._client_dict:
-            client = openai.AzureOpenAI(
+        client = self._client_dict.get(client_key)
+        if client is None:
+            client = load_openai().AzureOpenAI(
                 api_key=thirdpartyapikey,
                 azure_endpoint=azure_endpoint,
                 api_version=api_version,
             )
             self._client_dict[client_key] = client
-        return self._client_dict[client_key]
+        return client
@@ -2,13 +2,13 @@
 Google Third-Party Service Integration
 """
 import logging
-
-from google import genai # google.genai from python package google-genai
-# google.generativeai is deprecated.  It MUST NOT be used.
-from google.genai.types import Tool, GenerateContentConfig, GoogleSearch
+from typing import TYPE_CHECKING
 
 from .. import third_party
 
+if TYPE_CHECKING:
+    from google import genai
+
 DEFAULT_MODEL_NAME = "gemini-2.0-flash"
 MODEL_NAME_LIST = [
     'gemini-2.0-flash',
@@ -18,6 +18,35 @@ MODEL_NAME_LIST = [
     'gemini-1.5-pro',
 ]
 
+_SDK_NAMES = ("genai", "Tool", "GenerateContentConfig", "GoogleSearch")
+
+
+def _load_genai():
+    """Imports the google-genai SDK into this module on first use.
+
+    google.genai pulls in a large dependency tree, so it is only imported
+    once a Gemini response is actually requested rather than at startup.
+    """
+    module_globals = globals()
+    if "genai" not in module_globals:
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        from google import genai # google.genai from python package google-genai
+        # google.generativeai is deprecated.  It MUST NOT be used.
+        module_globals["genai"] = genai
+    if "GenerateContentConfig" not in module_globals:
+        # pylint: disable=import-outside-toplevel
+        from google.genai.types import Tool, GenerateContentConfig, GoogleSearch
+        module_globals.update(Tool=Tool, GenerateContentConfig=GenerateContentConfig, GoogleSearch=GoogleSearch)
+
+
+def __getattr__(name: str):
+    # Lets SDK names such as `google.genai` be resolved (e.g. by mock.patch) before first use.
+    if name in _SDK_NAMES:
+        _load_genai()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class Google(third_party.ThirdPartyBase):
     """Integrates with Google's Generative AI services (e.g., Gemini).
 
@@ -32,7 +61,7 @@ class Google(third_party.ThirdPartyBase):
         self._logger = logging.getLogger(__name__ + ".Google")
         self._logger.info("Initializing Third party Google.")
         self._thirdpartyapikey_to_client_dict = {}
-        self._tools = [Tool(google_search = GoogleSearch())]
+        self._tools = None # Built on first use, once the SDK is loaded
 
     def get_thirdpartyapikey_slot_info_list(self) -> list[third_party.ThirdPartyApiKeySlotInfo]:
         """Gets the API key slot information required for Google's AI services.
@@ -90,6 +119,10 @@ class Google(third_party.ThirdPartyBase):
             )
         ]
 
+    def prepare(self) -> None:
+        """Imports google.genai and its request types before the first Gemini request needs them."""
+        _load_genai()
+
     def generate_response(
         self,
         _aiengine_id: str,
@@ -127,15 +160,15 @@ class Google(third_party.ThirdPartyBase):
         thirdpartyapikey = thirdpartyapikey_list[0]
 
         client = self._get_client(thirdpartyapikey)
+        if self._tools is None:
+            self._tools = [Tool(google_search = GoogleSearch())]
 
         system_instruction = system_prompt.strip()
 
         contents = []
         for msg in conversation_history:
-            sender_role = msg.sender
-            text_content = msg.content.strip()
-            if sender_role == role_name:
-                contents.append({"role": "model", "text": text_content})
+            if msg.sender == role_name:
+                contents.append({"role": "model", "text": msg.stripped_content})
             else:
                 reuse_content = True
                 if len(contents) <= 0:
@@ -145,11 +178,10 @@ class Google(third_party.ThirdPartyBase):
 
                 if reuse_content:
                     text = contents[-1]["text"]
-                    text += f'\n\n{sender_role} said:\n{text_content}'
+                    text += '\n\n' + msg.attributed_content
                     contents[-1]["text"] = text
                 else:
-                    text = f'{sender_role} said:\n{text_content}'
-                    content = {"role": "user", "text": text}
+                    content = {"role": "user", "text": msg.attributed_content}
                     contents.append(content)
 
         contents = map(
@@ -162,7 +194,7 @@ class Google(third_party.ThirdPartyBase):
         contents = list(contents)
 
         try:
-            self._logger.debug(f"Sending request to Gemini API. System prompt (first 50 chars): '{system_prompt[:50]}...'")
+            self._logger.debug("Sending request to Gemini API. System prompt (first 50 chars): '%s...'", system_prompt[:50])
             # chat = self.model.start_chat(history=gemini_history)
             # response = chat.send_message(current_user_prompt)
             response = client.models.generate_content(
@@ -170,7 +202,7 @@ class Google(third_party.ThirdPartyBase):
                 contents=contents,
                 # systemInstruction=system_instruction,
                 config=GenerateContentConfig(
-                    system_instruction=system_instruction,
+                    system_instruction=system_instruction or None, # Skip an empty instruction
                     tools=self._tools,
                 ),
             )
@@ -193,7 +225,7 @@ class Google(third_party.ThirdPartyBase):
             self._logger.error(f"Gemini API call failed: {str(e)}", exc_info=True)
             return f"Error: Gemini API call failed: {str(e)}"
 
-    def _get_client(self, thirdpartyapikey: str) -> genai.Client:
+    def _get_client(self, thirdpartyapikey: str) -> "genai.Client":
         """Retrieves or creates a Google GenAI client.
 
         Manages a dictionary of client instances, keyed by API key,
@@ -205,7 +237,9 @@ class Google(third_party.ThirdPartyBase):
         Returns:
             genai.Client: An initialized Google GenAI client instance.
         """
-        if thirdpartyapikey not in self._thirdpartyapikey_to_client_dict:
+        _load_genai()
+        client = self._thirdpartyapikey_to_client_dict.get(thirdpartyapikey)
+        if client is None:
             client = genai.Client(api_key=thirdpartyapikey)
             self._thirdpartyapikey_to_client_dict[thirdpartyapikey] = client
-        return self._thirdpartyapikey_to_client_dict[thirdpartyapikey]
+        return client
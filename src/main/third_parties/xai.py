@@ -2,8 +2,13 @@
 xAI Third-Party Service Integration
 """
 import logging
-import openai
+from typing import TYPE_CHECKING
+
 from .. import third_party
+from ._sdk_loader import load_openai, make_module_getattr
+
+if TYPE_CHECKING:
+    import openai
 
 DEFAULT_MODEL_NAME = "grok-3-latest"
 MODEL_NAME_LIST = [
@@ -15,6 +20,9 @@ MODEL_NAME_LIST = [
     'grok-2-latest',
 ]
 
+__getattr__ = make_module_getattr(__name__, {"openai": load_openai})
+
+
 class XAI(third_party.ThirdPartyBase):
     """Integrates with xAI's services (e.g., Grok).
 
@@ -78,6 +86,10 @@ class XAI(third_party.ThirdPartyBase):
             )
         ]
 
+    def prepare(self) -> None:
+        """Imports the openai SDK, through which the Grok API is called, before the first request."""
+        load_openai()
+
     def generate_response(
         self,
         _aiengine_id: str,
@@ -114,14 +126,16 @@ class XAI(third_party.ThirdPartyBase):
         system_prompt = aiengine_arg_dict.get("system_prompt", "")
         thirdpartyapikey = thirdpartyapikey_list[0]
 
+        openai = load_openai()  # pylint: disable=redefined-outer-name
         client = self._get_client(thirdpartyapikey)
 
-        messages = [{"role": "system", "content": system_prompt}]
+        # Omit the system message entirely when no system prompt is configured.
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
         for msg in conversation_history:
             if msg.sender == role_name:
-                messages.append({"role": "assistant", "content": msg.content.strip()})
+                messages.append({"role": "assistant", "content": msg.stripped_content})
             else:
-                messages.append({"role": "user", "content": f'{msg.sender} said:\n{msg.content.strip()}'})
+                messages.append({"role": "user", "content": msg.attributed_content})
 
         try:
             response = client.chat.completions.create(
@@ -152,7 +166,7 @@ class XAI(third_party.ThirdPartyBase):
             logging.error(f"An unexpected error occurred for role {role_name}: {e}")
             return f"Error: An unexpected error occurred. Details: {e}"
 
-    def _get_client(self, thirdpartyapikey: str) -> openai.OpenAI:
+    def _get_client(self, thirdpartyapikey: str) -> "openai.OpenAI":
         """Retrieves or creates an OpenAI client configured for xAI.
 
         Manages a dictionary of client instances, keyed by API key,
@@ -165,10 +179,11 @@ class XAI(third_party.ThirdPartyBase):
         Returns:
             openai.OpenAI: An initialized OpenAI client instance configured for xAI.
         """
-        if thirdpartyapikey not in self._thirdpartyapikey_to_client_dict:
-            client = openai.OpenAI(
+        client = self._thirdpartyapikey_to_client_dict.get(thirdpartyapikey)
+        if client is None:
+            client = load_openai().OpenAI(
                 api_key=thirdpartyapikey,
                 base_url="https://api.x.ai/v1",
             )
             self._thirdpartyapikey_to_client_dict[thirdpartyapikey] = client
-        return self._thirdpartyapikey_to_client_dict[thirdpartyapikey]
+        return client
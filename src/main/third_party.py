@@ -11,7 +11,9 @@ It includes:
 - `ThirdPartyGroup`: Manages a collection of `ThirdPartyBase` instances.
 """
 import abc
+import collections
 import logging
+import sys
 from enum import Enum
 
 from .message import MessageData
@@ -23,6 +25,8 @@ class ThirdPartyApiKeySlotInfo:
         thirdpartyapikey_slot_id (str): A unique identifier for this API key slot (e.g., "OPENAI_API_KEY").
         name (str): A user-friendly name for this API key slot (e.g., "OpenAI API Key").
     """
+    __slots__ = ("thirdpartyapikey_slot_id", "name")
+
     def __init__(self, thirdpartyapikey_slot_id: str, name: str):
         """Initializes ThirdPartyApiKeySlotInfo.
 
@@ -30,7 +34,7 @@ class ThirdPartyApiKeySlotInfo:
             thirdpartyapikey_slot_id (str): Unique identifier for the API key slot.
             name (str): Name of the API key slot.
         """
-        self.thirdpartyapikey_slot_id = thirdpartyapikey_slot_id
+        self.thirdpartyapikey_slot_id = sys.intern(thirdpartyapikey_slot_id)
         self.name = name
 
     def __repr__(self):
@@ -38,17 +42,19 @@ class ThirdPartyApiKeySlotInfo:
         return f"ThirdPartyApiKeySlotInfo(thirdpartyapikey_slot_id={self.thirdpartyapikey_slot_id}, name={self.name})"
 
 
-class AIEngineArgType(Enum):
-    """Enumeration for different types of AI engine arguments."""
+class AIEngineArgType(str, Enum):
+    """Enumeration for different types of AI engine arguments.
+
+    Members are strings, so `str()` returns the value directly from the
+    string data instead of going through the Enum `value` descriptor.
+    """
 
     SINGLE_LINE = "single_line" # Represents a single line of text input.
     MULTI_LINE = "multi_line"   # Represents multiple lines of text input.
     SELECTION = "selection"     # Represents a selection from a predefined list of options.
     SUGGESTION = "suggestion"   # Represents a suggestion input, where the user can type and receive suggestions.
 
-    def __str__(self):
-        """Returns the string representation of the enum value."""
-        return self.value
+    __str__ = str.__str__
 
 
 class AIEngineArgInfo:
@@ -59,9 +65,11 @@ class AIEngineArgInfo:
         name (str): A user-friendly name for the argument (e.g., "Model Name").
         required (bool): True if the argument is required, False otherwise.
         default_value (Optional[str]): The default value for the argument, if any.
-        value_options (Optional[list[str]]): A list of possible valid string
-            values for the argument, if applicable.
+        value_option_list (Optional[tuple[str, ...]]): The possible valid
+            string values for the argument, if applicable, frozen as a tuple.
     """
+    __slots__ = ("arg_id", "name", "required", "arg_type", "default_value", "value_option_list")
+
     def __init__(self, arg_id: str, name:str, required: bool, arg_type:AIEngineArgType = AIEngineArgType.SINGLE_LINE, default_value: str = None, value_option_list: list[str] = None):
         """Initializes AIEngineArgInfo.
 
@@ -73,12 +81,12 @@ class AIEngineArgInfo:
             arg_type (AIEngineArgType, optional): The type of the argument.
             value_option_list (list[str], optional): A list of valid options for the argument, if applicable.
         """
-        self.arg_id = arg_id
+        self.arg_id = sys.intern(arg_id)
         self.name = name
         self.required = required
         self.arg_type = arg_type
         self.default_value = default_value
-        self.value_option_list = value_option_list
+        self.value_option_list = tuple(value_option_list) if value_option_list is not None else None
 
 
 class AIEngineInfo:
@@ -87,12 +95,19 @@ class AIEngineInfo:
     Attributes:
         aiengine_id (str): A unique identifier for this AI engine (e.g., "OPENAI_GPT4").
         name (str): A user-friendly name for the AI engine (e.g., "OpenAI GPT-4").
-        thirdpartyapikey_slot_id_list (list[str]): A list of `thirdpartyapikey_slot_id` strings
+        thirdpartyapikey_slot_id_list (tuple[str, ...]): The `thirdpartyapikey_slot_id` strings
             that this engine requires. These IDs should correspond to `ThirdPartyApiKeySlotInfo`
             instances.
-        arg_list (list[AIEngineArgInfo]): A list of `AIEngineArgInfo` objects
+        arg_list (tuple[AIEngineArgInfo, ...]): The `AIEngineArgInfo` objects
             describing the arguments this engine accepts or requires.
+        thirdpartyapikey_slot_id_set (frozenset[str]): The IDs of
+            `thirdpartyapikey_slot_id_list` as a set, for membership tests.
+
+    Both sequences are frozen as tuples when the engine info is created.
     """
+    __slots__ = ("aiengine_id", "name", "thirdpartyapikey_slot_id_list", "thirdpartyapikey_slot_id_set",
+                 "arg_list", "_arg_id_to_arg_info_dict")
+
     def __init__(self, aiengine_id: str, name: str, thirdpartyapikey_slot_id_list: list[str], arg_list: list[AIEngineArgInfo]):
         """Initializes AIEngineInfo.
 
@@ -102,14 +117,21 @@ class AIEngineInfo:
             thirdpartyapikey_slot_id_list (list[str]): List of API key slot IDs associated with this engine.
             arg_list (list[AIEngineArgInfo]): List of additional arguments or configurations for the engine.
         """
-        self.aiengine_id = aiengine_id
+        self.aiengine_id = sys.intern(aiengine_id)
         self.name = name
-        self.thirdpartyapikey_slot_id_list = thirdpartyapikey_slot_id_list
-        self.arg_list = arg_list
+        self.thirdpartyapikey_slot_id_list = tuple(thirdpartyapikey_slot_id_list)
+        self.thirdpartyapikey_slot_id_set = frozenset(self.thirdpartyapikey_slot_id_list)
+        self.arg_list = tuple(arg_list)
+        self._arg_id_to_arg_info_dict: dict[str, AIEngineArgInfo] = {
+            arg_info.arg_id: arg_info for arg_info in self.arg_list
+        }
 
     def get_aiengine_arg_info(self, arg_id: str) -> AIEngineArgInfo | None:
         """Retrieves the AIEngineArgInfo for a given argument ID.
 
+        This is a dict lookup; the arguments are indexed by ID when the
+        AIEngineInfo is created.
+
         Args:
             arg_id (str): The ID of the argument to retrieve.
 
@@ -117,10 +139,7 @@ class AIEngineInfo:
             Optional[AIEngineArgInfo]: The argument information if found,
                 otherwise None.
         """
-        for arg_info in self.arg_list:
-            if arg_info.arg_id == arg_id:
-                return arg_info
-        return None
+        return self._arg_id_to_arg_info_dict.get(arg_id)
 
 
 class ThirdPartyBase(abc.ABC):
@@ -139,7 +158,7 @@ class ThirdPartyBase(abc.ABC):
         Args:
             thirdparty_id (str): Unique identifier for the third-party service.
         """
-        self.thirdparty_id = thirdparty_id
+        self.thirdparty_id = sys.intern(thirdparty_id)
 
     @abc.abstractmethod
     def get_thirdpartyapikey_slot_info_list(self) -> list[ThirdPartyApiKeySlotInfo]:
@@ -167,6 +186,15 @@ class ThirdPartyBase(abc.ABC):
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def prepare(self) -> None:
+        """
+        Performs slow one-time setup, such as importing the service SDK.
+
+        Called from a background thread ahead of the first response so that
+        the setup cost is not paid when the user asks a bot to respond. The
+        default implementation does nothing.
+        """
+
     @abc.abstractmethod
     def generate_response(self, aiengine_id:str, aiengine_arg_dict:dict[str,str], thirdpartyapikey_list:list[str], role_name: str, conversation_history: list[MessageData]) -> str:
         """
@@ -199,6 +227,9 @@ class ThirdPartyGroup:
 
         Args:
             third_party_classes (list[type[ThirdPartyBase]]): A list of classes that extend ThirdPartyBase.
+
+        Raises:
+            ValueError: If two AI engines share an `aiengine_id`.
         """
         self._logger = logging.getLogger(__name__)
 
@@ -206,34 +237,56 @@ class ThirdPartyGroup:
 
         self._third_party_list:list[ThirdPartyBase] = [cls() for cls in self.third_party_classes]
 
+        # Built once so that per-request dispatch is a single dict lookup.
+        # Duplicate engine IDs are detected by comparing dict and list sizes.
         self.thirdpartyapikey_slot_info_list: list[ThirdPartyApiKeySlotInfo] = []
+        self.aiengine_info_list: list[AIEngineInfo] = []
+        self.aiengine_id_to_thirdparty_dict: dict[str, ThirdPartyBase] = {}
         for third_party in self._third_party_list:
-            self._logger.info(f"Loading API key slot info from {third_party.thirdparty_id}.")
+            self._logger.info("Loading API key slot info from %s.", third_party.thirdparty_id)
             self.thirdpartyapikey_slot_info_list.extend(third_party.get_thirdpartyapikey_slot_info_list())
 
-        # self.aiengine_id_to_thirdpartyapikey_slot_info_dict: dict[str,ThirdPartyApiKeySlotInfo] = {}
-        # for third_party in self._third_party_list:
-        #     for thirdpartyapikey_slot_info in third_party.get_thirdpartyapikey_slot_info_list():
-        #         assert(thirdpartyapikey_slot_info.thirdpartyapikey_slot_id not in self.aiengine_id_to_thirdpartyapikey_slot_info_dict), \
-        #             f"Duplicate API key slot ID found: {thirdpartyapikey_slot_info.thirdpartyapikey_slot_id} in {third_party.thirdparty_id}."
-        #         self.aiengine_id_to_thirdpartyapikey_slot_info_dict[thirdpartyapikey_slot_info.thirdpartyapikey_slot_id] = thirdpartyapikey_slot_info
+            self._logger.info("Loading AI engines from %s.", third_party.thirdparty_id)
+            aiengine_info_list = third_party.get_aiengine_info_list()
+            self.aiengine_info_list.extend(aiengine_info_list)
+            self.aiengine_id_to_thirdparty_dict.update(
+                dict.fromkeys([aiengine_info.aiengine_id for aiengine_info in aiengine_info_list], third_party))
+
+        self.aiengine_id_to_aiengine_info_dict: dict[str, AIEngineInfo] = {
+            aiengine_info.aiengine_id: aiengine_info for aiengine_info in self.aiengine_info_list
+        }
+        if len(self.aiengine_id_to_aiengine_info_dict) != len(self.aiengine_info_list):
+            aiengine_id_counter = collections.Counter(aiengine_info.aiengine_id for aiengine_info in self.aiengine_info_list)
+            duplicate_aiengine_id_list = [aiengine_id for aiengine_id, count in aiengine_id_counter.items() if count > 1]
+            raise ValueError(f"Duplicate AI engine IDs found: {', '.join(duplicate_aiengine_id_list)}.")
+
+    def _get_third_party(self, aiengine_id: str) -> ThirdPartyBase:
+        """
+        Returns the third-party service providing the specified AI engine.
 
-        self.aiengine_info_list: list[AIEngineInfo] = []
-        for third_party in self._third_party_list:
-            self._logger.info(f"Loading AI engines from {third_party.thirdparty_id}.")
-            self.aiengine_info_list.extend(third_party.get_aiengine_info_list())
+        Args:
+            aiengine_id (str): The ID of the AI engine.
 
-        # self.aiengine_id_to_aiengine_info_dict: dict[str, AIEngineInfo] = {}
-        # for third_party in self._third_party_list:
-        #     for aiengine_info in third_party.get_aiengine_info_list():
-        #         assert(aiengine_info.aiengine_id not in self.aiengine_id_to_aiengine_info_dict), \
-        #             f"Duplicate AI engine ID found: {aiengine_info.aiengine_id} in {third_party.thirdparty_id}."
-        #         self.aiengine_id_to_aiengine_info_dict[aiengine_info.aiengine_id] = aiengine_info
+        Returns:
+            ThirdPartyBase: The service that provides the engine.
 
-        self.aiengine_id_to_thirdparty_dict: dict[str, ThirdPartyBase] = {}
-        for third_party in self._third_party_list:
-            for aiengine_info in third_party.get_aiengine_info_list():
-                self.aiengine_id_to_thirdparty_dict[aiengine_info.aiengine_id] = third_party
+        Raises:
+            ValueError: If no service provides the engine.
+        """
+        third_party = self.aiengine_id_to_thirdparty_dict.get(aiengine_id)
+        if third_party is None:
+            raise ValueError(f"AI engine ID {aiengine_id} not found in third-party services.")
+        return third_party
+
+    def prepare(self, aiengine_id: str) -> None:
+        """
+        Prepares the third-party service backing the specified AI engine.
+
+        Args:
+            aiengine_id (str): The ID of the AI engine that is about to be used.
+        """
+        third_party = self._get_third_party(aiengine_id)
+        third_party.prepare()
 
     def generate_response(self,
                           aiengine_id:str,
@@ -253,8 +306,6 @@ class ThirdPartyGroup:
         Returns:
             str: The response from the AI engine.
         """
-        if aiengine_id not in self.aiengine_id_to_thirdparty_dict:
-            raise ValueError(f"AI engine ID {aiengine_id} not found in third-party services.")
-        third_party = self.aiengine_id_to_thirdparty_dict[aiengine_id]
-        self._logger.info(f"Generating response using AI engine {aiengine_id} from {third_party.thirdparty_id}.")
+        third_party = self._get_third_party(aiengine_id)
+        self._logger.info("Generating response using AI engine %s from %s.", aiengine_id, third_party.thirdparty_id)
         return third_party.generate_response(aiengine_id, aiengine_arg_dict, thirdpartyapikey_list, role_name, conversation_history)
@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QMessageBox,
     QDialog, QComboBox, QLineEdit, QFormLayout
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
 # Attempt to import from sibling modules
 from .thirdpartyapikey_manager import ThirdPartyApiKeyManager, ThirdPartyApiKeyQueryData
 from . import third_party
@@ -21,6 +21,10 @@ class ThirdPartyApiKeyDialog(QDialog):
         """
         super().__init__(parent)
         self.thirdpartyapikey_manager = thirdpartyapikey_manager
+        # Slot ID of the selected service, read from the combo box once per selection change.
+        self._thirdpartyapikey_slot_id: str | None = None
+        # Query per slot ID, built on first use; the manager only reads queries.
+        self._thirdpartyapikey_slot_id_to_query_dict: dict[str, ThirdPartyApiKeyQueryData] = {}
         self.setWindowTitle(self.tr("API Key Management"))
         self.setMinimumWidth(400)
 
@@ -28,9 +32,12 @@ class ThirdPartyApiKeyDialog(QDialog):
         form_layout = QFormLayout()
 
         self.service_combo = QComboBox()
-        for thirdpartyapikey_slot_info in thirdpartyapikey_slot_info_list:
-            self.service_combo.addItem(thirdpartyapikey_slot_info.name, thirdpartyapikey_slot_info.thirdpartyapikey_slot_id)
-        self.service_combo.currentTextChanged.connect(self._load_key_for_display)
+        # Fill the combo box before connecting it, so populating it does not
+        # load a key per row; the first key is loaded explicitly below.
+        self.service_combo.addItems([thirdpartyapikey_slot_info.name for thirdpartyapikey_slot_info in thirdpartyapikey_slot_info_list])
+        for index, thirdpartyapikey_slot_info in enumerate(thirdpartyapikey_slot_info_list):
+            self.service_combo.setItemData(index, thirdpartyapikey_slot_info.thirdpartyapikey_slot_id)
+        self.service_combo.currentIndexChanged.connect(self._load_key_for_display)
         form_layout.addRow(self.tr("Service:"), self.service_combo)
 
         self.thirdpartyapikey_input = QLineEdit()
@@ -56,21 +63,56 @@ class ThirdPartyApiKeyDialog(QDialog):
 
         self._load_key_for_display() # Initial load
 
+    def reload(self, thirdpartyapikey_manager: ThirdPartyApiKeyManager):
+        """Prepares the dialog to be shown again.
+
+        Switches to the given manager and reloads the key of the selected
+        service, so the dialog never shows a stale or cleared key.
+
+        Args:
+            thirdpartyapikey_manager: The ThirdPartyApiKeyManager to use from now on.
+        """
+        self.thirdpartyapikey_manager = thirdpartyapikey_manager
+        self._load_key_for_display()
+
+    def _get_thirdpartyapikey_query(self, thirdpartyapikey_slot_id: str) -> ThirdPartyApiKeyQueryData:
+        """Returns the query for the single key this dialog manages per service.
+
+        The query is built the first time a service is used and reused on
+        later selections, saves and deletes.
+
+        Args:
+            thirdpartyapikey_slot_id (str): The slot ID of the selected service.
+
+        Returns:
+            ThirdPartyApiKeyQueryData: The query for the service's key.
+        """
+        query = self._thirdpartyapikey_slot_id_to_query_dict.get(thirdpartyapikey_slot_id)
+        if query is None:
+            thirdpartyapikey_id = thirdpartyapikey_slot_id # TODO: Handle multiple keys per service if needed
+            query = ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id=thirdpartyapikey_slot_id,
+                                              thirdpartyapikey_id=thirdpartyapikey_id)
+            self._thirdpartyapikey_slot_id_to_query_dict[thirdpartyapikey_slot_id] = query
+        return query
+
+    @pyqtSlot()
     def _load_key_for_display(self):
-        """Loads and displays the API key for the currently selected service."""
-        thirdpartyapikey_slot_id = self.service_combo.currentData()
-        thirdpartyapikey_id = thirdpartyapikey_slot_id # TODO: Handle multiple keys per service if needed
+        """Loads and displays the API key for the currently selected service.
+
+        Also remembers the selected slot ID for `_save_key()` and `_delete_key()`.
+        """
+        thirdpartyapikey_slot_id = self._thirdpartyapikey_slot_id = self.service_combo.currentData()
         if thirdpartyapikey_slot_id: # Ensure a service is actually selected
-            key = self.thirdpartyapikey_manager.get_thirdpartyapikey(ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id, thirdpartyapikey_id))
+            key = self.thirdpartyapikey_manager.get_thirdpartyapikey(self._get_thirdpartyapikey_query(thirdpartyapikey_slot_id))
             self.thirdpartyapikey_input.setText(key if key else "")
         else:
             self.thirdpartyapikey_input.clear()
 
 
+    @pyqtSlot()
     def _save_key(self):
         """Saves the API key entered in the input field for the selected service."""
-        thirdpartyapikey_slot_id = self.service_combo.currentData()
-        thirdpartyapikey_id = thirdpartyapikey_slot_id # TODO: Handle multiple keys per service if needed
+        thirdpartyapikey_slot_id = self._thirdpartyapikey_slot_id
         key_text = self.thirdpartyapikey_input.text()
         if not thirdpartyapikey_slot_id:
             QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select a service."))
@@ -79,13 +121,13 @@ class ThirdPartyApiKeyDialog(QDialog):
             QMessageBox.warning(self, self.tr("Warning"), self.tr("API Key cannot be empty."))
             return
 
-        self.thirdpartyapikey_manager.set_thirdpartyapikey(ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id, thirdpartyapikey_id), key_text)
+        self.thirdpartyapikey_manager.set_thirdpartyapikey(self._get_thirdpartyapikey_query(thirdpartyapikey_slot_id), key_text)
         QMessageBox.information(self, self.tr("Success"), self.tr("API Key saved."))
 
+    @pyqtSlot()
     def _delete_key(self):
         """Deletes the API key for the selected service after confirmation."""
-        thirdpartyapikey_slot_id = self.service_combo.currentData()
-        thirdpartyapikey_id = thirdpartyapikey_slot_id # TODO: Handle multiple keys per service if needed
+        thirdpartyapikey_slot_id = self._thirdpartyapikey_slot_id
         if not thirdpartyapikey_slot_id:
             QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select a service to delete the key for."))
             return
@@ -94,6 +136,6 @@ class ThirdPartyApiKeyDialog(QDialog):
                                      self.tr("Are you sure you want to delete the API key for {0}?").format(thirdpartyapikey_slot_id),
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.thirdpartyapikey_manager.delete_thirdpartyapikey(ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id, thirdpartyapikey_id))
+            self.thirdpartyapikey_manager.delete_thirdpartyapikey(self._get_thirdpartyapikey_query(thirdpartyapikey_slot_id))
             self.thirdpartyapikey_input.clear()
             QMessageBox.information(self, self.tr("Success"), self.tr("API Key deleted."))
@@ -16,9 +16,13 @@ prevent conflicts. A manifest key, `_KEYRING_MANAGED_SERVICES_KEY`, is used
 within the fallback JSON file to track service names whose keys are stored in
 the system keyring, aiding in operations like re-encryption or clearing all data.
 """
+import atexit
 import json
 import os
 import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import keyring
@@ -28,6 +32,24 @@ from .encryption_service import EncryptionService # Assuming EncryptionService i
 
 ENCRYPTED_SERVICE_NAME_PREFIX = "CogniChoir_Encrypted"
 
+# Upper bound on concurrent keyring reads in `get_thirdpartyapikey_list`.
+_MAX_KEYRING_READ_WORKERS = 16
+
+# Delay before a changed key index is written, so that several changes in
+# quick succession are written to disk only once.
+_SAVE_DELAY_SECONDS = 0.2
+
+
+def _flush_at_exit(manager_ref: "weakref.ref[ThirdPartyApiKeyManager]"):
+    """Writes pending changes of a manager at exit, if it is still alive.
+
+    A manager with pending changes is kept alive by its save timer, so one
+    that has been garbage collected has nothing left to write.
+    """
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush()
+
 class ThirdPartyApiKeyQueryData(BaseModel):
 
     thirdpartyapikey_slot_id:str
@@ -71,6 +93,15 @@ class ThirdPartyApiKeyManager:
     or inaccessible, it falls back to storing keys in an encrypted JSON file
     (`data/thirdpartyapikey_manager.json`), provided an `EncryptionService` is available.
 
+    Decrypted keys are cached in memory after the first successful load, so
+    repeated lookups (e.g. on every bot response) skip the keyring and the
+    decryption. The cache is invalidated whenever keys are saved, deleted,
+    re-encrypted or cleared.
+
+    Changes to the key index are written to the JSON file shortly after they
+    are made rather than immediately; call `flush()` to write them at once.
+    Pending changes are also written when the interpreter exits.
+
     Attributes:
         encryption_service (EncryptionService): Service used for
             encrypting/decrypting keys. If None, secure operations will fail.
@@ -99,6 +130,22 @@ class ThirdPartyApiKeyManager:
 
         self._data : dict = {}
 
+        # Decrypted keys keyed by (slot ID, key ID). Lookups run on the worker
+        # thread while the dialogs modify keys on the GUI thread, so access is
+        # guarded by a lock, and a load only stores its result if no
+        # invalidation happened while it was reading the keyring.
+        self._thirdpartyapikey_cache: dict[tuple[str, str], str] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+
+        # Pending writes of `_data`. The write runs on a timer thread, so it
+        # shares a lock with the methods that change `_data`.
+        self._data_lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: threading.Timer | None = None
+        # Only a weak reference, so replaced managers are not kept alive until exit
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
         # Test if keyring is accessible
         keyring.get_password(self._get_keyring_service_name("_test_slot_id"), "_test_init_user")
 
@@ -141,11 +188,52 @@ class ThirdPartyApiKeyManager:
             self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'] = {}
 
     def _save_data(self):
-        """Saves the current data to the fallback JSON file."""
-        if not os.path.exists(os.path.dirname(self.data_path)):
-            os.makedirs(os.path.dirname(self.data_path))
-        with open(self.data_path, 'w', encoding='utf-8') as f:
-            json.dump(self._data, f, indent=4)
+        """Marks the data as changed and schedules a write to the JSON file.
+
+        The write happens `_SAVE_DELAY_SECONDS` later on a timer thread, so
+        all changes made in the meantime are written together.
+        """
+        with self._data_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(_SAVE_DELAY_SECONDS, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Writes pending changes to the JSON file, if there are any.
+
+        The file is written to a temporary file first and then moved into
+        place, so an interrupted write never leaves a truncated file behind.
+        """
+        with self._data_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            data_dir = os.path.dirname(self.data_path)
+            if data_dir:
+                os.makedirs(data_dir, exist_ok=True)
+            tmp_path = self.data_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=4)
+            os.replace(tmp_path, self.data_path)
+            self._dirty = False
+
+    def _invalidate_cache(self, cache_key: tuple[str, str] | None = None):
+        """Drops cached decrypted keys.
+
+        Args:
+            cache_key (tuple[str, str] | None): The (slot ID, key ID) to drop.
+                If None, the whole cache is cleared.
+        """
+        with self._cache_lock:
+            if cache_key is None:
+                self._thirdpartyapikey_cache.clear()
+            else:
+                self._thirdpartyapikey_cache.pop(cache_key, None)
+            self._cache_generation += 1
 
     def _get_keyring_service_name(self, thirdpartyapikey_slot_id: str) -> str:
         """Generates a unique service name for keyring storage."""
@@ -181,18 +269,22 @@ class ThirdPartyApiKeyManager:
         encrypted_key = self.encryption_service.encrypt(thirdpartyapikey)
 
         keyring.set_password(self._get_keyring_service_name(thirdpartyapikey_slot_id), thirdpartyapikey_id, encrypted_key)
+        self._invalidate_cache((thirdpartyapikey_slot_id, thirdpartyapikey_id))
 
-        if thirdpartyapikey_slot_id not in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict']:
-            self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id] = []
-        if thirdpartyapikey_id not in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id]:
-            self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id].append(thirdpartyapikey_id)
+        with self._data_lock:
+            if thirdpartyapikey_slot_id not in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict']:
+                self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id] = []
+            if thirdpartyapikey_id not in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id]:
+                self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id].append(thirdpartyapikey_id)
         self._save_data()
 
     def get_thirdpartyapikey(self, thirdpartyapikey_query: ThirdPartyApiKeyQueryData) -> str | None:
         """Loads and decrypts an API key for a given service.
 
         Retrieves the encrypted key from the system keyring or fallback JSON file,
-        then decrypts it using the configured `EncryptionService`.
+        then decrypts it using the configured `EncryptionService`. Successfully
+        decrypted keys are cached, so later calls for the same key return
+        without touching the keyring.
 
         Args:
             service_name (str): The name of the service whose key is to be loaded.
@@ -207,21 +299,35 @@ class ThirdPartyApiKeyManager:
             raise ValueError("ThirdPartyApiKeyQuery object cannot be None.")
         if not thirdpartyapikey_query.thirdpartyapikey_slot_id or not thirdpartyapikey_query.thirdpartyapikey_id:
             raise ValueError("Both thirdpartyapikey_slot_id and thirdpartyapikey_id must be provided in the query.")
-        if thirdpartyapikey_query.thirdpartyapikey_slot_id not in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict']:
-            print(f"No keys found for slot ID {thirdpartyapikey_query.thirdpartyapikey_slot_id}.", file=sys.stderr)
-            return None
-        if thirdpartyapikey_query.thirdpartyapikey_id not in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_query.thirdpartyapikey_slot_id]:
-            print(f"No key found for ID {thirdpartyapikey_query.thirdpartyapikey_id} in slot {thirdpartyapikey_query.thirdpartyapikey_slot_id}.", file=sys.stderr)
-            return None
 
         thirdpartyapikey_slot_id = thirdpartyapikey_query.thirdpartyapikey_slot_id
         thirdpartyapikey_id = thirdpartyapikey_query.thirdpartyapikey_id
+        # Only stored keys are ever cached, and deleting a key drops it from
+        # the cache, so a hit needs no check against the stored key index.
+        cache_key = (thirdpartyapikey_slot_id, thirdpartyapikey_id)
+        with self._cache_lock:
+            cached_key = self._thirdpartyapikey_cache.get(cache_key)
+            generation = self._cache_generation
+        if cached_key is not None:
+            return cached_key
+
+        thirdpartyapikey_id_list = self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'].get(thirdpartyapikey_slot_id)
+        if thirdpartyapikey_id_list is None:
+            print(f"No keys found for slot ID {thirdpartyapikey_slot_id}.", file=sys.stderr)
+            return None
+        if thirdpartyapikey_id not in thirdpartyapikey_id_list:
+            print(f"No key found for ID {thirdpartyapikey_id} in slot {thirdpartyapikey_slot_id}.", file=sys.stderr)
+            return None
+
         encrypted_key = keyring.get_password(self._get_keyring_service_name(thirdpartyapikey_slot_id), thirdpartyapikey_id)
 
         decrypted_key = self.encryption_service.decrypt(encrypted_key)
         if decrypted_key is None:
             print(f"Failed to decrypt key for {thirdpartyapikey_id}. It might be corrupted or an old format.", file=sys.stderr)
             return None
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._thirdpartyapikey_cache[cache_key] = decrypted_key
         return decrypted_key
 
     def delete_thirdpartyapikey(self, thirdpartyapikey_query: ThirdPartyApiKeyQueryData):
@@ -236,9 +342,11 @@ class ThirdPartyApiKeyManager:
         thirdpartyapikey_id = thirdpartyapikey_query.thirdpartyapikey_id
 
         keyring.delete_password(self._get_keyring_service_name(thirdpartyapikey_slot_id), thirdpartyapikey_id)
-        if thirdpartyapikey_slot_id in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict']:
-            if thirdpartyapikey_id in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id]:
-                self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id].remove(thirdpartyapikey_id)
+        self._invalidate_cache((thirdpartyapikey_slot_id, thirdpartyapikey_id))
+        with self._data_lock:
+            if thirdpartyapikey_slot_id in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict']:
+                if thirdpartyapikey_id in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id]:
+                    self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'][thirdpartyapikey_slot_id].remove(thirdpartyapikey_id)
         self._save_data()
 
     def get_thirdpartyapikey_list(self, query_list: list[ThirdPartyApiKeyQueryData]) -> list[str]:
@@ -246,6 +354,9 @@ class ThirdPartyApiKeyManager:
 
         This method returns a list of decrypted API keys for the provided
         API key queries. If a key cannot be found or decrypted, it is skipped.
+        Keys already in the cache are served directly; when several keys
+        have to be read from the keyring, the reads run concurrently, since
+        each one may be a slow round trip to the system's secret store.
 
         Args:
             query_list (list[ThirdPartyApiKeyQuery]): List of `ThirdPartyApiKeyQuery` objects
@@ -257,12 +368,29 @@ class ThirdPartyApiKeyManager:
         if not self.encryption_service:
             raise RuntimeError("Encryption service not available. Cannot get keys.")
 
-        ret_thirdpartyapikey_list = []
-        for query in query_list:
-            thirdpartyapikey = self.get_thirdpartyapikey(query)
-            if thirdpartyapikey is not None:
-                ret_thirdpartyapikey_list.append(thirdpartyapikey)
-        return ret_thirdpartyapikey_list
+        thirdpartyapikey_list = [None] * len(query_list)
+        miss_index_list = []
+        with self._cache_lock:
+            for index, query in enumerate(query_list):
+                cached_key = None
+                if query:
+                    cached_key = self._thirdpartyapikey_cache.get((query.thirdpartyapikey_slot_id, query.thirdpartyapikey_id))
+                if cached_key is None:
+                    miss_index_list.append(index)
+                else:
+                    thirdpartyapikey_list[index] = cached_key
+
+        if len(miss_index_list) == 1:
+            index = miss_index_list[0]
+            thirdpartyapikey_list[index] = self.get_thirdpartyapikey(query_list[index])
+        elif miss_index_list:
+            max_workers = min(_MAX_KEYRING_READ_WORKERS, len(miss_index_list))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                miss_key_iter = executor.map(self.get_thirdpartyapikey, [query_list[index] for index in miss_index_list])
+                for index, thirdpartyapikey in zip(miss_index_list, miss_key_iter):
+                    thirdpartyapikey_list[index] = thirdpartyapikey
+
+        return [thirdpartyapikey for thirdpartyapikey in thirdpartyapikey_list if thirdpartyapikey is not None]
 
     def re_encrypt(self, old_encryption_service: EncryptionService, new_encryption_service: EncryptionService):
         """Re-encrypts all stored API keys with a new encryption service.
@@ -284,6 +412,7 @@ class ThirdPartyApiKeyManager:
                 to use for re-encrypting the keys.
         """
         print("Re-encrypting all API keys...")
+        self._invalidate_cache()
 
         if 'thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict' not in self._data:
             return # Nothing to re-encrypt if no keys are stored
@@ -326,6 +455,7 @@ class ThirdPartyApiKeyManager:
           was cleared), it attempts to remove the default salt file directly.
         """
         print("Clearing all API keys and data...")
+        self._invalidate_cache()
         thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict = self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict']
         for thirdpartyapikey_slot_id, thirdpartyapikey_id_list in thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict.items():
             for thirdpartyapikey_id in thirdpartyapikey_id_list:
@@ -335,16 +465,22 @@ class ThirdPartyApiKeyManager:
                 except Exception as e:
                     print(f"Error deleting key for {thirdpartyapikey_id} from keyring: {e}", file=sys.stderr)
 
-        self._data = None
+        with self._data_lock:
+            # Drop any pending write, so it cannot bring the file back.
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
+            self._data = None
 
-        if os.path.exists(self.data_path):
-            try:
-                os.remove(self.data_path)
-                print(f"Removed data file: {self.data_path}")
-            except OSError as e:
-                print(f"Error removing data file {self.data_path}: {e}", file=sys.stderr)
+            if os.path.exists(self.data_path):
+                try:
+                    os.remove(self.data_path)
+                    print(f"Removed data file: {self.data_path}")
+                except OSError as e:
+                    print(f"Error removing data file {self.data_path}: {e}", file=sys.stderr)
 
-        self._fix_data()  # Reset to empty structure
+            self._fix_data()  # Reset to empty structure
 
     def get_available_thirdpartyapikey_query_list(self) -> list[ThirdPartyApiKeyQueryData]:
         """Retrieves a list of all available API key queries.
@@ -362,5 +498,6 @@ class ThirdPartyApiKeyManager:
         thirdpartyapikey_query_list = []
         for thirdpartyapikey_slot_id, thirdpartyapikey_id_list in self._data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'].items():
             for thirdpartyapikey_id in thirdpartyapikey_id_list:
-                thirdpartyapikey_query_list.append(ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id, thirdpartyapikey_id))
+                thirdpartyapikey_query_list.append(ThirdPartyApiKeyQueryData(
+                    thirdpartyapikey_slot_id=thirdpartyapikey_slot_id, thirdpartyapikey_id=thirdpartyapikey_id))
         return thirdpartyapikey_query_list
@@ -66,6 +66,11 @@ class TestBot(unittest.TestCase):
         }
         self.assertEqual(self.bot.model_dump(mode='json'), expected_dict)
 
+    def test_aiengine_id_is_interned(self):
+        """Tests that a loaded bot's engine ID is the interned string."""
+        bot = BotData.model_validate_json('{"name": "Loaded", "aiengine_id": "mock_engine_id_001"}')
+        self.assertIs(bot.aiengine_id, sys.intern("".join(["mock_engine_", "id_001"])))
+
 
 class TestGoogleEngine(unittest.TestCase): # Renamed from TestGeminiEngine
     """Tests for the Google (Gemini) AI engine implementation."""
@@ -400,6 +405,30 @@ class TestXAIEngine(unittest.TestCase): # Renamed from TestGrokEngine
         )
         mock_openai_class.assert_called_once_with(api_key="fake_xai_key", base_url="https://api.x.ai/v1")
 
+    @patch('src.main.third_parties.xai.openai.OpenAI')
+    def test_xai_generate_response_without_system_prompt(self, mock_openai_class):
+        """Tests that XAI omits the system message when the system prompt is empty."""
+        mock_client_instance = MagicMock()
+        mock_choice = MagicMock()
+        mock_choice.message.content = "Response without system prompt"
+        mock_client_instance.chat.completions.create.return_value = MagicMock(choices=[mock_choice])
+        mock_openai_class.return_value = mock_client_instance
+
+        engine = XAI()
+        response = engine.generate_response(
+            _aiengine_id="xai_grok",
+            aiengine_arg_dict={"model_name": "grok-test-model", "system_prompt": ""},
+            thirdpartyapikey_list=["fake_xai_key"],
+            role_name="TestXAIBot",
+            conversation_history=[MessageData(sender='User', content='Hello XAI!', timestamp=time.time())]
+        )
+
+        self.assertEqual(response, "Response without system prompt")
+        mock_client_instance.chat.completions.create.assert_called_once_with(
+            model="grok-test-model",
+            messages=[{"role": "user", "content": "User said:\nHello XAI!"}]
+        )
+
     @patch('src.main.third_parties.xai.openai.OpenAI') # Patched to new location
     def test_xai_init_success(self, mock_openai_class): # Renamed
         """Tests successful initialization of XAI engine."""
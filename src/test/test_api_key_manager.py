@@ -5,6 +5,8 @@ import sys
 import os
 import json
 import io
+import gc
+import weakref
 
 from src.main.thirdpartyapikey_manager import ThirdPartyApiKeyManager, ThirdPartyApiKeyQueryData, ENCRYPTED_SERVICE_NAME_PREFIX # Removed _KEYRING_MANAGED_SERVICES_KEY, Added ThirdPartyApiKeyQuery
 from src.main.encryption_service import EncryptionService
@@ -54,6 +56,7 @@ class TestThirdPartyApiKeyManagerWithEncryption(unittest.TestCase):
 
     def tearDown(self):
         """Cleans up test files after each test."""
+        self.api_manager.flush() # Write any pending changes now, not after the files are removed
         self._cleanup_test_files()
         if os.path.exists(DATA_DIR) and not os.listdir(DATA_DIR):
             os.rmdir(DATA_DIR)
@@ -106,6 +109,7 @@ class TestThirdPartyApiKeyManagerWithEncryption(unittest.TestCase):
         mock_keyring_get_password.assert_called_with(expected_keyring_service, key_id) # Called by get_thirdpartyapikey
 
         # Verify manifest file
+        self.api_manager.flush()
         self.assertTrue(os.path.exists(TEST_API_KEYS_FILE))
         with open(TEST_API_KEYS_FILE, 'r') as f:
             manifest_data = json.load(f)
@@ -144,11 +148,19 @@ class TestThirdPartyApiKeyManagerWithEncryption(unittest.TestCase):
         self.assertIsNone(self.api_manager.get_thirdpartyapikey(api_query), "Key should be None after delete.")
 
         # Verify manifest file updated
+        self.api_manager.flush()
         with open(TEST_API_KEYS_FILE, 'r') as f:
             manifest_data = json.load(f)
         self.assertNotIn(key_id, manifest_data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict'].get(slot_id, []),
                          "Deleted key_id should not be in manifest for slot_id.")
 
+    @patch('keyring.set_password')
+    def test_get_available_thirdpartyapikey_query_list(self, mock_set_password):
+        """Tests listing the queries of all stored keys."""
+        api_query = ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id="ListSlot", thirdpartyapikey_id="ListKeyID")
+        self.api_manager.set_thirdpartyapikey(api_query, "key_to_list")
+        self.assertEqual(self.api_manager.get_available_thirdpartyapikey_query_list(), [api_query])
+
     # test_load_key_decryption_failure needs to be adapted for keyring
     @patch('keyring.get_password')
     def test_load_key_decryption_failure_keyring(self, mock_keyring_get_password):
@@ -173,6 +185,72 @@ class TestThirdPartyApiKeyManagerWithEncryption(unittest.TestCase):
             self.assertIn("Failed to decrypt key", mock_stderr.getvalue())
         mock_keyring_get_password.assert_called_once_with(self.api_manager._get_keyring_service_name(slot_id), key_id)
 
+    @patch('keyring.set_password')
+    @patch('keyring.get_password')
+    def test_get_key_is_cached_until_set(self, mock_keyring_get_password, mock_keyring_set_password):
+        """Tests that a loaded key is served from memory until it is saved again."""
+        api_query = ThirdPartyApiKeyQueryData(
+            thirdpartyapikey_slot_id="CacheSlot",
+            thirdpartyapikey_id="CacheKeyID"
+        )
+        self.api_manager.set_thirdpartyapikey(api_query, "first_key")
+        mock_keyring_get_password.return_value = mock_keyring_set_password.call_args[0][2]
+
+        self.assertEqual(self.api_manager.get_thirdpartyapikey(api_query), "first_key")
+        self.assertEqual(self.api_manager.get_thirdpartyapikey(api_query), "first_key")
+        mock_keyring_get_password.assert_called_once()
+
+        # Saving a new value must invalidate the cached one.
+        self.api_manager.set_thirdpartyapikey(api_query, "second_key")
+        mock_keyring_get_password.return_value = mock_keyring_set_password.call_args[0][2]
+        self.assertEqual(self.api_manager.get_thirdpartyapikey(api_query), "second_key")
+        self.assertEqual(mock_keyring_get_password.call_count, 2)
+
+    @patch('keyring.set_password')
+    @patch('keyring.get_password')
+    def test_get_thirdpartyapikey_list(self, mock_keyring_get_password, mock_keyring_set_password):
+        """Tests that a key list keeps query order, skips missing keys and reads each stored key once."""
+        stored = {}
+        mock_keyring_set_password.side_effect = lambda service, key_id, value: stored.__setitem__(key_id, value)
+        mock_keyring_get_password.side_effect = lambda service, key_id: stored.get(key_id)
+        query_list = []
+        for i in range(3):
+            query = ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id="ListSlot", thirdpartyapikey_id=f"ListKey{i}")
+            self.api_manager.set_thirdpartyapikey(query, f"key_{i}")
+            query_list.append(query)
+        query_list.insert(1, ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id="ListSlot", thirdpartyapikey_id="Missing"))
+
+        self.assertEqual(self.api_manager.get_thirdpartyapikey_list(query_list), ["key_0", "key_1", "key_2"])
+        self.assertEqual(mock_keyring_get_password.call_count, 3)
+        # The second call is served entirely from the cache.
+        self.assertEqual(self.api_manager.get_thirdpartyapikey_list(query_list), ["key_0", "key_1", "key_2"])
+        self.assertEqual(mock_keyring_get_password.call_count, 3)
+
+    @patch('keyring.set_password')
+    def test_saves_are_deferred_and_coalesced(self, mock_keyring_set_password):
+        """Tests that several changes are written to the manifest file together."""
+        # A delay far longer than the test keeps the timer from firing mid-loop
+        with patch('src.main.thirdpartyapikey_manager._SAVE_DELAY_SECONDS', 3600.0), \
+                patch('json.dump', wraps=json.dump) as mock_json_dump:
+            for i in range(5):
+                self.api_manager.set_thirdpartyapikey(
+                    ThirdPartyApiKeyQueryData(thirdpartyapikey_slot_id="BulkSlot", thirdpartyapikey_id=f"BulkKey{i}"), f"key_{i}")
+            self.assertFalse(os.path.exists(TEST_API_KEYS_FILE))
+            self.api_manager.flush()
+            self.api_manager.flush() # Nothing left to write
+        self.assertEqual(mock_json_dump.call_count, 1)
+        with open(TEST_API_KEYS_FILE, 'r') as f:
+            manifest_data = json.load(f)
+        self.assertEqual(manifest_data['thirdpartyapikey_slot_id_to_thirdpartyapikey_id_list_dict']["BulkSlot"],
+                         [f"BulkKey{i}" for i in range(5)])
+
+    def test_manager_is_not_kept_alive_for_exit(self):
+        """Tests that the exit-time flush does not keep a discarded manager alive."""
+        manager_ref = weakref.ref(self.api_manager)
+        self.api_manager = MagicMock()
+        gc.collect()
+        self.assertIsNone(manager_ref())
+
     # test_re_encrypt_all_keys needs significant changes for keyring
     @patch('keyring.get_password')
     @patch('keyring.set_password')
@@ -249,6 +327,7 @@ class TestThirdPartyApiKeyManagerWithEncryption(unittest.TestCase):
             "SlotC2": ["IDC3"]
         }
         self.api_manager._save_data() # Save manifest to be cleared
+        self.api_manager.flush()
 
         self.assertTrue(os.path.exists(TEST_API_KEYS_FILE))
         # Salt file is managed by EncryptionService, ThirdPartyApiKeyManager.clear() does not directly delete it.
@@ -6,6 +6,7 @@ It also tests the ChatroomManager for operations like creating, loading,
 deleting, renaming, and cloning chatrooms, often using mocks for file
 operations and API key management.
 """
+import asyncio
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import sys
@@ -126,6 +127,94 @@ class TestChatroom(unittest.TestCase):
         self.assertEqual(len(self.chatroom.get_messages()), 0)
         self.mock_manager.notify_chatroom_updated.assert_called_with(self.chatroom)
 
+    def test_messages_sorted_by_timestamp(self):
+        """Tests that messages are kept in timestamp order on load and on add."""
+        chatroom = Chatroom.from_dict(
+            {"name": "Sorted Room", "bots": {}, "messages": [
+                {"sender": "User", "content": "second", "timestamp": 2000.0},
+                {"sender": "User", "content": "first", "timestamp": 1000.0},
+            ]},
+            manager=None, filepath=None)
+        self.assertEqual([m.content for m in chatroom.get_messages()], ["first", "second"])
+
+        # A clock that stepped backwards must not break the ordering
+        with patch('src.main.chatroom.time.time', return_value=1500.0):
+            asyncio.run(chatroom.add_message_async("User", "between"))
+        self.assertEqual([m.content for m in chatroom.get_messages()], ["first", "between", "second"])
+
+    def test_delete_message_data(self):
+        """Tests that only the given message is deleted, even with a shared timestamp."""
+        chatroom = Chatroom.from_dict(
+            {"name": "Delete Room", "bots": {}, "messages": [
+                {"sender": "User", "content": "first", "timestamp": 1000.0},
+                {"sender": "User", "content": "same time", "timestamp": 2000.0},
+                {"sender": "Bot", "content": "same time too", "timestamp": 2000.0},
+            ]},
+            manager=self.mock_manager, filepath=None)
+
+        # The message view may hold a copy rather than the stored object
+        target = chatroom.get_messages()[2].model_copy()
+        self.assertTrue(chatroom.delete_message_data(target))
+        self.assertEqual([m.content for m in chatroom.get_messages()], ["first", "same time"])
+        self.mock_manager.notify_chatroom_updated.assert_called_once_with(chatroom)
+
+        self.mock_manager.notify_chatroom_updated.reset_mock()
+        self.assertFalse(chatroom.delete_message_data(target))
+        self.mock_manager.notify_chatroom_updated.assert_not_called()
+
+    def test_bot_names_cached_until_bots_change(self):
+        """Tests that bot_names() is reused until a bot is added or removed."""
+        chatroom = Chatroom.from_dict(
+            {"name": "Names Room", "bots": {}, "messages": []},
+            manager=None, filepath=None)
+        chatroom.add_bot(BotData(name="Bot1", aiengine_id="google_gemini"))
+        names = chatroom.bot_names()
+        self.assertEqual(names, ("Bot1",))
+        self.assertIs(chatroom.bot_names(), names)
+
+        chatroom.add_bot(BotData(name="Bot2", aiengine_id="google_gemini"))
+        self.assertEqual(chatroom.bot_names(), ("Bot1", "Bot2"))
+        chatroom.remove_bot("Bot1")
+        self.assertEqual(chatroom.bot_names(), ("Bot2",))
+
+    def test_update_count_changes_with_every_change(self):
+        """Tests that update_count grows on each change, even if the message count and last timestamp stay the same."""
+        chatroom = Chatroom.from_dict(
+            {"name": "Count Room", "bots": {}, "messages": [
+                {"sender": "User", "content": f"message {i}", "timestamp": 1000.0 + i} for i in range(2)
+            ]},
+            manager=None, filepath=None)
+        count = chatroom.update_count
+        chatroom.delete_message(1000.0)
+        asyncio.run(chatroom.add_message_async("User", "new"))
+        self.assertEqual(len(chatroom.get_messages()), 2)
+        self.assertEqual(chatroom.update_count, count + 2)
+        with chatroom.batch_update():
+            chatroom.add_bot(BotData(name="Bot1", aiengine_id="google_gemini"))
+            chatroom.remove_bot("Bot1")
+        self.assertEqual(chatroom.update_count, count + 4)
+
+    def test_batch_update_notifies_once(self):
+        """Tests that changes inside batch_update() notify the manager only once."""
+        chatroom = Chatroom.from_dict(
+            {"name": "Batch Room", "bots": {}, "messages": [
+                {"sender": "User", "content": f"message {i}", "timestamp": 1000.0 + i} for i in range(3)
+            ]},
+            manager=self.mock_manager, filepath=None)
+
+        with chatroom.batch_update():
+            with chatroom.batch_update():
+                self.assertTrue(chatroom.delete_message(1000.0))
+            self.assertTrue(chatroom.delete_message(1001.0))
+            self.mock_manager.notify_chatroom_updated.assert_not_called()
+        self.mock_manager.notify_chatroom_updated.assert_called_once_with(chatroom)
+
+        # Nothing changed, so nothing to save
+        self.mock_manager.notify_chatroom_updated.reset_mock()
+        with chatroom.batch_update():
+            self.assertFalse(chatroom.delete_message(999.0))
+        self.mock_manager.notify_chatroom_updated.assert_not_called()
+
     @patch.object(logging.getLogger('src.main.chatroom.Chatroom'), 'warning')
     async def test_chatroom_save_load_cycle(self, mock_logger_warning):
         """Tests the Chatroom to_dict and from_dict methods (serialization/deserialization)."""
@@ -14,6 +14,8 @@ import os
 # This is a common pattern for test files located outside the main package
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
+from pydantic import ValidationError
+
 from src.main.message import MessageData
 
 class TestMessage(unittest.TestCase):
@@ -40,6 +42,35 @@ class TestMessage(unittest.TestCase):
         expected_str = f"[{datetime.datetime.fromtimestamp(fixed_timestamp).strftime('%Y-%m-%d %H:%M:%S')}] {sender}: {content}"
         self.assertEqual(msg.to_display_string(), expected_str)
         self.assertEqual(str(msg), expected_str) # Also test __str__
+        self.assertIs(msg.timestamp_string, msg.timestamp_string)
+
+    def test_display_string_is_cached(self):
+        """Tests that the display string is formatted once and does not leak into equality or dumps."""
+        msg = MessageData(sender="User4", content="Cached", timestamp=1000.0)
+        first = msg.display_string
+        self.assertIs(msg.to_display_string(), first)
+        self.assertEqual(msg, MessageData(sender="User4", content="Cached", timestamp=1000.0))
+        self.assertEqual(msg.model_dump(), {"sender": "User4", "content": "Cached", "timestamp": 1000.0})
+
+    def test_history_content(self):
+        """Tests the stripped and attributed content sent to AI engines."""
+        msg = MessageData(sender="User7", content="  Hello bot \n", timestamp=1000.0)
+        self.assertEqual(msg.stripped_content, "Hello bot")
+        self.assertEqual(msg.attributed_content, "User7 said:\nHello bot")
+        self.assertIs(msg.attributed_content, msg.attributed_content)
+
+    def test_sender_is_interned(self):
+        """Tests that messages from the same sender share one sender string."""
+        first = MessageData(sender="".join(["Bot", "A"]), content="1", timestamp=1000.0)
+        second = MessageData.model_validate_json('{"sender": "BotA", "content": "2", "timestamp": 1001.0}')
+        self.assertIs(first.sender, second.sender)
+
+    def test_message_is_immutable(self):
+        """Tests that a message cannot be changed after creation, so its cached display string stays valid."""
+        msg = MessageData(sender="User4", content="Frozen", timestamp=1000.0)
+        with self.assertRaises(ValidationError):
+            msg.content = "Changed"
+        self.assertEqual(msg.content, "Frozen")
 
     def test_message_to_dict(self):
         """Tests the serialization of a Message object to a dictionary."""
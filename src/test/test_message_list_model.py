@@ -0,0 +1,65 @@
+"""Unit tests for the MessageListModel class.
+
+This module tests that the model keeps messages ordered by timestamp,
+exposes display strings and messages through its roles, and supports
+incremental appends and removals of contiguous row runs.
+"""
+import unittest
+import sys
+import os
+
+# Adjusting sys.path to allow direct imports of modules in src.main
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from PyQt6.QtCore import Qt
+
+from src.main.message import MessageData
+from src.main.message_list_model import MessageListModel
+
+def _make_message(index: int) -> MessageData:
+    """Creates a message whose timestamp increases with `index`."""
+    return MessageData(sender="User", content=f"message {index}", timestamp=1000.0 + index)
+
+class TestMessageListModel(unittest.TestCase):
+    """Tests for the MessageListModel class."""
+    def setUp(self):
+        """Creates a model holding five messages."""
+        self.messages = [_make_message(i) for i in range(5)]
+        self.model = MessageListModel()
+        self.model.set_messages(self.messages)
+
+    def _contents(self) -> list[str]:
+        """Returns the content of every message in the model, in row order."""
+        return [self.model.message_at(row).content for row in range(self.model.rowCount())]
+
+    def test_set_messages_copies_list(self):
+        """Tests that the model keeps the given order but not the given list."""
+        self.messages.append(_make_message(5))
+        self.assertEqual(self._contents(), [f"message {i}" for i in range(5)])
+
+    def test_data_roles(self):
+        """Tests the display and user roles of a row."""
+        index = self.model.index(1)
+        self.assertIs(self.model.data(index, Qt.ItemDataRole.UserRole), self.messages[1])
+        self.assertEqual(self.model.data(index, Qt.ItemDataRole.DisplayRole),
+                         _make_message(1).to_display_string() + '\n')
+        self.assertIsNone(self.model.data(index, Qt.ItemDataRole.ToolTipRole))
+
+    def test_append_message(self):
+        """Tests that an appended message becomes the last row."""
+        self.model.append_message(_make_message(5))
+        self.assertEqual(self.model.rowCount(), 6)
+        self.assertEqual(self.model.message_at(5).content, "message 5")
+
+    def test_remove_rows_in_multiple_runs(self):
+        """Tests removing non-contiguous rows, including duplicates."""
+        self.model.remove_rows([4, 0, 1, 3, 1])
+        self.assertEqual(self._contents(), ["message 2"])
+
+    def test_clear(self):
+        """Tests that clearing leaves an empty model."""
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Unit tests for the master password dialogs.
+
+This module tests keyboard handling in the password dialogs: Enter in a
+password field moves to the next field or submits the dialog once, while
+Enter on a focused button still triggers that button.
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Adjusting sys.path to allow direct imports of modules in src.main
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from PyQt6.QtWidgets import QApplication, QDialog
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+
+from src.main.password_dialogs import CreateMasterPasswordDialog, EnterMasterPasswordDialog
+
+
+app = None
+
+def setUpModule():
+    global app
+    app = QApplication.instance()
+    if app is None:
+        if not os.environ.get("QT_QPA_PLATFORM"):
+            os.environ["QT_QPA_PLATFORM"] = "offscreen" # Use offscreen for CI
+        app = QApplication(sys.argv)
+
+
+class TestPasswordDialogs(unittest.TestCase):
+    """Tests for Enter key handling in the password dialogs."""
+
+    def test_return_moves_focus_then_accepts_once(self):
+        """Tests that Enter focuses the next field and, in the last field, accepts exactly once."""
+        with patch.object(CreateMasterPasswordDialog, 'accept', autospec=True) as mock_accept:
+            dialog = CreateMasterPasswordDialog()
+            dialog.show()
+            QTest.qWaitForWindowActive(dialog)
+            dialog.password_input.setFocus()
+            QTest.keyClicks(dialog.password_input, "secret")
+            QTest.keyClick(dialog.password_input, Qt.Key.Key_Return)
+            mock_accept.assert_not_called()
+            self.assertTrue(dialog.confirm_password_input.hasFocus())
+
+            QTest.keyClicks(dialog.confirm_password_input, "secret")
+            QTest.keyClick(dialog.confirm_password_input, Qt.Key.Key_Return)
+            mock_accept.assert_called_once_with(dialog)
+            dialog.close()
+
+    def test_return_on_focused_cancel_rejects(self):
+        """Tests that Enter on a focused Cancel button still rejects the dialog."""
+        dialog = EnterMasterPasswordDialog()
+        dialog.show()
+        QTest.qWaitForWindowActive(dialog)
+        dialog.cancel_button.setFocus()
+        QTest.keyClick(dialog.cancel_button, Qt.Key.Key_Return)
+        self.assertFalse(dialog.isVisible())
+        self.assertEqual(dialog.result(), QDialog.DialogCode.Rejected)
+
+
+if __name__ == '__main__':
+    unittest.main()
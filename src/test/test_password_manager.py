@@ -1,12 +1,15 @@
 import unittest
+from unittest import mock
 import os
 import json
+import subprocess
+import sys
 # hmac is used by PasswordManager internally, not directly needed for these tests usually
 # from hashlib import hmac
 
 # Adjust import path based on how tests are run.
 # If run from root with `python -m unittest discover src/test`:
-from src.main.password_manager import PasswordManager
+from src.main.password_manager import KDF_PBKDF2_SHA256, KDF_SCRYPT, PasswordManager
 
 # Use a unique data directory for this test class
 TEST_DATA_DIR_PWD_MGR = "test_data_pwd_mgr"
@@ -62,6 +65,14 @@ class TestPasswordManager(unittest.TestCase):
         self.assertFalse(self.pm.verify_master_password("wrongpass"), "Verification with incorrect password should fail.")
         self.assertTrue(os.path.exists(TEST_MASTER_KEY_FILE), "Master key file should exist after setting password.")
 
+    def test_master_key_file_is_private(self):
+        self.pm.set_master_password("testpass")
+        self.pm.set_master_password("otherpass")
+        self.assertFalse(os.path.exists(TEST_MASTER_KEY_FILE + '.tmp'), "The temporary file should be replaced.")
+        if os.name == 'posix':
+            self.assertEqual(os.stat(TEST_MASTER_KEY_FILE).st_mode & 0o777, 0o600)
+        self.assertTrue(PasswordManager(TEST_MASTER_KEY_FILE).verify_master_password("otherpass"))
+
     def test_set_empty_password(self):
         with self.assertRaisesRegex(ValueError, "Password cannot be empty."):
             self.pm.set_master_password("")
@@ -99,12 +110,61 @@ class TestPasswordManager(unittest.TestCase):
         self.assertTrue(pm2.verify_master_password("persistpass"), "New instance should verify persisted password.")
         self.assertFalse(pm2.verify_master_password("wrongpass"), "New instance should fail verification with wrong password.")
 
+    def test_legacy_pbkdf2_file(self):
+        salt = os.urandom(16)
+        self.pm.kdf = KDF_PBKDF2_SHA256
+        hashed_password = self.pm._hash_password("legacypass", salt)
+        with open(TEST_MASTER_KEY_FILE, 'w') as f:
+            json.dump({'hashed_password': hashed_password.hex(), 'salt': salt.hex()}, f)
+
+        pm2 = PasswordManager(TEST_MASTER_KEY_FILE)
+        self.assertEqual(pm2.kdf, KDF_PBKDF2_SHA256, "Files without a kdf entry should use PBKDF2.")
+        self.assertTrue(pm2.verify_master_password("legacypass"))
+        self.assertTrue(pm2.change_master_password("legacypass", "newpass"))
+        with open(TEST_MASTER_KEY_FILE, 'r') as f:
+            self.assertEqual(json.load(f)['kdf'], KDF_SCRYPT, "Changed passwords should be stored with scrypt.")
+        self.assertTrue(PasswordManager(TEST_MASTER_KEY_FILE).verify_master_password("newpass"))
+
+    def test_verify_reuses_derived_key(self):
+        self.pm.set_master_password("testpass")
+        with mock.patch.object(self.pm, '_hash_password', wraps=self.pm._hash_password) as hash_password:
+            self.assertTrue(self.pm.verify_master_password("testpass"))
+            self.assertTrue(self.pm.verify_master_password("testpass"))
+            self.assertEqual(hash_password.call_count, 1, "Repeated verification should reuse the derived key.")
+            self.assertFalse(self.pm.verify_master_password("wrongpass"))
+            self.assertTrue(self.pm.verify_master_password("testpass"))
+            self.assertEqual(hash_password.call_count, 3)
+        self.pm.set_master_password("newpass")
+        self.assertFalse(self.pm.verify_master_password("testpass"), "The cache must not survive a password change.")
+        self.assertTrue(self.pm.verify_master_password("newpass"))
+
+    def test_verify_rate_limit(self):
+        self.pm.set_master_password("testpass")
+        with mock.patch('src.main.password_manager.time.monotonic', return_value=1000.0), \
+                mock.patch('src.main.password_manager.time.sleep') as sleep:
+            self.pm._verify_bucket = (1000.0, 5.0)
+            for i in range(5):
+                self.assertFalse(self.pm.verify_master_password(f"wrongpass{i}"))
+                self.assertFalse(self.pm.verify_rate_limited)
+            self.assertFalse(self.pm.verify_master_password("testpass"), "Attempts over the limit should fail.")
+            self.assertTrue(self.pm.verify_rate_limited)
+            sleep.assert_not_called()
+        with mock.patch('src.main.password_manager.time.monotonic', return_value=1001.0):
+            self.assertTrue(self.pm.verify_master_password("testpass"), "A token should be refilled after a second.")
+            self.assertFalse(self.pm.verify_rate_limited)
+        self.assertTrue(self.pm.verify_master_password("testpass"), "Cached verifications should not be rate limited.")
+
     def test_verify_password_when_none_set(self):
         self.assertFalse(self.pm.verify_master_password("anypass"), "Verification should fail if no password is set.")
 
     def test_change_password_when_none_set(self):
          self.assertFalse(self.pm.change_master_password("anypass", "newpass"), "Changing password should fail if none is set.")
 
+    def test_import_does_not_load_qt(self):
+        code = "import sys; import src.main.password_manager; sys.exit('PyQt6' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+        self.assertEqual(result.returncode, 0, "Importing PasswordManager should not load PyQt6.")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,71 @@
+"""Unit tests for the third-party provider package.
+
+This module checks that importing the provider registry stays cheap: the
+provider SDKs must only be imported when a provider is actually used.
+"""
+import unittest
+import subprocess
+import sys
+import os
+
+# Adjusting sys.path for direct imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.main import third_parties, third_party
+
+
+class TestThirdParties(unittest.TestCase):
+    """Tests for the `third_parties` package."""
+
+    def test_third_party_classes(self):
+        """Tests that every provider class is registered once."""
+        names = [cls.__name__ for cls in third_parties.THIRD_PARTY_CLASSES]
+        self.assertEqual(names, ["XAI", "AzureOpenAI", "Google"])
+
+    def test_get_aiengine_arg_info(self):
+        """Tests looking up engine arguments by ID."""
+        for cls in third_parties.THIRD_PARTY_CLASSES:
+            for aiengine_info in cls().get_aiengine_info_list():
+                for arg_info in aiengine_info.arg_list:
+                    self.assertIs(aiengine_info.get_aiengine_arg_info(arg_info.arg_id), arg_info)
+                self.assertIsNone(aiengine_info.get_aiengine_arg_info("no_such_arg"))
+
+    def test_arg_type_str(self):
+        """Tests that argument types convert to their values."""
+        for arg_type in third_party.AIEngineArgType:
+            self.assertEqual(str(arg_type), arg_type.value)
+            self.assertEqual(f"{arg_type}", arg_type.value)
+
+    def test_engine_info_is_frozen(self):
+        """Tests that engine info freezes the lists it is given."""
+        arg_list = [third_party.AIEngineArgInfo("mode", "Mode", True, value_option_list=["a", "b"])]
+        aiengine_info = third_party.AIEngineInfo("engine", "Engine", ["slot"], arg_list)
+        arg_list.clear()
+        self.assertEqual(aiengine_info.thirdpartyapikey_slot_id_list, ("slot",))
+        self.assertEqual(aiengine_info.thirdpartyapikey_slot_id_set, frozenset({"slot"}))
+        self.assertEqual(len(aiengine_info.arg_list), 1)
+        self.assertEqual(aiengine_info.arg_list[0].value_option_list, ("a", "b"))
+
+    def test_group_shares_engine_info(self):
+        """Tests that the group builds each provider's engine list only once."""
+        group = third_party.ThirdPartyGroup(third_parties.THIRD_PARTY_CLASSES)
+        for aiengine_info in group.aiengine_info_list:
+            self.assertIs(group.aiengine_id_to_aiengine_info_dict[aiengine_info.aiengine_id], aiengine_info)
+
+    def test_group_rejects_duplicate_engine_ids(self):
+        """Tests that two providers cannot register the same engine ID."""
+        duplicate_classes = [third_parties.THIRD_PARTY_CLASSES[0]] * 2
+        with self.assertRaisesRegex(ValueError, "Duplicate AI engine IDs"):
+            third_party.ThirdPartyGroup(duplicate_classes)
+
+    def test_import_does_not_load_sdks(self):
+        """Tests that importing the registry does not import any provider SDK."""
+        code = ("import sys; import src.main.third_parties; "
+                "sys.exit(any(m in sys.modules for m in ('openai', 'google.genai')))")
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, check=False)
+        self.assertEqual(result.returncode, 0, "Provider SDKs should be imported lazily.")
+
+
+if __name__ == '__main__':
+    unittest.main()